@@ -0,0 +1,75 @@
+"""
+Benchmark of batches of a fixed number of examples and batches packed up to a number of tokens for generated
+train part: share of padding tokens, spread of number of tokens of batches and time of training steps of a small
+model. The default budget of tokens is the mean number of tokens of batches of fixed size.
+
+Run from the ``NLPer`` directory::
+
+    python -m benchmarks.benchmark_batching --rows 10000 --steps 30
+"""
+import click
+import numpy as np
+import time
+import torch
+
+from torch import nn
+from torch import optim
+
+from benchmarks.benchmark_file_formats import generate_trimmed_data
+from nlper.model.architecture import DecoderRNN
+from nlper.model.architecture import EncoderRNN
+from nlper.model.architecture import Seq2Seq
+from nlper.trainer.batch_iterator import BatchIterator
+from nlper.trainer.batch_iterator import TokenBudgetBatchIterator
+from nlper.trainer.data_loader import DataLoader
+
+
+def measure_steps(iterator: BatchIterator, vocab_size: int, padding_index: int, steps: int) -> np.ndarray:
+    torch.manual_seed(0)
+    seq2seq = Seq2Seq(
+        encoder=EncoderRNN(input_size=vocab_size, embedding_size=32, hidden_size=32, n_layers=2),
+        decoder=DecoderRNN(embedding_size=32, hidden_size=32, output_size=vocab_size, n_layers=1),
+    )
+    optimizer = optim.Adam(seq2seq.parameters())
+    criterion = nn.CrossEntropyLoss(ignore_index=padding_index)
+    times = []
+    for batch, _ in zip(iterator, range(steps)):
+        start = time.perf_counter()
+        text, summary = batch.text[0], batch.summary[0]
+        optimizer.zero_grad()
+        output = seq2seq(text, summary)
+        loss = criterion(output[1:].view(-1, output.shape[2]), summary[1:].contiguous().view(-1))
+        loss.backward()
+        optimizer.step()
+        times.append(time.perf_counter() - start)
+    return np.array(times)
+
+
+@click.command()
+@click.option('--rows', default=10000, show_default=True, help='Number of rows of generated train part')
+@click.option('--batch-size', default=16, show_default=True, help='Number of examples of fixed batches')
+@click.option('--max-tokens', default=None, type=int, help='Number of tokens of packed batches')
+@click.option('--min-frequency', default=85, show_default=True, help='Minimum frequency of words in vocabulary')
+@click.option('--steps', default=30, show_default=True, help='Number of measured training steps')
+def main(rows: int, batch_size: int, max_tokens: int, min_frequency: int, steps: int):
+    data = generate_trimmed_data(rows)[['text', 'summary']]
+    config = {'min_frequency_of_words_in_vocab': min_frequency, 'dataframes_field_names': ['text', 'summary']}
+    datasets, vocab = DataLoader(config=config).build_datasets({'train': data, 'val': data[:0], 'test': data[:0]})
+    fixed = BatchIterator(datasets['train'], vocab=vocab, batch_size=batch_size, shuffle=True)
+    if max_tokens is None:
+        _, padded_tokens = fixed.measure_padding(fixed.create_batches())
+        max_tokens = int(padded_tokens.mean())
+    budget = TokenBudgetBatchIterator(datasets['train'], vocab=vocab, max_tokens=max_tokens, shuffle=True)
+    click.echo(f'{rows} examples | vocabulary {len(vocab)} | {max_tokens} tokens per packed batch')
+    for name, iterator in ((f'{batch_size} examples', fixed), (f'{max_tokens} tokens', budget)):
+        np.random.seed(0)
+        padding, padded_tokens = iterator.measure_padding(iterator.create_batches())
+        np.random.seed(0)
+        times = measure_steps(iterator, len(vocab), vocab.padding_index, steps)
+        click.echo(f'{name:13} | {len(padded_tokens):5} batches | padding {padding:6.1%} | '
+                   f'tokens per batch {padded_tokens.mean():5.0f} +- {padded_tokens.std():4.0f} '
+                   f'(max {padded_tokens.max()}) | step {times.mean():.3f} +- {times.std():.3f} s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Micro-benchmark of text cleaning engine against the previous per-call regex chain and BeautifulSoup parsing.
+
+Run from the ``NLPer`` directory::
+
+    python -m benchmarks.benchmark_clean_utils --repeat 20
+"""
+import click
+import pandas as pd
+import re
+import timeit
+
+from bs4 import BeautifulSoup
+
+from nlper.dataframe_cleaner.reducer import Reducer
+from nlper.file_io.dataframe_reader import FileReader
+from nlper.utils.clean_utils import CleanUtils
+
+
+SAMPLE_PATH = 'tests/assets/data_files/'
+SAMPLE_CONFIG = {
+    'columns_to_skip': ['url'],
+    'columns_to_merge_as_text': ['text', 'text_list', 'text_main_points'],
+    'columns_to_merge_as_summary': ['title', 'lead'],
+}
+
+
+def legacy_hide_numbers(text: str, number_replacement: str = '<num>') -> str:
+    text = re.sub(
+        r"([0-9]+[.|,|;|:|/|\-|\\|MDCLXVI0-9]+)+|([0-9]+?)", " " + number_replacement + " ", str(text))
+    return re.sub("\\s+", " ", str(text))
+
+
+def legacy_remove_non_text_characters(text: str) -> str:
+    text = re.sub("([\t\r\n])", ' ', str(text))
+    text = re.sub("({.*\\})|(\\[.*\\])", '', str(text))
+    text = re.sub("(__+|-+|~+|\\++|\\.\\.+|\\:+|\\/)", ' ', str(text))
+    text = re.sub("\\s+", ' ', str(text))
+    text = re.sub(
+        r"[<>()|&©ø,;~*\[\]\'\"\`\\\"\„\”\“\‟\‶\‚\’\‘\‛\⁏\;\-\—\―\–\⁋\‰\\\%\^\&\*\$\#\@\!]", '', str(text))
+    text = re.sub(r"[?!]", '.', str(text))
+    return text
+
+
+def legacy_remove_html_elements(text: str) -> str:
+    return BeautifulSoup(text, features="html.parser").get_text(strip=True)
+
+
+def load_sample(multiply: int) -> pd.Series:
+    """
+    Loads reduced article texts and summaries from test data files as a single column.
+    """
+    data = FileReader(path=SAMPLE_PATH).read_json_lines_files()
+    columns = []
+    for dataframe in data.values():
+        reduced = Reducer(config=SAMPLE_CONFIG, data=dataframe).reduce_dataframe()
+        for column_name in reduced:
+            columns.append(reduced[column_name].map(CleanUtils.convert_list_to_text))
+    return pd.concat(columns * multiply, ignore_index=True)
+
+
+@click.command()
+@click.option('--repeat', default=10, show_default=True, help='Number of timed runs')
+@click.option('--multiply', default=3, show_default=True, help='Number of sample copies in column')
+def main(repeat: int, multiply: int):
+    column = load_sample(multiply)
+    texts = column.tolist()
+
+    assert [CleanUtils.remove_non_text_characters(text) for text in texts] == \
+        [legacy_remove_non_text_characters(text) for text in texts]
+    assert CleanUtils.remove_non_text_characters_for_series(column).tolist() == \
+        [legacy_remove_non_text_characters(text) for text in texts]
+    assert [CleanUtils.remove_hmtl_elements(text) for text in texts] == \
+        [legacy_remove_html_elements(text) for text in texts]
+    assert CleanUtils.hide_numbers_for_series(column).tolist() == [legacy_hide_numbers(text) for text in texts]
+
+    cases = {
+        'remove_hmtl_elements legacy': lambda: [legacy_remove_html_elements(text) for text in texts],
+        'remove_hmtl_elements fast path': lambda: [CleanUtils.remove_hmtl_elements(text) for text in texts],
+        'remove_non_text_characters legacy': lambda: [legacy_remove_non_text_characters(text) for text in texts],
+        'remove_non_text_characters compiled': lambda: [CleanUtils.remove_non_text_characters(text) for text in texts],
+        'remove_non_text_characters series': lambda: CleanUtils.remove_non_text_characters_for_series(column),
+        'hide_numbers legacy': lambda: [legacy_hide_numbers(text) for text in texts],
+        'hide_numbers compiled': lambda: [CleanUtils.hide_numbers(text) for text in texts],
+        'hide_numbers series': lambda: CleanUtils.hide_numbers_for_series(column),
+    }
+    characters = sum(map(len, texts))
+    click.echo(f'{len(texts)} texts | {characters / 1e6:.2f}M characters | best of {repeat}')
+    for name, function in cases.items():
+        best = min(timeit.repeat(function, number=1, repeat=repeat))
+        click.echo(f'{name:40} {best * 1000:9.1f} ms | {characters / best / 1e6:7.1f}M chars/s')
+
+
+if __name__ == '__main__':
+    main()
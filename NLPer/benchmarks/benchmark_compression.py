@@ -0,0 +1,48 @@
+"""
+Benchmark of write and read throughput and compression ratio of cleaned data saved as compressed CSV files,
+for levels of every compression. Throughput is measured in megabytes of not compressed CSV per second.
+
+Run from the ``NLPer`` directory::
+
+    python -m benchmarks.benchmark_compression --rows 50000
+"""
+import click
+import importlib.util
+import os
+import tempfile
+import time
+
+from benchmarks.benchmark_file_formats import generate_trimmed_data
+from nlper.file_io.dataframe_writer import FileWriter
+from nlper.file_io.file_type_resolver import FileTypesResolver
+
+
+LEVELS = {None: (None,), 'gzip': (1, 6, 9), 'bz2': (1, 9), 'xz': (0, 3, 6), 'zstd': (1, 3, 9, 19)}
+
+
+@click.command()
+@click.option('--rows', default=50000, show_default=True, help='Number of rows in generated cleaned data')
+def main(rows: int):
+    data = generate_trimmed_data(rows)
+    with tempfile.TemporaryDirectory() as directory:
+        size = None
+        for compression, levels in LEVELS.items():
+            if compression == 'zstd' and importlib.util.find_spec('zstandard') is None:
+                click.echo('zstd skipped, zstandard is not installed')
+                continue
+            for level in levels:
+                file_writer = FileWriter(
+                    directory, output_type='csv', output_compression=compression, compression_level=level)
+                start = time.perf_counter()
+                path = file_writer.save_file(data=data, name=f'cleaned_{level}')
+                write_time = time.perf_counter() - start
+                start = time.perf_counter()
+                FileTypesResolver.resolve_from_filepath(path).open_file(filepath=path)
+                read_time = time.perf_counter() - start
+                size = size or os.path.getsize(path) / 2 ** 20
+                click.echo(f'{str(compression):5} level {str(level):4} | write {size / write_time:7.1f} MB/s | '
+                           f'read {size / read_time:7.1f} MB/s | ratio {size * 2 ** 20 / os.path.getsize(path):5.2f}')
+
+
+if __name__ == '__main__':
+    main()
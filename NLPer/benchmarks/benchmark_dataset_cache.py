@@ -0,0 +1,45 @@
+"""
+Benchmark of time to the first training batch of the trainer data loader for generated train, valid and test parts,
+without the dataset cache, while building the cache and with cached datasets.
+
+Run from the ``NLPer`` directory::
+
+    python -m benchmarks.benchmark_dataset_cache --rows 100000
+"""
+import click
+import os
+import tempfile
+import time
+
+from benchmarks.benchmark_file_formats import generate_trimmed_data
+from nlper.trainer.data_loader import DataLoader
+
+
+def measure_first_batch(config: dict) -> float:
+    start = time.perf_counter()
+    iterators, _ = DataLoader(config=dict(config)).load()
+    next(iter(iterators[0]))
+    return time.perf_counter() - start
+
+
+@click.command()
+@click.option('--rows', default=100000, show_default=True, help='Number of rows of generated train part')
+def main(rows: int):
+    with tempfile.TemporaryDirectory() as directory:
+        for split, split_rows in (('train', rows), ('val', rows // 8), ('test', rows // 8)):
+            generate_trimmed_data(split_rows)[['text', 'summary']].to_csv(
+                os.path.join(directory, f'{split}.csv'), index=False)
+        config = {
+            'train_test_val_dir': directory,
+            'min_frequency_of_words_in_vocab': 10,
+            'dataframes_field_names': ['text', 'summary'],
+            'batch_size': 16,
+        }
+        click.echo(f'without cache  | {measure_first_batch(config):7.2f} s')
+        config['dataset_cache_path'] = os.path.join(directory, 'cache')
+        click.echo(f'building cache | {measure_first_batch(config):7.2f} s')
+        click.echo(f'cached         | {measure_first_batch(config):7.2f} s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark of near-duplicate detection with MinHash and LSH banding.
+Generates random articles and near-duplicates of some of them with a given rate of changed words,
+reports throughput, detected near-duplicates, false positives and memory of band hashes per article.
+
+Run from the ``NLPer`` directory::
+
+    python -m benchmarks.benchmark_deduplicator --articles 20000 --duplicates 0.1
+"""
+import click
+import numpy as np
+import time
+
+from nlper.dataframe_cleaner.deduplicator import Deduplicator
+
+
+def generate_articles(articles: int, words: int, vocabulary: int, random: np.random.RandomState):
+    return [' '.join(f'w{word}' for word in random.randint(0, vocabulary, size=words)) for _ in range(articles)]
+
+
+def change_words(text: str, rate: float, vocabulary: int, random: np.random.RandomState) -> str:
+    words = text.split()
+    for index in np.flatnonzero(random.rand(len(words)) < rate):
+        words[index] = f'w{random.randint(vocabulary)}'
+    return ' '.join(words)
+
+
+@click.command()
+@click.option('--articles', default=20000, show_default=True, help='Number of original articles')
+@click.option('--words', default=300, show_default=True, help='Number of words in article')
+@click.option('--vocabulary', default=20000, show_default=True, help='Number of distinct words')
+@click.option('--duplicates', default=0.1, show_default=True, help='Rate of articles with near-duplicates')
+@click.option('--bands', default=16, show_default=True, help='Number of LSH bands')
+@click.option('--rows', default=8, show_default=True, help='Number of minimum hashes in band')
+def main(articles: int, words: int, vocabulary: int, duplicates: float, bands: int, rows: int):
+    random = np.random.RandomState(0)
+    originals = generate_articles(articles, words, vocabulary, random)
+    copied = random.choice(articles, size=int(articles * duplicates), replace=False)
+    for rate in (0.01, 0.03, 0.1, 0.3, 0.5):
+        deduplicator = Deduplicator(bands=bands, rows=rows)
+        texts = originals + [change_words(originals[index], rate, vocabulary, random) for index in copied]
+        start = time.perf_counter()
+        found = deduplicator.find_duplicates(texts)
+        elapsed = time.perf_counter() - start
+        memory = sum(seen.nbytes for seen in deduplicator.seen_bands) / len(texts)
+        click.echo(f'changed words {rate:4.0%} | {len(texts) / elapsed:8.0f} articles/s | '
+                   f'detected {found[articles:].mean():6.1%} | false positives {int(found[:articles].sum()):4d} | '
+                   f'{memory:5.0f} B/article')
+
+
+if __name__ == '__main__':
+    main()
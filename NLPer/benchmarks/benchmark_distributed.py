@@ -0,0 +1,94 @@
+"""
+Benchmark of training throughput in tokens per second of a small model on generated train part, with distributed
+data-parallel training over ``gloo`` backend in growing numbers of processes on this machine.
+
+Run from the ``NLPer`` directory::
+
+    python -m benchmarks.benchmark_distributed --rows 10000 --nproc 1 --nproc 2 --steps 30
+"""
+import click
+import os
+import tempfile
+import time
+import torch
+
+from typing import Tuple
+
+from benchmarks.benchmark_file_formats import generate_trimmed_data
+from nlper.model.model import Model
+from nlper.trainer.data_loader import DataLoader
+from nlper.trainer.distributed import launch
+from nlper.utils.lang_utils import VocabConfig
+from nlper.utils.torch_utils import get_rank
+from nlper.utils.torch_utils import get_world_size
+
+
+def train_steps(config: dict, steps: int, directory: str) -> None:
+    iterators, vocab = DataLoader(config=config).load()
+    vocab_config = VocabConfig()
+    vocab_config.set_vocab(vocab)
+    model = Model(config=dict(config, text_size=len(vocab)), vocab_config=vocab_config)
+    model.create_optimizers_and_loss()
+    seq2seq = model.get_training_model()
+    seq2seq.train()
+    tokens = 0
+    start = None
+    for step, batch in zip(range(steps + 1), iterators[0]):
+        # the first step builds the distributed wrapper buckets and is not measured
+        if step == 1:
+            start = time.perf_counter()
+        text, summary = model.get_text_summary_from_batch(batch)
+        model.optimizer.zero_grad()
+        output = seq2seq(text, summary)
+        loss = model.criterion(output[1:].view(-1, len(vocab)), summary[1:].contiguous().view(-1))
+        loss.backward()
+        model.optimizer.step()
+        if step > 0:
+            tokens += text.numel() + summary.numel()
+    elapsed = time.perf_counter() - start
+    torch.save((tokens, elapsed), os.path.join(directory, f'{get_rank()}_of_{get_world_size()}.pt'))
+
+
+def measure(config: dict, steps: int, nproc: int, directory: str) -> Tuple[int, float]:
+    if nproc == 1:
+        train_steps(config, steps, directory)
+    else:
+        launch(train_steps, args=(config, steps, directory), nproc=nproc)
+    results = [torch.load(os.path.join(directory, f'{rank}_of_{nproc}.pt')) for rank in range(nproc)]
+    return sum(tokens for tokens, _ in results), max(elapsed for _, elapsed in results)
+
+
+@click.command()
+@click.option('--rows', default=10000, show_default=True, help='Number of rows of generated train part')
+@click.option('--nproc', default=[1, 2], show_default=True, multiple=True, help='Numbers of processes')
+@click.option('--batch-size', default=16, show_default=True, help='Number of examples of batches of a process')
+@click.option('--min-frequency', default=85, show_default=True, help='Minimum frequency of words in vocabulary')
+@click.option('--steps', default=30, show_default=True, help='Number of measured training steps of a process')
+def main(rows: int, nproc: Tuple[int], batch_size: int, min_frequency: int, steps: int):
+    with tempfile.TemporaryDirectory() as directory:
+        data = generate_trimmed_data(rows)[['text', 'summary']]
+        data.to_csv(os.path.join(directory, 'train.csv'), index=False)
+        for split in ('val', 'test'):
+            data[:100].to_csv(os.path.join(directory, f'{split}.csv'), index=False)
+        config = {
+            'train_test_val_dir': directory,
+            'min_frequency_of_words_in_vocab': min_frequency,
+            'dataframes_field_names': ['text', 'summary'],
+            'batch_size': batch_size,
+            'embed_size': 32,
+            'hidden_size': 32,
+            'learning_rate': 0.001,
+            'scheduler_step_size': 100,
+            'scheduler_gamma': 0.5,
+        }
+        click.echo(f'{rows} examples | {os.cpu_count()} cores | {steps} steps of {batch_size} examples per process')
+        baseline = None
+        for processes in nproc:
+            tokens, elapsed = measure(config, steps, processes, directory)
+            throughput = tokens / elapsed
+            baseline = baseline or throughput
+            click.echo(f'{processes:2} processes | {throughput:8.0f} tokens/s | speedup {throughput / baseline:4.2f}')
+
+
+if __name__ == '__main__':
+    main()
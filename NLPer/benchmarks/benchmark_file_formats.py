@@ -0,0 +1,71 @@
+"""
+Benchmark of write time, read time and size of trimmed data saved as CSV, Pickle and Parquet files.
+Reads are measured for all columns and for the ``text`` and ``summary`` columns used by train test splitter.
+
+Run from the ``NLPer`` directory::
+
+    python -m benchmarks.benchmark_file_formats --rows 100000
+"""
+import click
+import numpy as np
+import os
+import pandas as pd
+import tempfile
+import time
+
+from nlper.file_io.dataframe_writer import FileWriter
+from nlper.file_io.file_type_resolver import FileTypesResolver
+from nlper.utils.train_test_splitter import TRAIN_TEXT_COLUMNS
+
+
+FORMATS = (('csv', None), ('pickle', None), ('parquet', 'snappy'), ('parquet', 'zstd'), ('parquet', 'gzip'))
+
+
+def generate_trimmed_data(rows: int) -> pd.DataFrame:
+    """
+    Generates data frame with columns of trimmed data, texts have from 40 to 400 words.
+    """
+    random = np.random.RandomState(0)
+    vocabulary = np.array([f'słowo{i}' for i in range(30000)] + ['<num>'] * 500)
+
+    def generate_texts(lower: int, upper: int):
+        return [' '.join(random.choice(vocabulary, size=random.randint(lower, upper))) for _ in range(rows)]
+
+    return pd.DataFrame({
+        'text': generate_texts(40, 400),
+        'summary': generate_texts(10, 100),
+        'site': random.choice(['bbc', 'cnn', 'onet', 'wp'], size=rows),
+    })
+
+
+def measure(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def read_file(path: str, columns=None):
+    if path.endswith('.pkl'):
+        dataframe = pd.read_pickle(path)
+        return dataframe if columns is None else dataframe[list(columns)]
+    return FileTypesResolver.resolve_from_filepath(path).open_file(filepath=path, columns=columns)
+
+
+@click.command()
+@click.option('--rows', default=100000, show_default=True, help='Number of rows in generated trimmed data')
+def main(rows: int):
+    data = generate_trimmed_data(rows)
+    with tempfile.TemporaryDirectory() as directory:
+        for output_type, compression in FORMATS:
+            file_writer = FileWriter(directory, output_type=output_type, compression=compression)
+            write_time = measure(lambda: file_writer.save_file(data=data, name=f'trimmed_{compression}'))
+            path = file_writer.saving_path
+            read_time = measure(lambda: read_file(path))
+            projected_read_time = measure(lambda: read_file(path, columns=TRAIN_TEXT_COLUMNS))
+            click.echo(f'{output_type:7} {str(compression or ""):6} | write {write_time:6.2f} s | '
+                       f'read {read_time:6.2f} s | read text and summary {projected_read_time:6.2f} s | '
+                       f'{os.path.getsize(path) / 2 ** 20:7.1f} MB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark of reading json lines raw data files with serial and parallel reading, with and without
+projection of columns, using ``json`` and ``orjson`` parsers.
+
+Run from the ``NLPer`` directory::
+
+    python -m benchmarks.benchmark_ingestion --sites 20 --rows 5000
+"""
+import click
+import json
+import os
+import tempfile
+import time
+
+from nlper.dataframe_cleaner.reducer import Reducer
+from nlper.file_io import dataframe_reader
+from nlper.file_io.dataframe_reader import FileReader
+
+
+CONFIG = {
+    'columns_to_skip': ['url'],
+    'columns_to_merge_as_text': ['text', 'text_list', 'text_main_points'],
+    'columns_to_merge_as_summary': ['title', 'lead'],
+}
+
+
+def generate_site_files(directory: str, sites: int, rows: int) -> None:
+    """
+    Generates json lines files with scraped articles of sites.
+    """
+    for site in range(sites):
+        with open(os.path.join(directory, f'site{site}.jsonl'), 'w', encoding='utf-8') as site_file:
+            for i in range(rows):
+                site_file.write(json.dumps({
+                    'url': f'https://site{site}.example.com/artykul/{i}',
+                    'title': f'Tytuł artykułu numer {i}',
+                    'lead': f'Wstęp artykułu numer {i} z dnia 01.01.2020.',
+                    'text': [f'Akapit {j} artykułu numer {i}, który zawiera trochę tekstu.' for j in range(10)],
+                    'text_list': [],
+                    'text_main_points': [],
+                    'tags': [f'tag{j}' for j in range(10)],
+                    'html': '<div>' + 'Surowy kod strony. ' * 100 + '</div>',
+                }, ensure_ascii=False) + '\n')
+
+
+@click.command()
+@click.option('--sites', default=20, show_default=True, help='Number of generated site files')
+@click.option('--rows', default=5000, show_default=True, help='Number of articles in every site file')
+def main(sites: int, rows: int):
+    parsers = [('json', json.loads)]
+    if dataframe_reader.json_loads is not json.loads:
+        parsers.append(('orjson', dataframe_reader.json_loads))
+    with tempfile.TemporaryDirectory() as directory:
+        generate_site_files(directory, sites, rows)
+        for parser_name, parser in parsers:
+            dataframe_reader.json_loads = parser
+            for columns in (None, Reducer.get_columns_to_read(CONFIG)):
+                for n_workers in (1, None):
+                    file_reader = FileReader(path=directory + '/', columns=columns, n_workers=n_workers)
+                    start = time.perf_counter()
+                    file_reader.read_json_lines_files()
+                    click.echo(f'{parser_name:6} | columns {"selected" if columns else "all":8} | '
+                               f'workers {n_workers or "auto":4} | {time.perf_counter() - start:6.2f} s')
+
+
+if __name__ == '__main__':
+    main()
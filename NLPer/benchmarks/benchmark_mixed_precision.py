@@ -0,0 +1,88 @@
+"""
+Benchmark of training speed, peak memory and validation loss of ``Model.train`` on generated train part, in float32
+and under bfloat16 autocast.
+
+Run from the ``NLPer`` directory::
+
+    python -m benchmarks.benchmark_mixed_precision --rows 10000 --steps 200
+"""
+import click
+import itertools
+import logging
+import multiprocessing
+import numpy as np
+import os
+import tempfile
+import time
+import torch
+
+from typing import Tuple
+
+from benchmarks.benchmark_file_formats import generate_trimmed_data
+from benchmarks.benchmark_splitter import get_peak_memory
+from nlper.model.model import Model
+from nlper.trainer.data_loader import DataLoader
+from nlper.utils.lang_utils import VocabConfig
+
+
+def train(config: dict, steps: int, result: multiprocessing.Queue) -> None:
+    logging.disable(logging.INFO)
+    iterators, vocab = DataLoader(config=config).load()
+    torch.manual_seed(0)
+    np.random.seed(0)
+    model = Model(config=dict(config, text_size=len(vocab)), vocab_config=VocabConfig(vocab.stoi, vocab.itos))
+    model.create_optimizers_and_loss()
+    # rouge and attention matrix of the first batch are not part of training steps
+    model.show_rouge_and_attention_matrix = lambda *args: None
+    start = time.perf_counter()
+    model.train(itertools.islice(iterators[0], steps))
+    elapsed = time.perf_counter() - start
+    valid_loss = float(torch.stack(model.evaluate(iterators[1])).mean())
+    result.put((steps / elapsed, get_peak_memory(), valid_loss))
+
+
+def measure(config: dict, steps: int) -> Tuple[float, float, float]:
+    context = multiprocessing.get_context('spawn')
+    result = context.Queue()
+    process = context.Process(target=train, args=(config, steps, result))
+    process.start()
+    measured = result.get()
+    process.join()
+    return measured
+
+
+@click.command()
+@click.option('--rows', default=10000, show_default=True, help='Number of rows of generated train part')
+@click.option('--steps', default=200, show_default=True, help='Number of training steps')
+@click.option('--batch-size', default=16, show_default=True, help='Number of examples of batches')
+@click.option('--embed-size', default=64, show_default=True, help='Size of embeddings')
+@click.option('--hidden-size', default=128, show_default=True, help='Size of hidden states')
+@click.option('--min-frequency', default=85, show_default=True, help='Minimum frequency of words in vocabulary')
+def main(rows: int, steps: int, batch_size: int, embed_size: int, hidden_size: int, min_frequency: int):
+    with tempfile.TemporaryDirectory() as directory:
+        data = generate_trimmed_data(rows + 400)[['text', 'summary']]
+        data[:rows].to_csv(os.path.join(directory, 'train.csv'), index=False)
+        for split, part in (('val', data[-400:-200]), ('test', data[-200:])):
+            part.to_csv(os.path.join(directory, f'{split}.csv'), index=False)
+        click.echo(f'{steps} steps of {batch_size} examples | embeddings {embed_size} | hidden {hidden_size}')
+        for mixed_precision in (False, True):
+            config = {
+                'train_test_val_dir': directory,
+                'min_frequency_of_words_in_vocab': min_frequency,
+                'dataframes_field_names': ['text', 'summary'],
+                'batch_size': batch_size,
+                'embed_size': embed_size,
+                'hidden_size': hidden_size,
+                'learning_rate': 0.001,
+                'grad_clip': 0.5,
+                'scheduler_step_size': 10000,
+                'scheduler_gamma': 0.75,
+                'mixed_precision': mixed_precision,
+            }
+            steps_per_second, peak_memory, valid_loss = measure(config, steps)
+            click.echo(f'{"bfloat16" if mixed_precision else "float32":8} | {steps_per_second:5.2f} steps/s | '
+                       f'peak memory {peak_memory:6.0f} MB | validation loss {valid_loss:.4f}')
+
+
+if __name__ == '__main__':
+    main()
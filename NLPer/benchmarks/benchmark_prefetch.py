@@ -0,0 +1,69 @@
+"""
+Benchmark of time of waiting for batches in training steps of a small model on generated train part, with batches
+built in the training loop and prefetched in background.
+
+Run from the ``NLPer`` directory::
+
+    python -m benchmarks.benchmark_prefetch --rows 10000 --steps 100
+"""
+import click
+import numpy as np
+import time
+import torch
+
+from torch import nn
+from torch import optim
+
+from benchmarks.benchmark_file_formats import generate_trimmed_data
+from nlper.model.architecture import DecoderRNN
+from nlper.model.architecture import EncoderRNN
+from nlper.model.architecture import Seq2Seq
+from nlper.trainer.batch_iterator import BatchIterator
+from nlper.trainer.data_loader import DataLoader
+from nlper.trainer.prefetcher import PrefetchIterator
+
+
+def measure_steps(iterator, vocab_size: int, padding_index: int, steps: int):
+    torch.manual_seed(0)
+    seq2seq = Seq2Seq(
+        encoder=EncoderRNN(input_size=vocab_size, embedding_size=32, hidden_size=32, n_layers=2),
+        decoder=DecoderRNN(embedding_size=32, hidden_size=32, output_size=vocab_size, n_layers=1),
+    )
+    optimizer = optim.Adam(seq2seq.parameters())
+    criterion = nn.CrossEntropyLoss(ignore_index=padding_index)
+    data_wait = []
+    start = waiting = time.perf_counter()
+    for batch, _ in zip(iterator, range(steps)):
+        data_wait.append(time.perf_counter() - waiting)
+        text, summary = batch.text[0], batch.summary[0]
+        optimizer.zero_grad()
+        output = seq2seq(text, summary)
+        loss = criterion(output[1:].view(-1, output.shape[2]), summary[1:].contiguous().view(-1))
+        loss.backward()
+        optimizer.step()
+        waiting = time.perf_counter()
+    return np.array(data_wait), time.perf_counter() - start
+
+
+@click.command()
+@click.option('--rows', default=10000, show_default=True, help='Number of rows of generated train part')
+@click.option('--batch-size', default=16, show_default=True, help='Number of examples of batches')
+@click.option('--prefetch-batches', default=4, show_default=True, help='Number of batches prepared ahead')
+@click.option('--min-frequency', default=85, show_default=True, help='Minimum frequency of words in vocabulary')
+@click.option('--steps', default=100, show_default=True, help='Number of measured training steps')
+def main(rows: int, batch_size: int, prefetch_batches: int, min_frequency: int, steps: int):
+    data = generate_trimmed_data(rows)[['text', 'summary']]
+    config = {'min_frequency_of_words_in_vocab': min_frequency, 'dataframes_field_names': ['text', 'summary']}
+    datasets, vocab = DataLoader(config=config).build_datasets({'train': data, 'val': data[:0], 'test': data[:0]})
+    iterator = BatchIterator(datasets['train'], vocab=vocab, batch_size=batch_size, shuffle=True)
+    click.echo(f'{rows} examples | vocabulary {len(vocab)} | {steps} steps of {batch_size} examples')
+    for name, batches in (('in loop', iterator), (f'prefetch {prefetch_batches}', PrefetchIterator(
+            iterator, n_batches=prefetch_batches))):
+        np.random.seed(0)
+        data_wait, total_time = measure_steps(batches, len(vocab), vocab.padding_index, steps)
+        click.echo(f'{name:10} | data wait {data_wait.mean() * 1000:6.2f} ms per step '
+                   f'({data_wait.sum() / total_time:5.1%}) | {steps / total_time:5.2f} steps/s')
+
+
+if __name__ == '__main__':
+    main()
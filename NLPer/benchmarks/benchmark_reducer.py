@@ -0,0 +1,106 @@
+"""
+Benchmark of data frame reduction against the previous row by row implementation.
+
+Run from the ``NLPer`` directory::
+
+    python -m benchmarks.benchmark_reducer --rows 1000000 --legacy-rows 100000
+"""
+import click
+import copy
+import numpy as np
+import pandas as pd
+import time
+
+from nlper.dataframe_cleaner.reducer import Reducer
+from nlper.utils.dataframe_utils import ColumnsWithDuplicates
+
+
+CONFIG = {
+    'columns_to_skip': ['url'],
+    'columns_to_merge_as_text': ['text', 'text_list', 'text_main_points'],
+    'columns_to_merge_as_summary': ['title', 'lead'],
+}
+
+
+class LegacyReducer(Reducer):
+    """
+    Reducer with the previous iterrows, apply and series addition implementation.
+    """
+    def merge_columns_as_text_or_summary(self, columns_to_merge_on):
+        merged = None
+        for column in self.data:
+            if columns_to_merge_on and column in columns_to_merge_on:
+                merged = self.data[column] if merged is None else merged + self.data[column]
+        return merged
+
+    def remove_duplicates_in_lead_and_text_columns(self):
+        for i, row in self.data[ColumnsWithDuplicates.list()].iterrows():
+            if bool(set(row[ColumnsWithDuplicates.Lead.value]) & set(row[ColumnsWithDuplicates.Text.value])):
+                text_to_remove = [
+                    text_index
+                    for text_index, text_value in enumerate(row.text)
+                    if text_value in row[ColumnsWithDuplicates.Lead.value]
+                ]
+                for text_index in reversed(text_to_remove):
+                    del row[ColumnsWithDuplicates.Text.value][text_index]
+
+    def reduce_dataframe(self):
+        self.data = self.data.drop(columns=self.config['columns_to_skip'])
+        for column in self.data:
+            column_data = self.data[column].fillna("")
+            if isinstance(column_data[0], str):
+                column_data = column_data.apply(lambda x: [x])
+            self.data[column] = column_data
+        self.organize_columns()
+        for column in self.data:
+            self.data = self.data[self.data[column].map(lambda cell: len(cell) > 0)]
+        return self.data.reset_index(drop=True)
+
+
+def generate_data(rows: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Generates scraped articles with lead repeated in text for every third article and some empty texts.
+    """
+    random = np.random.RandomState(seed)
+    paragraphs = np.array([f'Paragraph number {i} of some article.' for i in range(1000)], dtype=object)
+    text_lengths = random.randint(0, 8, rows)
+    text = [list(paragraphs[random.randint(0, 1000, length)]) for length in text_lengths]
+    lead = paragraphs[random.randint(0, 1000, rows)]
+    for i in range(0, rows, 3):
+        text[i] = [lead[i]] + text[i]
+    return pd.DataFrame({
+        'url': [f'https://example.com/{i}' for i in range(rows)],
+        'title': [f'Title {i}' if i % 50 else None for i in range(rows)],
+        'lead': lead,
+        'text': text,
+        'text_list': [list(paragraphs[random.randint(0, 1000, length % 3)]) for length in text_lengths],
+        'text_main_points': [[] if i % 4 else ['Main point'] for i in range(rows)],
+    })
+
+
+def time_reduction(reducer_class: type, data: pd.DataFrame) -> (pd.DataFrame, float):
+    start = time.perf_counter()
+    reduced = reducer_class(config=CONFIG, data=data).reduce_dataframe()
+    return reduced, time.perf_counter() - start
+
+
+@click.command()
+@click.option('--rows', default=1000000, show_default=True, help='Number of rows for the current reducer')
+@click.option('--legacy-rows', default=100000, show_default=True,
+              help='Number of rows for the comparison with the previous reducer, 0 to skip')
+def main(rows: int, legacy_rows: int):
+    if legacy_rows:
+        data = generate_data(legacy_rows)
+        legacy, legacy_time = time_reduction(LegacyReducer, copy.deepcopy(data))
+        current, current_time = time_reduction(Reducer, data)
+        assert legacy.equals(current)
+        click.echo(f'{legacy_rows} rows | previous {legacy_time:8.2f} s | current {current_time:8.2f} s | '
+                   f'{legacy_time / current_time:5.1f}x')
+
+    data = generate_data(rows)
+    reduced, current_time = time_reduction(Reducer, data)
+    click.echo(f'{rows} rows | current {current_time:8.2f} s | {len(reduced)} rows after reduction')
+
+
+if __name__ == '__main__':
+    main()
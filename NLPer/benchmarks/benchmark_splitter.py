@@ -0,0 +1,56 @@
+"""
+Benchmark of time and peak memory usage of train test splitter for a generated trimmed data file.
+The splitter is executed in a new spawned process and its peak memory is read from ``VmHWM`` of the process, which
+unlike ``ru_maxrss`` is not inherited from the parent process holding the generated data. Requires Linux.
+
+Run from the ``NLPer`` directory::
+
+    python -m benchmarks.benchmark_splitter --rows 500000 --chunk-size 100000
+"""
+import click
+import multiprocessing
+import os
+import tempfile
+import time
+import yaml
+
+from benchmarks.benchmark_file_formats import generate_trimmed_data
+from nlper.utils.train_test_splitter import TrainTestSplitter
+
+
+def get_peak_memory() -> float:
+    with open('/proc/self/status') as status:
+        for line in status:
+            if line.startswith('VmHWM:'):
+                return int(line.split()[1]) / 1024
+    return float('nan')
+
+
+def run_splitter(config_path: str, result: multiprocessing.Queue) -> None:
+    start = time.perf_counter()
+    TrainTestSplitter(config=config_path).run()
+    result.put((time.perf_counter() - start, get_peak_memory()))
+
+
+@click.command()
+@click.option('--rows', default=500000, show_default=True, help='Number of rows in generated trimmed data')
+@click.option('--chunk-size', default=100000, show_default=True, help='Number of rows in chunk')
+def main(rows: int, chunk_size: int):
+    with tempfile.TemporaryDirectory() as directory:
+        input_file = os.path.join(directory, 'trimmed_data.csv')
+        generate_trimmed_data(rows).to_csv(input_file, index=False)
+        config_path = os.path.join(directory, 'config.yaml')
+        with open(config_path, 'w') as config_file:
+            yaml.safe_dump({'input_file': input_file, 'output_dir': directory, 'chunk_size': chunk_size}, config_file)
+        context = multiprocessing.get_context('spawn')
+        result = context.Queue()
+        process = context.Process(target=run_splitter, args=(config_path, result))
+        process.start()
+        elapsed, peak_memory = result.get()
+        process.join()
+        click.echo(f'{rows} rows | {os.path.getsize(input_file) / 2 ** 20:7.0f} MB file | chunk {chunk_size} | '
+                   f'{elapsed:6.1f} s | peak memory {peak_memory:6.0f} MB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark of peak memory usage of data frame cleaner with and without streaming mode.
+Every run is executed in a separate process, language model is not used.
+
+Run from the ``NLPer`` directory::
+
+    python -m benchmarks.benchmark_streaming --rows 200000 --chunk-size 10000
+"""
+import click
+import json
+import multiprocessing
+import os
+import resource
+import tempfile
+import time
+import yaml
+
+from nlper.dataframe_cleaner.application import Application
+
+
+def generate_corpus(directory: str, rows: int) -> None:
+    """
+    Generates json lines file with scraped articles.
+    """
+    with open(os.path.join(directory, 'articles.jsonl'), 'w', encoding='utf-8') as corpus:
+        for i in range(rows):
+            corpus.write(json.dumps({
+                'url': f'https://example.com/{i}',
+                'title': f'Tytuł artykułu numer {i}',
+                'lead': f'Wstęp artykułu numer {i} z dnia 01.01.2020.',
+                'text': [f'Akapit {j} artykułu numer {i}, który zawiera <b>trochę</b> tekstu.' for j in range(10)],
+                'text_list': [],
+                'text_main_points': [],
+            }, ensure_ascii=False) + '\n')
+
+
+def run_application(config_path: str, result: multiprocessing.Queue) -> None:
+    start = time.perf_counter()
+    Application(config_path).run()
+    result.put((time.perf_counter() - start, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024))
+
+
+def write_config(directory: str, streaming: bool, chunk_size: int) -> str:
+    config = {
+        'input': directory + '/',
+        'output': os.path.join(directory, 'output'),
+        'streaming': streaming,
+        'chunk_size': chunk_size,
+        'columns_to_skip': ['url'],
+        'columns_to_merge_as_text': ['text', 'text_list', 'text_main_points'],
+        'columns_to_merge_as_summary': ['title', 'lead'],
+        'save_reduced': False,
+        'hide_numbers': True,
+        'number_replacement': '<num>',
+        'lemmatize': False,
+        'save_cleaned': True,
+        'cleaned_output_name': 'cleaned_data',
+        'cleaned_merge_data': True,
+        'cleaned_output_type': 'csv',
+        'trim_data': False,
+        'save_trimmed': False,
+    }
+    config_path = os.path.join(directory, f'config_{streaming}.yaml')
+    with open(config_path, 'w') as config_file:
+        yaml.safe_dump(config, config_file)
+    return config_path
+
+
+@click.command()
+@click.option('--rows', default=200000, show_default=True, help='Number of articles in generated corpus')
+@click.option('--chunk-size', default=10000, show_default=True, help='Number of rows in chunk for streaming mode')
+def main(rows: int, chunk_size: int):
+    with tempfile.TemporaryDirectory() as directory:
+        generate_corpus(directory, rows)
+        for streaming in (False, True):
+            result = multiprocessing.Queue()
+            process = multiprocessing.Process(
+                target=run_application, args=(write_config(directory, streaming, chunk_size), result))
+            process.start()
+            elapsed, peak_memory = result.get()
+            process.join()
+            click.echo(f'{rows} rows | streaming {str(streaming):5} | {elapsed:7.1f} s | '
+                       f'peak RSS {peak_memory:8.0f} MB')
+
+
+if __name__ == '__main__':
+    main()
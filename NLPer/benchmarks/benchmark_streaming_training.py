@@ -0,0 +1,72 @@
+"""
+Benchmark of peak memory and time of loading data and iterating over an epoch of train batches of the trainer data
+loader, with train part kept in memory and streamed, for generated train parts of growing size saved in shards.
+
+Run from the ``NLPer`` directory::
+
+    python -m benchmarks.benchmark_streaming_training --rows 40000 --rows 160000
+"""
+import click
+import multiprocessing
+import os
+import tempfile
+import time
+
+from typing import Tuple
+
+from benchmarks.benchmark_file_formats import generate_trimmed_data
+from benchmarks.benchmark_splitter import get_peak_memory
+from nlper.trainer.data_loader import DataLoader
+
+
+SHARDS = 4
+
+
+def write_parts(directory: str, rows: int) -> None:
+    for shard in range(SHARDS):
+        generate_trimmed_data(rows // SHARDS)[['text', 'summary']].to_csv(
+            os.path.join(directory, f'train_{shard}.csv'), index=False)
+    for split in ('val', 'test'):
+        generate_trimmed_data(1000)[['text', 'summary']].to_csv(os.path.join(directory, f'{split}.csv'), index=False)
+
+
+def run_epoch(config: dict, result: multiprocessing.Queue) -> None:
+    start = time.perf_counter()
+    iterators, _ = DataLoader(config=config).load()
+    batches = sum(1 for _ in iterators[0])
+    result.put((batches, time.perf_counter() - start, get_peak_memory()))
+
+
+def measure(config: dict) -> Tuple[int, float, float]:
+    context = multiprocessing.get_context('spawn')
+    result = context.Queue()
+    process = context.Process(target=run_epoch, args=(config, result))
+    process.start()
+    measured = result.get()
+    process.join()
+    return measured
+
+
+@click.command()
+@click.option('--rows', default=[40000, 160000], show_default=True, multiple=True,
+              help='Numbers of rows of generated train part')
+def main(rows: Tuple[int]):
+    for train_rows in rows:
+        with tempfile.TemporaryDirectory() as directory:
+            write_parts(directory, train_rows)
+            size = sum(os.path.getsize(os.path.join(directory, f'train_{k}.csv')) for k in range(SHARDS)) / 2 ** 20
+            for streaming in (False, True):
+                config = {
+                    'train_test_val_dir': directory,
+                    'min_frequency_of_words_in_vocab': 10,
+                    'dataframes_field_names': ['text', 'summary'],
+                    'batch_size': 16,
+                    'streaming': streaming,
+                }
+                batches, elapsed, peak_memory = measure(config)
+                click.echo(f'{train_rows} rows | {size:5.0f} MB | {"streaming" if streaming else "in memory":9} | '
+                           f'{batches} batches | {elapsed:6.1f} s | peak memory {peak_memory:6.0f} MB')
+
+
+if __name__ == '__main__':
+    main()
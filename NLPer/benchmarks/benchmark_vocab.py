@@ -0,0 +1,51 @@
+"""
+Benchmark of vocabulary construction and numericalization of texts of the training split, one text at a time
+and in bulk with ``pyarrow`` compute functions, checking that both give the same vocabulary and indices.
+Pass ``--train-file`` to run on the full training split, otherwise texts are generated.
+
+Run from the ``NLPer`` directory::
+
+    python -m benchmarks.benchmark_vocab --train-file resources/output/trimmed_all_data/train.csv
+"""
+import click
+import numpy as np
+import pandas as pd
+import time
+
+from benchmarks.benchmark_file_formats import generate_trimmed_data
+from nlper.trainer import vocab as vocab_module
+from nlper.trainer.vocab import count_words
+from nlper.trainer.vocab import Vocab
+
+
+def build(texts, n_workers):
+    start = time.perf_counter()
+    vocab = Vocab.from_counter(count_words(texts, n_workers=n_workers), min_frequency=10)
+    counted = time.perf_counter()
+    indices, offsets = vocab.numericalize(texts, n_workers=n_workers)
+    return vocab, indices, offsets, counted - start, time.perf_counter() - counted
+
+
+@click.command()
+@click.option('--train-file', default=None, help='Path to csv file of training split')
+@click.option('--rows', default=100000, show_default=True, help='Number of generated texts without train file')
+@click.option('--workers', default=None, type=int, help='Number of threads, by default number of cores')
+def main(train_file: str, rows: int, workers: int):
+    if train_file:
+        texts = pd.read_csv(train_file, usecols=['text'], dtype=str, keep_default_na=False)['text']
+    else:
+        texts = generate_trimmed_data(rows)['text']
+    pyarrow = vocab_module.pa
+    vocab_module.pa = None
+    expected = build(texts.tolist(), workers)
+    vocab_module.pa = pyarrow
+    result = build(texts, workers)
+    assert result[0].itos == expected[0].itos
+    assert np.array_equal(result[1], expected[1]) and np.array_equal(result[2], expected[2])
+    click.echo(f'{len(texts)} texts | {len(expected[1])} words | vocabulary {len(expected[0])}')
+    for name, (_, _, _, count_time, numericalize_time) in (('one by one', expected), ('bulk', result)):
+        click.echo(f'{name:10} | counting {count_time:6.2f} s | numericalization {numericalize_time:6.2f} s')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,16 +1,35 @@
 import sys
 
+from typing import Optional
+from typing import Tuple
+
 from nlper.dataframe_cleaner.application import Application
+from nlper.dataframe_cleaner.shard_merger import ShardMerger
 
 
-def main(config: str):
+def main(config: str, shard: Optional[Tuple[int, int]] = None):
     """
     Executes the data frame cleaning pipeline.
 
     :param config: Path to config
     :type config: str
+    :param shard: Index of shard and number of shards, if None then all rows are processed
+    :type shard: tuple, optional
+    """
+    application = Application(config_path=config, shard=shard)
+    application.run()
+
+
+def merge_shards(config: str, shards: int):
+    """
+    Executes merging of outputs of data frame cleaning pipeline run in shards.
+
+    :param config: Path to config
+    :type config: str
+    :param shards: Number of shards
+    :type shards: int
     """
-    application = Application(config_path=config)
+    application = ShardMerger(config_path=config, shards=shards)
     application.run()
 
 
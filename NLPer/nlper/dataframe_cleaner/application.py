@@ -1,13 +1,32 @@
 import logging
+import os
+import time
+
+from typing import Dict
+from typing import Optional
+from typing import Sequence
+from typing import Set
+from typing import Tuple
 
 from nlper.dataframe_cleaner.reducer import Reducer
+from nlper.dataframe_cleaner.shard_merger import get_shard_path
+from nlper.dataframe_cleaner.stage_cache import StageCache
+from nlper.dataframe_cleaner.stage_cache import STAGES
 from nlper.dataframe_cleaner.cleaner import Cleaner
+from nlper.dataframe_cleaner.deduplicator import Deduplicator
+from nlper.dataframe_cleaner.length_filter import LengthFilter
+from nlper.dataframe_cleaner.manifest import Manifest
+from nlper.dataframe_cleaner.manifest import MANIFEST_NAME
 from nlper.dataframe_cleaner.trimmer import Trimmer
+from nlper.dataframe_cleaner.worker_pool import WorkerPool
+from nlper.exceptions import InvalidConfigValueException
 from nlper.file_io.dataframe_reader import FileReader
 from nlper.file_io.dataframe_writer import FileWriter
-from nlper.utils.lang_utils import LangUtils
 from nlper.utils.config_utils import read_config
+from nlper.utils.hash_utils import hash_config
+
 
+DEFAULT_CHUNK_SIZE = 10000
 
 logging.basicConfig(
     format=f"%(asctime)s [%(levelname)s] | %(name)s | %(funcName)s: %(message)s",
@@ -20,36 +39,217 @@ class Application:
     """
     Data frame cleaner application, starts by initializing read and write objects.
 
+    With ``shard`` given as index and number of shards, only rows of the shard are processed, and outputs, manifest
+    and stage cache are saved in folders of the shard, see ``get_shard_path``. Outputs of all shards are merged
+    by ``ShardMerger``.
+
     :param config_path: Text to clean
     :type config_path: str
+    :param shard: Index of shard and number of shards, if None then all rows are processed
+    :type shard: tuple, optional
     """
-    def __init__(self, config_path: str):
+    def __init__(self, config_path: str, shard: Optional[Tuple[int, int]] = None):
         self.logger = logging.getLogger(Application.__name__)
         self.config = read_config(config_path, self.logger)
-        self.file_reader = FileReader(path=self.config['input'])
-        self.file_writer = FileWriter(path=self.config['output'])
+        self.shard = shard
+        if shard is not None:
+            self.config['output'] = get_shard_path(self.config['output'], shard)
+            if self.config.get('cache_path'):
+                self.config['cache_path'] = get_shard_path(self.config['cache_path'], shard)
+            if self.config.get('deduplicate'):
+                self.logger.warning('Near-duplicates are removed only within the shard')
+        self.file_reader = FileReader(
+            path=self.config['input'],
+            columns=Reducer.get_columns_to_read(self.config),
+            n_workers=self.config.get('read_workers'),
+            shard=shard,
+        )
+        self.file_writer = FileWriter(
+            path=self.config['output'],
+            compression=self.config.get('parquet_compression') or 'snappy',
+            output_compression=self.config.get('output_compression'),
+            compression_level=self.config.get('compression_level'),
+        )
         self.data = None
+        self.worker_pool = None
+        self.manifest = None
+        self.file_hashes = None
+        self.deduplicator = None
+        self.length_filter = None
+        self.language_model_time = 0.0
 
     def run(self) -> None:
         """
         Executes data frame cleaning process.
+        In streaming mode, specified by ``streaming`` in a config file, the files are processed in chunks.
+        In incremental mode, specified by ``incremental`` in a config file, only rows not processed by previous runs
+        are processed and added to the output files.
+        """
+        rows_to_read = self.select_rows_to_read()
+        if rows_to_read is not None and not any(rows_to_read.values()):
+            self.logger.info('No new data to process')
+            return
+        if self.config.get('streaming'):
+            self.run_streaming(rows_to_read)
+        else:
+            self.run_stages(rows_to_read)
+        self.log_statistics()
+        self.save_manifest()
+
+    def log_statistics(self) -> None:
+        """
+        Logs rates of removed near-duplicates and rows removed by the length filter, if they were used.
+        """
+        if self.deduplicator is not None:
+            self.deduplicator.log_duplicate_rates()
+        if self.length_filter is not None:
+            self.length_filter.log_savings(self.language_model_time)
+
+    def run_stages(self, rows_to_read: Optional[Dict[str, Set[str]]] = None) -> None:
+        """
+        Executes reducing, cleaning and trimming stages for all data frames.
+        With ``cache_stages`` specified in a config file, data frames are cached after every stage, and the run
+        starts from the last stage cached for the same raw data files and config. Outputs of the stages loaded from
+        cache are not saved again.
+
+        :param rows_to_read: Hashes of rows to read for every file name, if None then reads all rows
+        :type rows_to_read: dict, optional
+        """
+        stages = dict(zip(STAGES, (self.reduce_dataframes, self.clean_dataframes, self.trim_dataframes)))
+        stage_cache = self.create_stage_cache(rows_to_read)
+        last_completed_stage = stage_cache.get_last_completed_stage() if stage_cache is not None else None
+        if last_completed_stage is None:
+            stages_to_run = STAGES
+            self.read_files(rows_to_read)
+        else:
+            stages_to_run = STAGES[STAGES.index(last_completed_stage) + 1:]
+            self.data = stage_cache.load(last_completed_stage)
+        self.start_worker_pool(stages_to_run)
+        try:
+            for stage in stages_to_run:
+                stages[stage]()
+                if stage_cache is not None:
+                    stage_cache.save(stage, self.data)
+        finally:
+            self.stop_worker_pool()
+
+    def create_stage_cache(self, rows_to_read: Optional[Dict[str, Set[str]]] = None) -> Optional[StageCache]:
+        """
+        Creates cache of stages in ``cache_path`` specified in a config file, if ``cache_stages`` is set.
+        Stages are not cached in incremental mode, where only part of the rows is processed.
+
+        :param rows_to_read: Hashes of rows to read for every file name, if None then reads all rows
+        :type rows_to_read: dict, optional
+        :return: Cache of stages
+        :rtype: StageCache, optional
         """
-        self.read_files()
-        self.reduce_dataframes()
-        self.load_language_model()
-        self.clean_dataframes()
-        self.trim_dataframes()
+        if not self.config.get('cache_stages'):
+            return None
+        if rows_to_read is not None:
+            self.logger.info('Stages are not cached in incremental mode')
+            return None
+        input_hash = hash_config(dict(
+            {file_name: file_hash for file_name, (file_hash, _) in self.file_reader.hash_json_lines_files().items()},
+            shard=self.shard,
+        ))
+        return StageCache(path=self.config['cache_path'], config=self.config, input_hash=input_hash)
+
+    def select_rows_to_read(self) -> Optional[Dict[str, Set[str]]]:
+        """
+        In incremental mode compares raw data files with the manifest of previous run, saved in the output folder.
+        If the manifest is valid, only new rows are read and appended to the output files of previous run,
+        otherwise all rows are read and output files are replaced.
+
+        :return: Hashes of rows to read for every file name, None for all rows if not in incremental mode
+        :rtype: dict, optional
+        """
+        if not self.config.get('incremental'):
+            return None
+        self.manifest = Manifest(path=os.path.join(self.config['output'], MANIFEST_NAME), config=self.config)
+        self.file_hashes = self.file_reader.hash_json_lines_files()
+        rows_to_read = self.manifest.get_rows_to_process(self.file_hashes) if self.manifest.load() else None
+        if rows_to_read is None:
+            self.logger.info('Processing all data')
+            self.manifest.reset()
+            return {file_name: set(row_hashes) for file_name, (_, row_hashes) in self.file_hashes.items()}
+        self.file_writer.append_to_existing = True
+        for file_name, rows in rows_to_read.items():
+            self.logger.info(f'New rows : {file_name} data : {len(rows)}')
+        return rows_to_read
+
+    def save_manifest(self) -> None:
+        """
+        Records processed rows and saved output files in the manifest, in incremental mode.
+        """
+        if self.manifest is not None:
+            self.manifest.update(self.file_hashes, self.file_writer.saved_paths)
+            self.manifest.save()
+
+    def run_streaming(self, rows_to_read: Optional[Dict[str, Set[str]]] = None) -> None:
+        """
+        Executes data frame cleaning process for chunks of ``chunk_size`` rows of every file, specified in a config
+        file. Every chunk is reduced, cleaned and trimmed, then appended to the output files, so the memory usage
+        depends on the chunk size instead of the size of all files.
+
+        :param rows_to_read: Hashes of rows to read for every file name, if None then reads all rows
+        :type rows_to_read: dict, optional
+        """
+        chunk_size = self.validate_streaming_config()
+        self.start_worker_pool(STAGES)
+        try:
+            chunks = self.file_reader.read_json_lines_chunks(chunk_size=chunk_size, rows_to_read=rows_to_read)
+            for name, chunk in chunks:
+                self.logger.info(f'Processing chunk : {name} data : {len(chunk)}')
+                self.data = {name: chunk}
+                self.reduce_dataframes()
+                self.clean_dataframes()
+                self.trim_dataframes()
+        finally:
+            self.stop_worker_pool()
+
+    def validate_streaming_config(self) -> int:
+        """
+        Validates config of streaming mode, only CSV output files can be appended chunk by chunk.
+
+        :return: Number of rows in chunk
+        :rtype: int
+        """
+        chunk_size = self.config.get('chunk_size')
+        if chunk_size is None:
+            chunk_size = DEFAULT_CHUNK_SIZE
+        if isinstance(chunk_size, bool) or not isinstance(chunk_size, int) or chunk_size < 1:
+            raise InvalidConfigValueException('chunk_size', chunk_size)
+        for type in STAGES:
+            if self.config[f'save_{type}'] and self.config[f'{type}_output_type'] != 'csv':
+                raise InvalidConfigValueException(f'{type}_output_type', self.config[f'{type}_output_type'])
+        return chunk_size
 
     def clean_dataframes(self) -> None:
         """
         Calls text in data frame cleaning of every data frame using cleaner.
         Saves cleaned data frame if specified in a config file.
         """
+        self.remove_short_texts()
+        start = time.perf_counter()
         for name, value in self.data.items():
             self.logger.info(f'Cleaning : {name} data : {len(value)}')
-            self.data[name] = Cleaner(config=self.config, data=value).clean_dataframe()
+            self.data[name] = Cleaner(config=self.config, data=value, worker_pool=self.worker_pool).clean_dataframe()
+        if self.config['lemmatize']:
+            self.language_model_time += time.perf_counter() - start
         self.check_if_should_save(type='cleaned')
 
+    def remove_short_texts(self) -> None:
+        """
+        Removes rows too short to pass the lower length limits of trimming before cleaning, if ``length_prefilter``
+        and ``trim_data`` are set in a config file.
+        """
+        if not (self.config.get('length_prefilter') and self.config['trim_data']):
+            return
+        if self.length_filter is None:
+            self.length_filter = LengthFilter(config=self.config)
+        for name, value in self.data.items():
+            self.data[name] = self.length_filter.filter_dataframe(value, name=name)
+
     def check_if_should_save(self, type: str) -> None:
         """
         Resolves data frame saving after particular procedure, based on config file.
@@ -63,21 +263,38 @@ class Application:
                 name=self.config[f'{type}_output_name'],
                 merge_data=self.config[f'{type}_merge_data'],
                 output_type=self.config[f'{type}_output_type'],
+                append=bool(self.config.get('streaming')) or self.file_writer.append_to_existing,
             )
 
-    def load_language_model(self) -> None:
+    def start_worker_pool(self, stages: Sequence[str]) -> None:
         """
-        Initializes and obtains the language model from SpaCy.
+        Starts the pool of workers, each loading the language model from SpaCy once, if any of the stages to run
+        uses the language model. The pool is reused by cleaner and trimmer for every data frame.
+        Number of workers is specified by ``n_workers`` in a config file, by default half of the available cores.
+
+        :param stages: Names of stages to run
+        :type stages: sequence
         """
-        if self.config['lemmatize'] or self.config['trim_data']:
-            lang_model = LangUtils()
-            self.config['language_model'] = lang_model.set_language_model()
+        if (self.config['lemmatize'] and 'cleaned' in stages) or (self.config['trim_data'] and 'trimmed' in stages):
+            self.worker_pool = WorkerPool(n_workers=self.config.get('n_workers'))
+            self.worker_pool.start()
 
-    def read_files(self) -> None:
+    def stop_worker_pool(self) -> None:
+        """
+        Closes the pool of workers.
+        """
+        if self.worker_pool is not None:
+            self.worker_pool.close()
+            self.worker_pool = None
+
+    def read_files(self, rows_to_read: Optional[Dict[str, Set[str]]] = None) -> None:
         """
         Calls data frames reading procedure using file reader.
+
+        :param rows_to_read: Hashes of rows to read for every file name, if None then reads all rows
+        :type rows_to_read: dict, optional
         """
-        self.data = self.file_reader.read_json_lines_files()
+        self.data = self.file_reader.read_json_lines_files(rows_to_read=rows_to_read)
 
     def reduce_dataframes(self) -> None:
         """
@@ -86,15 +303,33 @@ class Application:
         """
         for name, value in self.data.items():
             self.data[name] = Reducer(config=self.config, data=value).reduce_dataframe()
+        self.remove_duplicates()
         self.check_if_should_save(type='reduced')
 
+    def remove_duplicates(self) -> None:
+        """
+        Removes near-duplicate articles from reduced data frames, if ``deduplicate`` is set in a config file.
+        The same deduplicator is used for all sites and chunks, so only the first occurrence of article is kept.
+        """
+        if not self.config.get('deduplicate'):
+            return
+        if self.deduplicator is None:
+            self.deduplicator = Deduplicator(
+                bands=self.config.get('deduplication_bands') or 16,
+                rows=self.config.get('deduplication_rows') or 8,
+            )
+        for name, value in self.data.items():
+            self.data[name] = self.deduplicator.remove_duplicates(value, name=name)
+
     def trim_dataframes(self) -> None:
         """
         Calls text in data frame trimming of every data frame using trimmer.
         Saves reduced data frame if specified in a config file.
         """
         if self.config['trim_data']:
+            start = time.perf_counter()
             for name, value in self.data.items():
                 self.logger.info(f'Trimming : {name} data : {len(value)}')
-                self.data[name] = Trimmer(config=self.config, data=value).trim_dataframe()
+                self.data[name] = Trimmer(config=self.config, data=value, worker_pool=self.worker_pool).trim_dataframe()
+            self.language_model_time += time.perf_counter() - start
         self.check_if_should_save(type='trimmed')
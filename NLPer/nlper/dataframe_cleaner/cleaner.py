@@ -1,19 +1,15 @@
 import logging
-import numpy as np
 import pandas as pd
 
-from multiprocessing import cpu_count, Pool
-from tqdm import tqdm
 from typing import Any
 from typing import Dict
+from typing import Optional
 
+from nlper.dataframe_cleaner.worker_pool import WorkerPool
 from nlper.utils.clean_utils import CleanUtils
 from nlper.utils.time_utils import timeit
 
 
-tqdm.pandas(desc="Cleaning")
-
-
 class Cleaner:
     """
     Cleans raw text data frame obtaining data in unified format.
@@ -26,12 +22,14 @@ class Cleaner:
     :type config: dict
     :param data: Raw text data frame to clean
     :type data: pd.DataFrame
+    :param worker_pool: Pool of workers with loaded language model, if None then in-process pool is created on first use
+    :type worker_pool: WorkerPool, optional
     """
-    def __init__(self, config: Dict[str, Any], data: pd.DataFrame):
+    def __init__(self, config: Dict[str, Any], data: pd.DataFrame, worker_pool: Optional[WorkerPool] = None):
         self.logger = logging.getLogger(Cleaner.__name__)
         self.config = config
         self.data = data
-        self.n_cores = cpu_count() // 2
+        self.worker_pool = worker_pool
         self.clean_utils = CleanUtils()
 
     @timeit
@@ -41,12 +39,23 @@ class Cleaner:
         :return: Cleaned data frame
         :rtype: pd.DataFrame
         """
+        self.clean_characters()
+        if self.config['lemmatize']:
+            self.lemmatize_text()
+        return self.data
+
+    def clean_characters(self) -> pd.DataFrame:
+        """
+        Executes the cleaning steps not using the language model, converts lists to texts, removes unwanted
+        characters and hides numbers if specified in a config file.
+
+        :return: Data frame with cleaned characters
+        :rtype: pd.DataFrame
+        """
         self.convert_list_to_text_in_dataframe()
         self.remove_characters_for_dataframe()
         if self.config['hide_numbers']:
             self.hide_numbers()
-        if self.config['lemmatize']:
-            self.lemmatize_text()
         return self.data
 
     def convert_list_to_text_in_dataframe(self) -> None:
@@ -68,32 +77,13 @@ class Cleaner:
 
     def lemmatize_text(self) -> None:
         """
-        Applies parallelization of text lemmatization for data frame using python multiprocessing.
+        Applies parallelization of text lemmatization for data frame columns using the worker pool.
         Lemmatization process is computationally expensive and thus parallelization greatly reduces the required time.
         """
-        self.clean_utils.lang_model = self.config['language_model']
-
-        dataframe_splits = np.array_split(self.data, self.n_cores)
-        pool = Pool(self.n_cores)
-        self.data = pd.concat(pool.map(self.lemmatize_text_for_dataframe, dataframe_splits))
-        pool.close()
-        pool.join()
-
-    def lemmatize_text_for_dataframe(self, dataframe: pd.DataFrame) -> pd.DataFrame:
-        """
-        Splits text lemmatization in data frame into separated columns.
-
-        :param dataframe: Data frame to lemmatize text in.
-        :type dataframe: pd.DataFrame
-        :return: Data frame with lemmatized text
-        :rtype: pd.DataFrame
-        """
-        for column_name in dataframe:
-            dataframe[column_name] = self.lemmatize_text_for_column(
-                column_data=dataframe[column_name],
-                clean_utils=self.clean_utils,
-            )
-        return dataframe
+        if self.worker_pool is None:
+            self.worker_pool = WorkerPool(n_workers=0)
+        for column_name in self.data:
+            self.data[column_name] = self.worker_pool.lemmatize(self.data[column_name].tolist())
 
     def remove_characters_for_dataframe(self) -> None:
         """
@@ -112,25 +102,7 @@ class Cleaner:
         :return: Cleaned data frame column
         :rtype: pd.Series
         """
-        return pd.Series([
-            CleanUtils.hide_numbers(text=text)
-            for text in column_data
-        ])
-
-    @staticmethod
-    def lemmatize_text_for_column(column_data: pd.Series, clean_utils: CleanUtils) -> pd.Series:
-        """
-        Calls text lemmatization on single data frame column using cleaning utils.
-        Method uses ``progress_map`` to visualize progress of lemmatization using tqdm.
-
-        :param column_data: Column in data frame to lemmatize.
-        :type column_data: pd.Series
-        :param clean_utils: Cleaning utility class
-        :type clean_utils: object
-        :return: Column in data frame with lemmatized text
-        :rtype: pd.Series
-        """
-        return column_data.progress_map(lambda text: clean_utils.lemmatize(text=text))
+        return CleanUtils.hide_numbers_for_series(column_data)
 
     @staticmethod
     def remove_characters_for_column(column_data: pd.Series) -> pd.Series:
@@ -142,7 +114,4 @@ class Cleaner:
         :return: Data frame column with removed characters
         :rtype: pd.Series
         """
-        return pd.Series([
-            CleanUtils.remove_characters_for_text(text=text)
-            for text in column_data
-        ])
+        return CleanUtils.remove_characters_for_series(column_data)
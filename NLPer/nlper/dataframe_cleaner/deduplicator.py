@@ -0,0 +1,180 @@
+import logging
+import numpy as np
+import pandas as pd
+
+from typing import List
+from typing import Sequence
+from typing import Tuple
+
+from nlper.utils.dataframe_utils import OutputColumns
+
+
+SHINGLES_PER_BLOCK = 1 << 16
+HASH_KEY = '0123456789123456'
+
+
+class Deduplicator:
+    """
+    Detects near-duplicate texts with MinHash signatures of word shingles and LSH banding.
+
+    Signature of ``bands`` * ``rows`` minimum hashes is split into bands of ``rows`` values, texts with any equal band
+    are near-duplicates. Texts with Jaccard similarity of shingles above about ``(1 / bands) ** (1 / rows)``
+    are detected with high probability, for 16 bands of 8 rows it is about 0.7.
+
+    The deduplicator keeps only band hashes of seen texts, 8 bytes per band, so the memory does not depend on
+    the length of texts and the same deduplicator is used for all sites and chunks of data. The first occurrence
+    of text is kept, the later ones are duplicates.
+
+    :param bands: Number of LSH bands
+    :type bands: int
+    :param rows: Number of minimum hashes in band
+    :type rows: int
+    :param shingle_size: Number of words in shingle
+    :type shingle_size: int
+    :param seed: Seed of the random hash functions
+    :type seed: int
+    """
+    def __init__(self, bands: int = 16, rows: int = 8, shingle_size: int = 3, seed: int = 0):
+        self.logger = logging.getLogger(Deduplicator.__name__)
+        self.bands = bands
+        self.rows = rows
+        self.shingle_size = shingle_size
+        random = np.random.RandomState(seed)
+        self.multipliers = random.randint(1, 2 ** 62, size=bands * rows, dtype=np.uint64) * 2 + 1
+        self.increments = random.randint(0, 2 ** 62, size=bands * rows, dtype=np.uint64)
+        self.shingle_multipliers = random.randint(1, 2 ** 62, size=shingle_size, dtype=np.uint64) * 2 + 1
+        self.band_multipliers = random.randint(1, 2 ** 62, size=rows, dtype=np.uint64) * 2 + 1
+        self.seen_bands = [np.empty(0, dtype=np.uint64) for _ in range(bands)]
+        self.duplicates = {}
+
+    def remove_duplicates(self, dataframe: pd.DataFrame, name: str,
+                          column: str = OutputColumns.Text.value) -> pd.DataFrame:
+        """
+        Removes rows with texts which are near-duplicates of texts seen before and counts them for the site.
+
+        :param dataframe: Data frame with lists of texts in column
+        :type dataframe: pd.DataFrame
+        :param name: Name of the site
+        :type name: str
+        :param column: Column with lists of texts to compare
+        :type column: str
+        :return: Data frame without duplicated rows
+        :rtype: pd.DataFrame
+        """
+        texts = [' '.join(filter(None, text)) for text in dataframe[column].tolist()]
+        duplicates = self.find_duplicates(texts)
+        removed, total = self.duplicates.get(name, (0, 0))
+        self.duplicates[name] = (removed + int(duplicates.sum()), total + len(texts))
+        return dataframe[~duplicates].reset_index(drop=True)
+
+    def log_duplicate_rates(self) -> None:
+        """
+        Logs number and rate of removed duplicates for every site.
+        """
+        for name, (removed, total) in self.duplicates.items():
+            self.logger.info(f'Duplicates : {name} : {removed} of {total} ({removed / max(total, 1):.1%})')
+
+    def find_duplicates(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Finds texts which are near-duplicates of earlier texts, from this or previous calls.
+        Texts without words are never duplicates.
+
+        :param texts: Texts to compare
+        :type texts: sequence
+        :return: Boolean mask of duplicated texts
+        :rtype: np.ndarray
+        """
+        band_hashes, has_words = self.get_band_hashes(texts)
+        band_hashes = band_hashes[has_words]
+        indices = np.arange(len(band_hashes))
+        duplicates = np.zeros(len(band_hashes), dtype=bool)
+        for band in range(self.bands):
+            values = band_hashes[:, band]
+            _, first, inverse = np.unique(values, return_index=True, return_inverse=True)
+            duplicates |= first[inverse.reshape(-1)] != indices
+            seen = self.seen_bands[band]
+            if len(seen):
+                positions = np.minimum(np.searchsorted(seen, values), len(seen) - 1)
+                duplicates |= seen[positions] == values
+            self.seen_bands[band] = np.union1d(seen, values)
+        mask = np.zeros(len(texts), dtype=bool)
+        mask[has_words] = duplicates
+        return mask
+
+    def get_band_hashes(self, texts: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Computes hashes of signature bands for every text.
+
+        :param texts: Texts to hash
+        :type texts: sequence
+        :return: Array of band hashes with row for every text and mask of texts with words
+        :rtype: tuple
+        """
+        signatures, has_words = self.get_signatures(texts)
+        bands = signatures.reshape(len(texts), self.bands, self.rows).astype(np.uint64)
+        return (bands * self.band_multipliers).sum(axis=2, dtype=np.uint64), has_words
+
+    def get_signatures(self, texts: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Computes MinHash signatures of word shingles for every text.
+        Shingles of many texts are hashed together in blocks, to keep the memory usage small.
+
+        :param texts: Texts to hash
+        :type texts: sequence
+        :return: Array of signatures with row for every text and mask of texts with words
+        :rtype: tuple
+        """
+        shingles = self.get_shingles(texts)
+        signatures = np.full((len(texts), self.bands * self.rows), np.iinfo(np.uint32).max, dtype=np.uint32)
+        has_words = np.array([len(text_shingles) > 0 for text_shingles in shingles], dtype=bool)
+        block, block_texts, block_size = [], [], 0
+        for index in np.flatnonzero(has_words):
+            block.append(shingles[index])
+            block_texts.append(index)
+            block_size += len(shingles[index])
+            if block_size >= SHINGLES_PER_BLOCK:
+                signatures[block_texts] = self._get_block_signatures(block)
+                block, block_texts, block_size = [], [], 0
+        if block:
+            signatures[block_texts] = self._get_block_signatures(block)
+        return signatures, has_words
+
+    def get_shingles(self, texts: Sequence[str]) -> List[np.ndarray]:
+        """
+        Computes hashes of shingles of ``shingle_size`` consecutive lowercase words for every text.
+        Texts shorter than shingle have a single shingle of all words.
+
+        :param texts: Texts to split into shingles
+        :type texts: sequence
+        :return: List of arrays with shingle hashes
+        :rtype: list
+        """
+        words = [str(text).lower().split() for text in texts]
+        word_hashes = pd.util.hash_array(
+            np.array([word for text_words in words for word in text_words], dtype=object), hash_key=HASH_KEY)
+        shingles = []
+        start = 0
+        for text_words in words:
+            text_hashes = word_hashes[start:start + len(text_words)]
+            start += len(text_words)
+            size = min(self.shingle_size, len(text_hashes))
+            text_shingles = np.zeros(len(text_hashes) - size + 1 if size else 0, dtype=np.uint64)
+            for offset in range(size):
+                text_shingles += text_hashes[offset:offset + len(text_shingles)] * self.shingle_multipliers[offset]
+            shingles.append(text_shingles)
+        return shingles
+
+    def _get_block_signatures(self, block: List[np.ndarray]) -> np.ndarray:
+        """
+        Computes MinHash signatures of texts in block with multiply-shift hashing of shingles.
+
+        :param block: Arrays with shingle hashes of texts, none of them empty
+        :type block: list
+        :return: Array of signatures with row for every text in block
+        :rtype: np.ndarray
+        """
+        offsets = np.cumsum([0] + [len(text_shingles) for text_shingles in block[:-1]])
+        shingles = np.concatenate(block)
+        shingles = (shingles >> np.uint64(32)) ^ (shingles & np.uint64(0xFFFFFFFF))
+        hashes = ((self.multipliers[:, None] * shingles + self.increments[:, None]) >> np.uint64(32)).astype(np.uint32)
+        return np.minimum.reduceat(hashes, offsets, axis=1).T
@@ -0,0 +1,76 @@
+import logging
+import numpy as np
+import pandas as pd
+
+from typing import Any
+from typing import Dict
+
+from nlper.dataframe_cleaner.cleaner import Cleaner
+from nlper.utils.trim_utils import TrimUtils
+
+
+class LengthFilter:
+    """
+    Removes rows which cannot pass the lower length limits of trimmer, before the language model from SpaCy is used
+    by cleaner and trimmer.
+
+    Number of words is counted on texts with cleaned characters, which is cheap compared to lemmatization.
+    Without lemmatization it is the exact number of words after cleaning, with lemmatization every word and punctuation
+    character is counted as separate token, the upper bound of number of lemmas. Rows with the count not above
+    the lower length limit of any column would be removed by trimmer anyway.
+
+    Removed and kept words are counted, so the time of language model saved by the filter is estimated
+    from the time spent on the kept words.
+
+    :param config: Configuration dictionary
+    :type config: dict
+    """
+    def __init__(self, config: Dict[str, Any]):
+        self.logger = logging.getLogger(LengthFilter.__name__)
+        self.config = config
+        self.removed = {}
+        self.removed_words = 0
+        self.kept_words = 0
+
+    def filter_dataframe(self, dataframe: pd.DataFrame, name: str) -> pd.DataFrame:
+        """
+        Removes rows with texts too short to pass the lower length limits and counts them for the site.
+
+        :param dataframe: Reduced data frame with lists of texts
+        :type dataframe: pd.DataFrame
+        :param name: Name of the site
+        :type name: str
+        :return: Data frame without too short rows
+        :rtype: pd.DataFrame
+        """
+        cleaned = Cleaner(config=self.config, data=dataframe.copy()).clean_characters()
+        keep = np.ones(len(dataframe), dtype=bool)
+        words = np.zeros(len(dataframe), dtype=np.int64)
+        for column_name in cleaned:
+            texts = cleaned[column_name].tolist()
+            column_words = np.array([len(text.split()) for text in texts], dtype=np.int64)
+            if self.config['lemmatize']:
+                tokens = np.array([TrimUtils.count_tokens_upper_bound(text) for text in texts], dtype=np.int64)
+            else:
+                tokens = column_words
+            keep &= tokens > self.config[f'{column_name}_lower_length_limit']
+            words += column_words
+        removed, total = self.removed.get(name, (0, 0))
+        self.removed[name] = (removed + int((~keep).sum()), total + len(dataframe))
+        self.removed_words += int(words[~keep].sum())
+        self.kept_words += int(words[keep].sum())
+        return dataframe[keep].reset_index(drop=True)
+
+    def log_savings(self, language_model_time: float) -> None:
+        """
+        Logs number of removed rows for every site and estimated time of language model saved by the filter.
+
+        :param language_model_time: Time in seconds spent by cleaner and trimmer using the language model
+        :type language_model_time: float
+        """
+        for name, (removed, total) in self.removed.items():
+            self.logger.info(f'Too short rows removed before cleaning : {name} : {removed} of {total}')
+        if self.kept_words and language_model_time:
+            saved_time = language_model_time * self.removed_words / self.kept_words
+            self.logger.info(f'Estimated time of language model saved : {saved_time:.1f} seconds '
+                             f'for {self.removed_words} words')
@@ -0,0 +1,124 @@
+import json
+import logging
+import os
+
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+from nlper.utils.hash_utils import hash_config
+
+
+MANIFEST_NAME = 'manifest.json'
+RUNTIME_CONFIG_KEYS = ('n_workers', 'read_workers', 'streaming', 'chunk_size', 'incremental')
+
+
+class Manifest:
+    """
+    Record of raw data files and rows processed by data frame cleaner, together with the fingerprint of config
+    and sizes of saved output files.
+
+    Manifest of previous run is valid only for the same config and unchanged output files, otherwise all data
+    has to be processed again. Runtime config keys, like number of workers, do not change the fingerprint.
+
+    :param path: Path to manifest file
+    :type path: str
+    :param config: Configuration dictionary
+    :type config: dict
+    """
+    def __init__(self, path: str, config: Dict[str, Any]):
+        self.logger = logging.getLogger(Manifest.__name__)
+        self.path = path
+        self.config_hash = hash_config(config, skip_keys=RUNTIME_CONFIG_KEYS)
+        self.files = {}
+        self.outputs = {}
+
+    def load(self) -> bool:
+        """
+        Loads manifest saved by previous run and checks whether it is valid.
+
+        :return: Flag whether manifest of previous run is loaded
+        :rtype: bool
+        """
+        if not os.path.exists(self.path):
+            self.logger.info(f'No manifest in {self.path}')
+            return False
+        with open(self.path, 'r') as manifest_file:
+            manifest = json.load(manifest_file)
+        if manifest['config'] != self.config_hash:
+            self.logger.info('Config changed since previous run')
+            return False
+        for path, size in manifest['outputs'].items():
+            if not os.path.exists(path) or os.path.getsize(path) != size:
+                self.logger.info(f'Output file {path} changed since previous run')
+                return False
+        self.files = manifest['files']
+        self.outputs = manifest['outputs']
+        return True
+
+    def get_rows_to_process(self, hashes: Dict[str, Tuple[str, List[str]]]) -> Optional[Dict[str, Set[str]]]:
+        """
+        Compares hashes of raw data files with processed files and rows.
+        New rows can be added to output files only if all processed rows are still in the raw data files,
+        changed or removed rows require processing all data again.
+
+        :param hashes: Dictionary with file names and tuples of file hash and list of row hashes
+        :type hashes: dict
+        :return: Hashes of new rows for every file name, None if all data has to be processed again
+        :rtype: dict, optional
+        """
+        removed_files = set(self.files).difference(hashes)
+        if removed_files:
+            self.logger.info(f'Files removed since previous run : {sorted(removed_files)}')
+            return None
+        rows_to_process = {}
+        for file_name, (file_hash, row_hashes) in hashes.items():
+            processed = self.files.get(file_name)
+            if processed is not None and processed['hash'] == file_hash:
+                rows_to_process[file_name] = set()
+                continue
+            rows = set(row_hashes)
+            if processed is not None and not rows.issuperset(processed['rows']):
+                self.logger.info(f'Rows changed or removed since previous run : {file_name}')
+                return None
+            rows_to_process[file_name] = rows.difference(processed['rows']) if processed is not None else rows
+        return rows_to_process
+
+    def reset(self) -> None:
+        """
+        Forgets processed files and saved outputs.
+        """
+        self.files = {}
+        self.outputs = {}
+
+    def update(self, hashes: Dict[str, Tuple[str, List[str]]], output_paths: Iterable[str]) -> None:
+        """
+        Records files and rows as processed and sizes of saved output files.
+
+        :param hashes: Dictionary with file names and tuples of file hash and list of row hashes
+        :type hashes: dict
+        :param output_paths: Paths of output files saved in this run
+        :type output_paths: iterable
+        """
+        self.files = {
+            file_name: {'hash': file_hash, 'rows': sorted(set(row_hashes))}
+            for file_name, (file_hash, row_hashes) in hashes.items()
+        }
+        self.outputs.update({path: os.path.getsize(path) for path in output_paths})
+
+    def save(self) -> None:
+        """
+        Saves manifest, replacing the previous one only after the new one is written.
+        """
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        temporary_path = self.path + '.tmp'
+        with open(temporary_path, 'w') as manifest_file:
+            json.dump({'config': self.config_hash, 'files': self.files, 'outputs': self.outputs}, manifest_file)
+        os.replace(temporary_path, self.path)
+        self.logger.info(f'Saved manifest {self.path}')
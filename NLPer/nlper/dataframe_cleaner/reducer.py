@@ -1,6 +1,8 @@
 import logging
+import operator
 import pandas as pd
 
+from functools import reduce
 from typing import Any
 from typing import Dict
 from typing import List
@@ -24,14 +26,29 @@ class Reducer:
         self.config = config
         self.data = data
 
+    @staticmethod
+    def get_columns_to_read(config: Dict[str, Any]) -> List[str]:
+        """
+        Lists raw data columns used by reducing, other columns can be skipped while reading raw data files.
+
+        :param config: Configuration dictionary
+        :type config: dict
+        :return: Names of columns to read
+        :rtype: list
+        """
+        columns = (config['columns_to_merge_as_text'] or []) + (config['columns_to_merge_as_summary'] or [])
+        columns = columns + ColumnsWithDuplicates.list()
+        return [column for column in dict.fromkeys(columns) if column not in (config['columns_to_skip'] or [])]
+
     def reduce_dataframe(self) -> pd.DataFrame:
         """
         Executes data frame reducing process.
-        Drops columns specified by config file.
+        Drops columns specified by config file, if they were read.
         :return: Cleaned data frame
         :rtype: pd.DataFrame
         """
-        self.data = DataFrameUtils.drop_columns(self.data, self.config['columns_to_skip'], inplace=False)
+        columns_to_skip = [column for column in self.config['columns_to_skip'] or [] if column in self.data]
+        self.data = DataFrameUtils.drop_columns(self.data, columns_to_skip, inplace=False)
         self.unify_dataframe_content()
         self.organize_columns()
         self.data = DataFrameUtils.remove_empty_rows(self.data)
@@ -49,25 +66,39 @@ class Reducer:
         :rtype: pd.Series
         """
         if series is None:
-            series = self.data[column]
-        else:
-            series = series + self.data[column]
-        return series
+            return self.data[column]
+        return self.merge_cells([series, self.data[column]])
 
     def merge_columns_as_text_or_summary(self, columns_to_merge_on: List[str]) -> Optional[pd.Series]:
         """
-        Finds columns to merge by names and calls merging method.
+        Finds columns to merge by names and merges them in a single pass over rows.
 
         :param columns_to_merge_on: Names of columns to merge
         :type columns_to_merge_on: list
         :return: Merged column
         :rtype: pd.Series, optional
         """
-        merged = None
-        for column in self.data:
-            if columns_to_merge_on and column in columns_to_merge_on:
-                merged = self.merge_or_create_column(column, merged)
-        return merged
+        columns = [column for column in self.data if columns_to_merge_on and column in columns_to_merge_on]
+        if not columns:
+            return None
+        if len(columns) == 1:
+            return self.data[columns[0]]
+        return self.merge_cells([self.data[column] for column in columns])
+
+    @staticmethod
+    def merge_cells(columns: List[pd.Series]) -> pd.Series:
+        """
+        Concatenates lists from the same row of every column.
+
+        :param columns: Columns with lists to concatenate, in order of concatenation
+        :type columns: list
+        :return: Column with concatenated lists
+        :rtype: pd.Series
+        """
+        return pd.Series(
+            [reduce(operator.add, cells) for cells in zip(*[column.tolist() for column in columns])],
+            index=columns[0].index, name=columns[0].name, dtype=object,
+        )
 
     def merge_columns(self) -> None:
         """
@@ -86,11 +117,14 @@ class Reducer:
 
     def remove_duplicates_in_lead_and_text_columns(self) -> None:
         """
-        Checks if lead and text columns contain the same text, calls the removal method if so.
+        Checks if lead and text columns contain the same text, removes the duplicated text from text column if so.
+        Lists of texts are replaced with new lists, so the raw data is not modified.
         """
-        for i, row in self.data[ColumnsWithDuplicates.list()].iterrows():
-            if bool(set(row[ColumnsWithDuplicates.Lead.value]) & set(row[ColumnsWithDuplicates.Text.value])):
-                self._remove_lead_from_text(row)
+        lead_column, text_column = ColumnsWithDuplicates.Lead.value, ColumnsWithDuplicates.Text.value
+        self.data[text_column] = pd.Series([
+            self._remove_lead_from_text(lead, text)
+            for lead, text in zip(self.data[lead_column].tolist(), self.data[text_column].tolist())
+        ], index=self.data.index, dtype=object)
 
     def unify_dataframe_content(self) -> None:
         """
@@ -100,35 +134,38 @@ class Reducer:
             self.data[column] = self._unify_column_content_to_list(column_data=self.data[column])
 
     @staticmethod
-    def _remove_lead_from_text(row: pd.DataFrame) -> pd.DataFrame:
+    def _remove_lead_from_text(lead: List[str], text: List[str]) -> List[str]:
         """
-        Obtains the duplicated text part in both lead and text columns. Removes the duplicated text from text column.
+        Obtains the duplicated text part in both lead and text of the row. Removes the duplicated text from text.
 
-        :param row: Row with duplicated text
-        :type row: pd.DataFrame
-        :return: Row with removed text from text column
-        :rtype: pd.DataFrame
+        :param lead: Lead of the row
+        :type lead: list
+        :param text: Text of the row
+        :type text: list
+        :return: Text with removed duplicated text, the same text if nothing is duplicated
+        :rtype: list
         """
-        text_to_remove = [
-            text_index
-            for text_index, text_value in enumerate(row.text)
-            if text_value in row[ColumnsWithDuplicates.Lead.value]
-        ]
-        for text_index in reversed(text_to_remove):
-            del row[ColumnsWithDuplicates.Text.value][text_index]
-        return row[ColumnsWithDuplicates.Text.value]
+        lead_texts = set(lead)
+        if not lead_texts.intersection(text):
+            return text
+        return [text_value for text_value in text if text_value not in lead_texts]
 
     @staticmethod
     def _unify_column_content_to_list(column_data: pd.Series) -> pd.Series:
         """
-        Unifies data format in column by converting to list.
+        Unifies data format in column by converting every text to list, and missing value to empty list, the same as
+        for rows without the column. Every cell is converted on its own, so the result does not depend on other rows,
+        e.g. rows in the same chunk or shard.
 
         :param column_data: Column in data frame to unify.
         :type column_data: pd.Series
         :return: Unified data frame column
         :rtype: pd.Series
         """
-        column_data.fillna("", inplace=True)
-        if isinstance(column_data[0], str):
-            column_data = column_data.apply(lambda x: [x])
-        return column_data
+        return pd.Series(
+            [
+                [value] if isinstance(value, str) else value if isinstance(value, list) else []
+                for value in column_data.tolist()
+            ],
+            index=column_data.index, name=column_data.name, dtype=object,
+        )
@@ -0,0 +1,169 @@
+import logging
+import os
+import pandas as pd
+
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from nlper.dataframe_cleaner.manifest import MANIFEST_NAME
+from nlper.exceptions import MissingShardOutputException
+from nlper.file_io.compression import get_compression
+from nlper.file_io.compression import strip_compression_extension
+from nlper.file_io.dataframe_reader import FileReader
+from nlper.file_io.dataframe_writer import FileWriter
+from nlper.file_io.file_type_resolver import FileTypesResolver
+from nlper.utils.config_utils import read_config
+
+
+SITE_COLUMN = 'site'
+OUTPUT_TYPES = {'.csv': 'csv', '.pkl': 'pickle', '.parquet': 'parquet'}
+
+
+def get_shard_path(path: str, shard: Tuple[int, int]) -> str:
+    """
+    Builds path of folder with outputs of shard inside the folder of outputs.
+
+    :param path: Path to folder with outputs
+    :type path: str
+    :param shard: Index of shard and number of shards
+    :type shard: tuple
+    :return: Path to folder with outputs of shard
+    :rtype: str
+    """
+    index, shards = shard
+    return os.path.join(path, f'shard_{index}_of_{shards}')
+
+
+class ShardMerger:
+    """
+    Merges outputs saved by data frame cleaner runs of all shards into outputs of a single run.
+
+    Every output file of shards is concatenated in order of shards and saved in the folder of outputs in the same
+    format. Rows of merged sites are ordered by site, in order of raw data files, so merged outputs contain the same
+    rows as a single run, only the order of rows of the same site differs.
+
+    :param config_path: Path to config file used by shards
+    :type config_path: str
+    :param shards: Number of shards
+    :type shards: int
+    """
+    def __init__(self, config_path: str, shards: int):
+        self.logger = logging.getLogger(ShardMerger.__name__)
+        self.config = read_config(config_path, self.logger)
+        self.shards = shards
+        self.site_order = FileReader(path=self.config['input']).file_names
+
+    def run(self) -> None:
+        """
+        Executes merging of outputs of all shards.
+        """
+        shard_paths = self.get_shard_paths()
+        for file_name in self.get_output_file_names(shard_paths[0]):
+            dataframes = [self.read_output(os.path.join(path, file_name)) for path in shard_paths]
+            self.save_output(file_name, self.merge_outputs(dataframes))
+
+    def get_shard_paths(self) -> List[str]:
+        """
+        Builds paths of folders with outputs of all shards and checks that they exist.
+
+        :return: Paths to folders with outputs of shards
+        :rtype: list
+        """
+        shard_paths = [get_shard_path(self.config['output'], (index, self.shards)) for index in range(self.shards)]
+        for path in shard_paths:
+            if not os.path.isdir(path):
+                raise MissingShardOutputException(path)
+        return shard_paths
+
+    def get_output_file_names(self, path: str) -> List[str]:
+        """
+        Lists output files saved by shard.
+
+        :param path: Path to folder with outputs of shard
+        :type path: str
+        :return: Names of output files
+        :rtype: list
+        """
+        return sorted(
+            file_name for file_name in os.listdir(path)
+            if file_name != MANIFEST_NAME and self.get_output_type(file_name) is not None
+        )
+
+    @staticmethod
+    def get_output_type(file_name: str) -> Optional[str]:
+        """
+        Resolves output type of file by extension.
+
+        :param file_name: Name of output file
+        :type file_name: str
+        :return: Output type, None if file is not an output
+        :rtype: str, optional
+        """
+        return OUTPUT_TYPES.get(os.path.splitext(strip_compression_extension(file_name))[1])
+
+    def read_output(self, path: str) -> pd.DataFrame:
+        """
+        Reads output file of shard, shards without rows of a site may not have its file.
+
+        :param path: Path to output file
+        :type path: str
+        :return: Data frame from output file, empty if there is no file
+        :rtype: pd.DataFrame
+        """
+        if not os.path.exists(path):
+            self.logger.info(f'No output file {path}')
+            return pd.DataFrame()
+        if self.get_output_type(path) == 'pickle':
+            return FileWriter.read_pickle(path)
+        return FileTypesResolver.resolve_from_filepath(path).open_file(filepath=path)
+
+    def merge_outputs(self, dataframes: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Concatenates outputs of shards, ordering rows of merged sites by site.
+
+        :param dataframes: Data frames from output files of all shards
+        :type dataframes: list
+        :return: Merged data frame
+        :rtype: pd.DataFrame
+        """
+        merged = pd.concat(dataframes, ignore_index=True)
+        if SITE_COLUMN in merged:
+            site_order = self.get_site_order(merged[SITE_COLUMN].tolist())
+            merged = merged.iloc[merged[SITE_COLUMN].map(site_order).argsort(kind='stable')].reset_index(drop=True)
+        return merged
+
+    def get_site_order(self, sites: List[str]) -> Dict[str, int]:
+        """
+        Orders sites as raw data files, sites without raw data file are placed after them.
+
+        :param sites: Sites of merged rows
+        :type sites: list
+        :return: Dictionary with sites and their positions
+        :rtype: dict
+        """
+        order = {site: position for position, site in enumerate(self.site_order)}
+        for site in sites:
+            order.setdefault(site, len(order))
+        return order
+
+    def save_output(self, file_name: str, data: pd.DataFrame) -> None:
+        """
+        Saves merged output in the folder of outputs, in the format of outputs of shards.
+
+        :param file_name: Name of output file
+        :type file_name: str
+        :param data: Merged data frame
+        :type data: pd.DataFrame
+        """
+        name, extension = os.path.splitext(strip_compression_extension(file_name))
+        file_writer = FileWriter(
+            path=self.config['output'],
+            output_type=OUTPUT_TYPES[extension],
+            compression=self.config.get('parquet_compression') or 'snappy',
+            output_compression=get_compression(file_name),
+            compression_level=self.config.get('compression_level'),
+        )
+        file_writer.save_file(data=data, name=name)
+        self.logger.info(f'Merged {self.shards} shards : {file_writer.saving_path} data : {len(data)}')
@@ -0,0 +1,108 @@
+import logging
+import os
+import pandas as pd
+
+from glob import glob
+from typing import Any
+from typing import Dict
+from typing import Optional
+
+from nlper.utils.hash_utils import hash_config
+
+
+STAGES = ('reduced', 'cleaned', 'trimmed')
+STAGE_CONFIG_KEYS = {
+    'reduced': (
+        'columns_to_skip', 'columns_to_merge_as_text', 'columns_to_merge_as_summary',
+        'deduplicate', 'deduplication_bands', 'deduplication_rows',
+    ),
+    'cleaned': (
+        'hide_numbers', 'number_replacement', 'lemmatize',
+        'length_prefilter', 'trim_data', 'text_lower_length_limit', 'summary_lower_length_limit',
+    ),
+    'trimmed': (
+        'trim_data', 'text_lower_length_limit', 'text_upper_length_limit',
+        'summary_lower_length_limit', 'summary_upper_length_limit',
+    ),
+}
+
+
+class StageCache:
+    """
+    Cache of data frames after every stage of data frame cleaner.
+
+    The key of every stage is built from the key of the previous stage, starting from the hash of raw data files,
+    and the config keys used by the stage. Changing the config of a stage invalidates only this and the following
+    stages, e.g. changing ``text_upper_length_limit`` re-runs only trimming from the cached cleaned data.
+    Only the latest entry of every stage is kept.
+
+    :param path: Path to folder with cached data frames
+    :type path: str
+    :param config: Configuration dictionary
+    :type config: dict
+    :param input_hash: Hash of raw data files
+    :type input_hash: str
+    """
+    def __init__(self, path: str, config: Dict[str, Any], input_hash: str):
+        self.logger = logging.getLogger(StageCache.__name__)
+        self.path = path
+        self.keys = {}
+        previous_key = input_hash
+        for stage in STAGES:
+            stage_config = {key: config.get(key) for key in STAGE_CONFIG_KEYS[stage]}
+            previous_key = hash_config(dict(stage_config, previous_stage=previous_key))
+            self.keys[stage] = previous_key
+
+    def get_path(self, stage: str) -> str:
+        """
+        Builds the path of cached data frames of stage.
+
+        :param stage: Name of stage
+        :type stage: str
+        :return: Path to cached data frames
+        :rtype: str
+        """
+        return os.path.join(self.path, f'{stage}_{self.keys[stage]}.pkl')
+
+    def get_last_completed_stage(self) -> Optional[str]:
+        """
+        Finds the last stage with cached data frames for current input and config.
+
+        :return: Name of stage, None if no stage is cached
+        :rtype: str, optional
+        """
+        for stage in reversed(STAGES):
+            if os.path.exists(self.get_path(stage)):
+                return stage
+        return None
+
+    def load(self, stage: str) -> Dict[str, pd.DataFrame]:
+        """
+        Loads cached data frames of stage.
+
+        :param stage: Name of stage
+        :type stage: str
+        :return: Dictionary with file names and data frames
+        :rtype: dict
+        """
+        self.logger.info(f'Loading cached {stage} data : {self.get_path(stage)}')
+        return pd.read_pickle(self.get_path(stage))
+
+    def save(self, stage: str, data: Dict[str, pd.DataFrame]) -> None:
+        """
+        Saves data frames of stage, replacing the previous entry of the stage only after the new one is written.
+
+        :param stage: Name of stage
+        :type stage: str
+        :param data: Dictionary with file names and data frames
+        :type data: dict
+        """
+        if not os.path.exists(self.path):
+            os.makedirs(self.path)
+        path = self.get_path(stage)
+        pd.to_pickle(data, path + '.tmp')
+        os.replace(path + '.tmp', path)
+        for previous_path in glob(os.path.join(self.path, f'{stage}_*.pkl')):
+            if previous_path != path:
+                os.remove(previous_path)
+        self.logger.info(f'Cached {stage} data : {path}')
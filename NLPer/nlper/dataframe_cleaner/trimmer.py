@@ -1,19 +1,15 @@
 import logging
-import numpy as np
 import pandas as pd
 
-from multiprocessing import cpu_count, Pool
-from tqdm import tqdm
 from typing import Any
 from typing import Dict
+from typing import Optional
 
+from nlper.dataframe_cleaner.worker_pool import WorkerPool
 from nlper.utils.time_utils import timeit
 from nlper.utils.trim_utils import TrimUtils
 
 
-tqdm.pandas(desc="Trimming")
-
-
 class Trimmer:
     """
     Trims texts by length in data frame.
@@ -24,13 +20,14 @@ class Trimmer:
     :type config: dict
     :param data: Data frame to trim
     :type data: pd.DataFrame
+    :param worker_pool: Pool of workers with loaded language model, if None then in-process pool is created on first use
+    :type worker_pool: WorkerPool, optional
     """
-    def __init__(self, config: Dict[str, Any], data: pd.DataFrame):
+    def __init__(self, config: Dict[str, Any], data: pd.DataFrame, worker_pool: Optional[WorkerPool] = None):
         self.logger = logging.getLogger(Trimmer.__name__)
         self.config = config
         self.data = data
-        self.n_cores = cpu_count() // 2
-        self.trim_utils = TrimUtils()
+        self.worker_pool = worker_pool
 
     @timeit
     def trim_dataframe(self) -> pd.DataFrame:
@@ -59,43 +56,13 @@ class Trimmer:
 
     def trim_to_upper_length_limit(self) -> None:
         """
-        Applies parallelization of text length trimming for data frame using python multiprocessing.
+        Applies parallelization of text length trimming for data frame columns using the worker pool.
         Trimming process is computationally expensive and thus parallelization greatly reduces the required time.
         """
-        self.trim_utils.lang_model = self.config['language_model']
-
-        dataframe_splits = np.array_split(self.data, self.n_cores)
-        pool = Pool(self.n_cores)
-        self.data = pd.concat(pool.map(self.trim_text_for_dataframe, dataframe_splits))
-        pool.close()
-        pool.join()
-
-    def trim_text_for_dataframe(self, data: pd.DataFrame) -> pd.DataFrame:
-        """
-        Splits text length trimming in data frame into separated columns.
-
-        :param data: Data frame to trim length
-        :type data: pd.DataFrame
-        :return: Data frame with trimmed text
-        :rtype: pd.DataFrame
-        """
-        for column_name in data:
-            data[column_name] = self.trim_text_for_column(
-                column_data=data[column_name],
+        if self.worker_pool is None:
+            self.worker_pool = WorkerPool(n_workers=0)
+        for column_name in self.data:
+            self.data[column_name] = self.worker_pool.trim(
+                self.data[column_name].tolist(),
                 threshold=self.config[f'{column_name}_upper_length_limit'],
-                trim_utils=self.trim_utils,
             )
-        return data
-
-    @staticmethod
-    def trim_text_for_column(column_data: pd.Series, threshold: int, trim_utils: TrimUtils) -> pd.Series:
-        """
-        Calls text length trimming on single data frame column using trimming utils.
-        Method uses ``progress_map`` to visualize progress of length trimming using tqdm.
-
-        :param column_data:
-        :param threshold:
-        :param trim_utils:
-        :return:
-        """
-        return column_data.progress_map(lambda x: trim_utils.trim_text_to_upper_length_threshold(x, threshold))
@@ -0,0 +1,262 @@
+import logging
+import math
+import numpy as np
+
+from functools import partial
+from multiprocessing import cpu_count, Pool
+from tqdm import tqdm
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from nlper.exceptions import InvalidConfigValueException
+from nlper.utils.clean_utils import CleanUtils
+from nlper.utils.lang_utils import LangUtils
+from nlper.utils.trim_utils import TrimUtils
+
+
+CHUNKS_PER_WORKER = 4
+MAX_TEXTS_PER_CHUNK = 100
+
+_worker_utils = None
+_initialization_error = None
+
+
+def create_utils() -> Tuple[CleanUtils, TrimUtils]:
+    """
+    Loads the language model from SpaCy and shares it between cleaning and trimming utils.
+
+    :return: Cleaning and trimming utils with loaded language model
+    :rtype: tuple
+    """
+    lang_model = LangUtils().set_language_model()
+    clean_utils = CleanUtils()
+    clean_utils.lang_model = lang_model
+    trim_utils = TrimUtils()
+    trim_utils.lang_model = lang_model
+    return clean_utils, trim_utils
+
+
+def initialize_worker() -> None:
+    """
+    Loads the language model from SpaCy once per worker process.
+
+    Error raised while loading the model is stored and raised by the first task instead, otherwise the pool would
+    keep restarting the failing workers.
+    """
+    global _worker_utils, _initialization_error
+    try:
+        _worker_utils = create_utils()
+    except Exception as e:
+        _initialization_error = e
+
+
+def get_worker_utils(utils: Optional[Tuple[CleanUtils, TrimUtils]] = None) -> Tuple[CleanUtils, TrimUtils]:
+    """
+    Returns given utils or utils loaded by the initializer of the worker process.
+
+    :param utils: Cleaning and trimming utils, if None then uses utils of the worker
+    :type utils: tuple, optional
+    :return: Cleaning and trimming utils
+    :rtype: tuple
+    """
+    if utils is not None:
+        return utils
+    if _initialization_error is not None:
+        raise _initialization_error
+    return _worker_utils
+
+
+def lemmatize_texts(texts: List[str], utils: Optional[Tuple[CleanUtils, TrimUtils]] = None) -> List[str]:
+    """
+    Lemmatizes chunk of texts using cleaning utils.
+
+    :param texts: Texts to lemmatize
+    :type texts: list
+    :param utils: Cleaning and trimming utils, if None then uses utils of the worker
+    :type utils: tuple, optional
+    :return: Lemmatized texts
+    :rtype: list
+    """
+    clean_utils, _ = get_worker_utils(utils)
+    return [clean_utils.lemmatize(text=text) for text in texts]
+
+
+def trim_texts(task: Tuple[List[str], int], utils: Optional[Tuple[CleanUtils, TrimUtils]] = None) -> List[str]:
+    """
+    Trims chunk of texts to maximum length threshold using trimming utils.
+
+    :param task: Texts to trim and maximum length threshold
+    :type task: tuple
+    :param utils: Cleaning and trimming utils, if None then uses utils of the worker
+    :type utils: tuple, optional
+    :return: Trimmed texts
+    :rtype: list
+    """
+    _, trim_utils = get_worker_utils(utils)
+    texts, threshold = task
+    return [trim_utils.trim_text_to_upper_length_threshold(text, threshold) for text in texts]
+
+
+def split_by_token_count(texts: Sequence[str], n_chunks: int) -> List[List[str]]:
+    """
+    Splits texts into contiguous chunks with similar total number of whitespace separated tokens.
+    Language model processing time grows with the number of tokens, so the chunks take similar time to process,
+    while splitting by rows gives chunks of very different cost for texts of different lengths.
+
+    :param texts: Texts to split
+    :type texts: sequence
+    :param n_chunks: Maximum number of chunks
+    :type n_chunks: int
+    :return: List of chunks preserving the order of texts
+    :rtype: list
+    """
+    if not len(texts):
+        return []
+    cumulative_tokens = np.cumsum([len(str(text).split()) + 1 for text in texts])
+    boundaries = np.searchsorted(cumulative_tokens, cumulative_tokens[-1] * np.arange(1, n_chunks) / n_chunks) + 1
+    return [
+        list(texts[start:end])
+        for start, end in zip(np.concatenate([[0], boundaries]), np.concatenate([boundaries, [len(texts)]]))
+        if end > start
+    ]
+
+
+class WorkerPool:
+    """
+    Long-lived pool of worker processes reused by cleaner and trimmer for all data frames.
+    Every worker loads the language model from SpaCy once in the pool initializer, so the model is not
+    pickled together with the tasks.
+
+    With ``n_workers`` equal to 0 the texts are processed in the current process, using the language model
+    kept by the pool object.
+
+    :param n_workers: Number of worker processes, by default half of the available cores
+    :type n_workers: int, optional
+    :param chunks_per_worker: Minimum number of token balanced chunks per worker
+    :type chunks_per_worker: int
+    """
+    def __init__(self, n_workers: Optional[int] = None, chunks_per_worker: int = CHUNKS_PER_WORKER):
+        self.logger = logging.getLogger(WorkerPool.__name__)
+        self.n_workers = self._validate_n_workers(n_workers)
+        self.chunks_per_worker = chunks_per_worker
+        self.pool = None
+        self.utils = None
+
+    def __enter__(self) -> 'WorkerPool':
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """
+        Starts worker processes if the pool is not running yet.
+        For in-process pool loads the language model, if loading fails it is retried on the next call.
+        """
+        if self.n_workers == 0:
+            if self.utils is None:
+                self.utils = create_utils()
+        elif self.pool is None:
+            self.logger.info(f'Starting {self.n_workers} workers')
+            self.pool = Pool(self.n_workers, initializer=initialize_worker)
+
+    def close(self) -> None:
+        """
+        Waits for the workers to finish and closes the pool.
+        """
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+
+    def lemmatize(self, texts: Sequence[str]) -> List[str]:
+        """
+        Lemmatizes texts in the worker processes.
+
+        :param texts: Texts to lemmatize
+        :type texts: sequence
+        :return: Lemmatized texts in the original order
+        :rtype: list
+        """
+        return self.map(lemmatize_texts, self.split(texts), desc='Lemmatizing')
+
+    def trim(self, texts: Sequence[str], threshold: int) -> List[str]:
+        """
+        Trims texts to maximum length threshold in the worker processes.
+
+        :param texts: Texts to trim
+        :type texts: sequence
+        :param threshold: Maximum length threshold
+        :type threshold: int
+        :return: Trimmed texts in the original order
+        :rtype: list
+        """
+        chunks = self.split(texts)
+        return self.map(trim_texts, [(chunk, threshold) for chunk in chunks], desc='Trimming',
+                        total=len(texts))
+
+    def map(self, function: Callable, chunks: List[Any], desc: Optional[str] = None,
+            total: Optional[int] = None) -> List[str]:
+        """
+        Applies function to every chunk and flattens the results.
+        Progress is shown using tqdm and counted in processed texts.
+
+        :param function: Module level function to apply on chunk
+        :type function: callable
+        :param chunks: Chunks of tasks
+        :type chunks: list
+        :param desc: Progress bar description
+        :type desc: str, optional
+        :param total: Number of texts in all chunks, by default sum of chunk lengths
+        :type total: int, optional
+        :return: Flattened results in the order of chunks
+        :rtype: list
+        """
+        self.start()
+        if self.pool:
+            results = self.pool.imap(function, chunks)
+        else:
+            results = map(partial(function, utils=self.utils), chunks)
+        processed = []
+        with tqdm(total=sum(map(len, chunks)) if total is None else total, desc=desc) as progress:
+            for chunk in results:
+                processed.extend(chunk)
+                progress.update(len(chunk))
+        return processed
+
+    def split(self, texts: Sequence[str]) -> List[List[str]]:
+        """
+        Splits texts into token balanced chunks, several per worker to even out the load and
+        small enough to report the progress frequently.
+
+        :param texts: Texts to split
+        :type texts: sequence
+        :return: Chunks of texts
+        :rtype: list
+        """
+        n_chunks = max(
+            max(self.n_workers, 1) * self.chunks_per_worker,
+            math.ceil(len(texts) / MAX_TEXTS_PER_CHUNK),
+        )
+        return split_by_token_count(texts, n_chunks)
+
+    @staticmethod
+    def _validate_n_workers(n_workers: Any) -> int:
+        """
+        Validates number of workers from config file.
+
+        :param n_workers: Number of workers, None for half of the available cores
+        :type n_workers: int, optional
+        :return: Number of workers
+        :rtype: int
+        """
+        if n_workers is None:
+            return max(cpu_count() // 2, 1)
+        if isinstance(n_workers, bool) or not isinstance(n_workers, int) or n_workers < 0:
+            raise InvalidConfigValueException('n_workers', n_workers)
+        return n_workers
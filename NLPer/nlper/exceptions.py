@@ -23,3 +23,24 @@ class MissingFilePathOrConfigException(NLPerException):
     Exception raised when missing both path to data file and config
     """
     _template = 'Provide config file or --filepath [FILEPATH] parameters'
+
+
+class InvalidConfigValueException(NLPerException):
+    """
+    Exception raised when the config file contains invalid value for a key.
+    """
+    _template = 'Invalid value {1} for config key {0}'
+
+
+class MissingDependencyException(NLPerException):
+    """
+    Exception raised when the optional package required to handle the file is not installed.
+    """
+    _template = 'Install {} package to handle {} file'
+
+
+class MissingShardOutputException(NLPerException):
+    """
+    Exception raised when the outputs of a shard are missing while merging shards.
+    """
+    _template = 'Missing outputs of shard in {}'
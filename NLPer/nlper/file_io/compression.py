@@ -0,0 +1,123 @@
+import bz2
+import gzip
+import io
+import lzma
+
+from typing import IO
+from typing import Optional
+
+from nlper.exceptions import MissingDependencyException
+from nlper.exceptions import UnsupportedFileTypeException
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+COMPRESSION_EXTENSIONS = {'gzip': '.gz', 'bz2': '.bz2', 'xz': '.xz', 'zstd': '.zst'}
+DEFAULT_GZIP_LEVEL = 6
+DEFAULT_ZSTD_LEVEL = 3
+
+
+def get_compression(path: str) -> Optional[str]:
+    """
+    Detects compression of file by its extension.
+
+    :param path: Path to file
+    :type path: str
+    :return: Name of compression, None for not compressed file
+    :rtype: str, optional
+    """
+    for compression, extension in COMPRESSION_EXTENSIONS.items():
+        if path.endswith(extension):
+            return compression
+    return None
+
+
+def get_compression_extension(compression: Optional[str]) -> str:
+    """
+    Takes extension added to names of files with compression.
+
+    :param compression: Name of compression, None or ``none`` for not compressed files
+    :type compression: str, optional
+    :return: Extension of compressed files, empty for not compressed files
+    :rtype: str
+    """
+    if compression in (None, 'none'):
+        return ''
+    if compression not in COMPRESSION_EXTENSIONS:
+        raise UnsupportedFileTypeException(compression)
+    return COMPRESSION_EXTENSIONS[compression]
+
+
+def strip_compression_extension(path: str) -> str:
+    """
+    Removes extension of compression from path.
+
+    :param path: Path to file
+    :type path: str
+    :return: Path without extension of compression
+    :rtype: str
+    """
+    compression = get_compression(path)
+    return path[:-len(COMPRESSION_EXTENSIONS[compression])] if compression else path
+
+
+def open_file(path: str, mode: str = 'r', compression_level: Optional[int] = None) -> IO:
+    """
+    Opens file, compressed or not, detected by extension. Compressed files are decompressed and compressed
+    while reading and writing, so the whole decompressed file is never kept in memory.
+    Files are opened in text mode with utf-8 encoding, unless ``b`` is in mode.
+    Appending to compressed files adds a new compressed stream, which is read together with the previous ones.
+
+    :param path: Path to file
+    :type path: str
+    :param mode: Mode of opening file, one of ``r``, ``w``, ``a`` with optional ``b`` or ``t``
+    :type mode: str
+    :param compression_level: Level of compression used while writing, if None then uses default of compression
+    :type compression_level: int, optional
+    :return: Opened file
+    :rtype: IO
+    """
+    compression = get_compression(path)
+    binary = 'b' in mode
+    encoding = None if binary else 'utf-8'
+    writing = mode[0] in ('w', 'a')
+    if compression is None:
+        return open(path, mode, encoding=encoding)
+    if compression == 'gzip':
+        level = compression_level if compression_level is not None else DEFAULT_GZIP_LEVEL
+        return gzip.open(path, mode if binary else mode[0] + 't', compresslevel=level, encoding=encoding)
+    if compression == 'bz2':
+        level = compression_level if compression_level is not None else 9
+        return bz2.open(path, mode if binary else mode[0] + 't', compresslevel=level, encoding=encoding)
+    if compression == 'xz':
+        preset = compression_level if writing else None
+        return lzma.open(path, mode if binary else mode[0] + 't', preset=preset, encoding=encoding)
+    return _open_zstd_file(path, mode[0], binary, compression_level)
+
+
+def _open_zstd_file(path: str, mode: str, binary: bool, compression_level: Optional[int] = None) -> IO:
+    """
+    Opens zstd compressed file using optional ``zstandard`` package.
+
+    :param path: Path to file
+    :type path: str
+    :param mode: Mode of opening file, one of ``r``, ``w``, ``a``
+    :type mode: str
+    :param binary: Flag whether to open file in binary mode
+    :type binary: bool
+    :param compression_level: Level of compression used while writing, if None then uses default of compression
+    :type compression_level: int, optional
+    :return: Opened file
+    :rtype: IO
+    """
+    if zstandard is None:
+        raise MissingDependencyException('zstandard', path)
+    if mode == 'r':
+        stream = zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), read_across_frames=True, closefd=True)
+    else:
+        level = compression_level if compression_level is not None else DEFAULT_ZSTD_LEVEL
+        stream = zstandard.ZstdCompressor(level=level).stream_writer(open(path, mode + 'b'), closefd=True)
+    return stream if binary else io.TextIOWrapper(stream, encoding='utf-8')
@@ -1,12 +1,29 @@
+import hashlib
 import json
 import logging
 import pandas as pd
 import os
 
 from glob import glob
+from multiprocessing import cpu_count, Pool
 from typing import Dict
+from typing import Iterator
 from typing import List
+from typing import Any
+from typing import Optional
 from typing import Sequence
+from typing import Set
+from typing import Tuple
+
+from nlper.file_io.compression import open_file
+from nlper.file_io.compression import strip_compression_extension
+from nlper.utils.hash_utils import FILE_HASH_SIZE
+from nlper.utils.hash_utils import hash_text
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 
 PROJECT_BASE_PATH = os.path.normpath(os.path.join(
@@ -19,20 +36,38 @@ class FileReader:
     Extraction of the raw data files into pandas data frames.
     Starts with fetching file paths and names.
 
+    Rows are parsed with ``orjson`` if it is installed, otherwise with ``json``. Only the selected columns are kept
+    from the parsed rows, and whole files are read by a pool of ``n_workers`` processes, one file per task.
+    Files compressed with gzip, bz2, xz or zstd, e.g. ``site.jsonl.gz``, are decompressed line by line while reading.
+
+    With ``shard`` given as index and number of shards, only rows of the shard are read. Rows are assigned to shards
+    by the hash of their ``url``, or of the whole row if it has no url, so every row belongs to exactly one shard.
+
     :param path: Path to folder with raw data files
     :type path: str
     :param allowed_extensions: Types of allowed files extension
     :type allowed_extensions: sequence
+    :param columns: Columns to keep from rows, if None then keeps all columns
+    :type columns: sequence, optional
+    :param n_workers: Number of processes reading files, by default one per file up to the number of cores
+    :type n_workers: int, optional
+    :param shard: Index of shard and number of shards, if None then reads all rows
+    :type shard: tuple, optional
     """
-    def __init__(self, path: str, allowed_extensions: Sequence = ('.jsonl', '.jl')):
+    def __init__(self, path: str, allowed_extensions: Sequence = ('.jsonl', '.jl'),
+                 columns: Optional[Sequence[str]] = None, n_workers: Optional[int] = None,
+                 shard: Optional[Tuple[int, int]] = None):
         self.allowed_extensions = allowed_extensions
+        self.columns = frozenset(columns) if columns is not None else None
+        self.n_workers = n_workers
+        self.shard = shard
         self.logger = logging.getLogger(FileReader.__name__)
         self.file_paths = self._get_files(path=path)
         self.file_names = self._get_file_names()
 
     def _get_files(self, path: str) -> List[str]:
         """
-        Takes files with allowed extensions in path.
+        Takes files with allowed extensions in path, also compressed ones.
 
         :param path: Path to folder with raw data files
         :type path: str
@@ -42,7 +77,7 @@ class FileReader:
         files = glob(os.path.normpath(os.path.join(PROJECT_BASE_PATH, path + '*')))
         return [
             file for file in files
-            if file.endswith(self.allowed_extensions)
+            if strip_compression_extension(file).endswith(self.allowed_extensions)
         ]
 
     def _get_file_names(self) -> List[str]:
@@ -57,7 +92,7 @@ class FileReader:
             for file in self.file_paths
         ]
 
-    def read_json_lines_files(self) -> Dict[str, pd.DataFrame]:
+    def read_json_lines_files(self, rows_to_read: Optional[Dict[str, Set[str]]] = None) -> Dict[str, pd.DataFrame]:
         """
         Reads json lines raw files to pandas data frames and stores it inside dict with name of file as key.
 
@@ -65,26 +100,218 @@ class FileReader:
 
         ``{ 'BBC' : pd.DataFrame(...), 'CNN' : pd.DataFrame(...) }``
 
-        :return: Dictionary with file names and data frames
+        :param rows_to_read: Hashes of rows to read for every file name, files without rows to read are skipped,
+            if None then reads all rows
+        :type rows_to_read: dict, optional
+        :return: Dictionary with file names and data frames, files without read rows are skipped
+        :rtype: dict
+        """
+        files = [
+            (file_name, file) for file_name, file in zip(self.file_names, self.file_paths)
+            if rows_to_read is None or rows_to_read.get(file_name)
+        ]
+        tasks = [
+            (file, self._get_rows_to_read(file_name, rows_to_read), self.columns, self.shard)
+            for file_name, file in files
+        ]
+        n_workers = min(self.n_workers or cpu_count(), len(tasks))
+        if n_workers > 1:
+            with Pool(n_workers) as pool:
+                dataframes = pool.starmap(FileReader._read_json_lines_dataframe, tasks)
+        else:
+            dataframes = [FileReader._read_json_lines_dataframe(*task) for task in tasks]
+        return {file_name: dataframe for (file_name, _), dataframe in zip(files, dataframes) if len(dataframe)}
+
+    def read_json_lines_chunks(
+            self, chunk_size: int, rows_to_read: Optional[Dict[str, Set[str]]] = None,
+    ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Reads json lines raw files in chunks of rows, so only a single chunk is kept in memory.
+        Every chunk is yielded together with the name of its file, chunks are indexed from 0.
+
+        :param chunk_size: Maximum number of rows in chunk
+        :type chunk_size: int
+        :param rows_to_read: Hashes of rows to read for every file name, files without rows to read are skipped,
+            if None then reads all rows
+        :type rows_to_read: dict, optional
+        :return: Generator of file names and data frames with chunks of rows
+        :rtype: iterator
+        """
+        for file_name, file in zip(self.file_names, self.file_paths):
+            if rows_to_read is not None and not rows_to_read.get(file_name):
+                continue
+            for rows in self._read_json_lines_file_chunks(
+                    file, chunk_size, self._get_rows_to_read(file_name, rows_to_read), self.columns, self.shard):
+                yield file_name, pd.DataFrame(rows)
+
+    def hash_json_lines_files(self) -> Dict[str, Tuple[str, List[str]]]:
+        """
+        Hashes content and every row of json lines raw files, without converting the rows.
+
+        :return: Dictionary with file names and tuples of file hash and list of row hashes
         :rtype: dict
         """
-        return dict(zip(
-            self.file_names,
-            (pd.DataFrame(self._read_json_lines_file(file)) for file in self.file_paths),
-        ))
+        hashes = {}
+        for file_name, file in zip(self.file_names, self.file_paths):
+            file_hash = hashlib.blake2b(digest_size=FILE_HASH_SIZE)
+            row_hashes = []
+            with open_file(file, 'r') as opened_file:
+                for line in opened_file:
+                    file_hash.update(line.encode('utf-8'))
+                    row_hashes.append(hash_text(self._strip_line(line)))
+            hashes[file_name] = (file_hash.hexdigest(), row_hashes)
+        return hashes
 
     @staticmethod
-    def _read_json_lines_file(file: str) -> List:
+    def _get_rows_to_read(file_name: str, rows_to_read: Optional[Dict[str, Set[str]]]) -> Optional[Set[str]]:
+        """
+        Takes hashes of rows to read for file name.
+
+        :param file_name: Name of file
+        :type file_name: str
+        :param rows_to_read: Hashes of rows to read for every file name, if None then reads all rows
+        :type rows_to_read: dict, optional
+        :return: Hashes of rows to read, None for all rows
+        :rtype: set, optional
+        """
+        if rows_to_read is None:
+            return None
+        return rows_to_read.get(file_name, set())
+
+    @staticmethod
+    def _strip_line(line: str) -> str:
+        """
+        Removes line endings from the line of json lines file.
+
+        :param line: Line of file
+        :type line: str
+        :return: Line without line endings
+        :rtype: str
+        """
+        return line.rstrip('\n|\r')
+
+    @staticmethod
+    def _project_row(row: Dict[str, Any], columns: Optional[Set[str]]) -> Dict[str, Any]:
+        """
+        Keeps only selected columns of converted row, in the order of the row.
+
+        :param row: Converted row
+        :type row: dict
+        :param columns: Columns to keep, if None then keeps all columns
+        :type columns: set, optional
+        :return: Row with selected columns
+        :rtype: dict
+        """
+        if columns is None:
+            return row
+        return {column: value for column, value in row.items() if column in columns}
+
+    @staticmethod
+    def get_row_shard(row: Dict[str, Any], line: str, shards: int) -> int:
+        """
+        Assigns row to shard by the hash of its url, or of the whole line if row has no url.
+
+        :param row: Converted row
+        :type row: dict
+        :param line: Line of file with the row
+        :type line: str
+        :param shards: Number of shards
+        :type shards: int
+        :return: Index of shard
+        :rtype: int
+        """
+        url = row.get('url') if isinstance(row, dict) else None
+        return int(hash_text(url if isinstance(url, str) else line), 16) % shards
+
+    @staticmethod
+    def _read_json_lines_rows(file: str, rows_to_read: Optional[Set[str]] = None,
+                              columns: Optional[Set[str]] = None, shard: Optional[Tuple[int, int]] = None) -> Iterator:
+        """
+        Reads json lines raw data file and yields converted rows.
+
+        :param file: Path to raw data file
+        :rtype file: str
+        :param rows_to_read: Hashes of rows to read, if None then reads all rows
+        :type rows_to_read: set, optional
+        :param columns: Columns to keep, if None then keeps all columns
+        :type columns: set, optional
+        :param shard: Index of shard and number of shards, if None then reads rows of all shards
+        :type shard: tuple, optional
+        :return: Generator of converted rows
+        :rtype: iterator
+        """
+        with open_file(file, 'r') as opened_file:
+            for line in opened_file:
+                line = FileReader._strip_line(line)
+                if rows_to_read is None or hash_text(line) in rows_to_read:
+                    row = json_loads(line)
+                    if shard is None or FileReader.get_row_shard(row, line, shard[1]) == shard[0]:
+                        yield FileReader._project_row(row, columns)
+
+    @staticmethod
+    def _read_json_lines_file_chunks(file: str, chunk_size: int, rows_to_read: Optional[Set[str]] = None,
+                                     columns: Optional[Set[str]] = None,
+                                     shard: Optional[Tuple[int, int]] = None) -> Iterator[List]:
+        """
+        Reads json lines raw data file and yields lists of at most ``chunk_size`` rows.
+
+        :param file: Path to raw data file
+        :rtype file: str
+        :param chunk_size: Maximum number of rows in chunk
+        :type chunk_size: int
+        :param rows_to_read: Hashes of rows to read, if None then reads all rows
+        :type rows_to_read: set, optional
+        :param columns: Columns to keep, if None then keeps all columns
+        :type columns: set, optional
+        :param shard: Index of shard and number of shards, if None then reads rows of all shards
+        :type shard: tuple, optional
+        :return: Generator of lists of converted rows
+        :rtype: iterator
+        """
+        rows = []
+        for row in FileReader._read_json_lines_rows(file, rows_to_read, columns, shard):
+            rows.append(row)
+            if len(rows) == chunk_size:
+                yield rows
+                rows = []
+        if rows:
+            yield rows
+
+    @staticmethod
+    def _read_json_lines_file(file: str, rows_to_read: Optional[Set[str]] = None,
+                              columns: Optional[Set[str]] = None, shard: Optional[Tuple[int, int]] = None) -> List:
         """
         Reads json lines raw data files and stores as lists of rows.
 
         :param file: Path to raw data file
         :rtype file: str
+        :param rows_to_read: Hashes of rows to read, if None then reads all rows
+        :type rows_to_read: set, optional
+        :param columns: Columns to keep, if None then keeps all columns
+        :type columns: set, optional
+        :param shard: Index of shard and number of shards, if None then reads rows of all shards
+        :type shard: tuple, optional
         :return: List of converted data files
         :rtype: list
         """
-        list_of_lines = []
-        with open(file, 'r', encoding='utf-8') as opened_file:
-            for line in opened_file:
-                list_of_lines.append(json.loads(line.rstrip('\n|\r')))
-        return list_of_lines
+        return list(FileReader._read_json_lines_rows(file, rows_to_read, columns, shard))
+
+    @staticmethod
+    def _read_json_lines_dataframe(file: str, rows_to_read: Optional[Set[str]] = None,
+                                   columns: Optional[Set[str]] = None,
+                                   shard: Optional[Tuple[int, int]] = None) -> pd.DataFrame:
+        """
+        Reads json lines raw data file to data frame, used as a task of the pool of processes.
+
+        :param file: Path to raw data file
+        :rtype file: str
+        :param rows_to_read: Hashes of rows to read, if None then reads all rows
+        :type rows_to_read: set, optional
+        :param columns: Columns to keep, if None then keeps all columns
+        :type columns: set, optional
+        :param shard: Index of shard and number of shards, if None then reads rows of all shards
+        :type shard: tuple, optional
+        :return: Data frame with converted rows
+        :rtype: pd.DataFrame
+        """
+        return pd.DataFrame(FileReader._read_json_lines_file(file, rows_to_read, columns, shard))
@@ -1,38 +1,62 @@
 import logging
 import pandas as pd
 import os
+import pickle
 
 from typing import Any
+from typing import Optional
 
 from nlper.exceptions import UnsupportedFileTypeException
+from nlper.file_io.compression import get_compression_extension
+from nlper.file_io.compression import open_file
 from nlper.file_io.writer import CsvWriter
+from nlper.file_io.writer import ParquetWriter
 from nlper.file_io.writer import PickleWriter
 
 
 class FileWriter:
     """
     Saving the data into pandas data frames.
-    Currently supports saving files in CSV and Pickle format.
+    Currently supports saving files in CSV, Pickle and Parquet format.
+
+    Data saved in append mode is added to files already written by the same writer, which allows saving data
+    frames chunk by chunk. The first chunk overwrites the file from previous runs, unless ``append_to_existing``
+    is set. Rows are appended to CSV files, while Pickle and Parquet files are read and saved again with the new rows.
+
+    CSV and Pickle files are compressed while writing with ``output_compression``, one of ``gzip``, ``bz2``,
+    ``xz`` or ``zstd``, and the extension of compression is added to the names of files.
 
     :param path: Path to folder to save files
     :type path: str
     :param output_type: Format of saved files
     :type output_type: str
+    :param compression: Compression codec of Parquet files
+    :type compression: str
+    :param output_compression: Compression of CSV and Pickle files, if None then files are not compressed
+    :type output_compression: str, optional
+    :param compression_level: Level of compression of CSV and Pickle files, if None then uses default of compression
+    :type compression_level: int, optional
     """
-    def __init__(self, path: str, output_type: str = 'pickle'):
+    def __init__(self, path: str, output_type: str = 'pickle', compression: str = 'snappy',
+                 output_compression: Optional[str] = None, compression_level: Optional[int] = None):
         self.path = path
         self.data = None
         self.prefix = None
         self.output_type = output_type
         self.logger = logging.getLogger(FileWriter.__name__)
-        self.csv_writer = CsvWriter()
-        self.pickle_writer = PickleWriter()
+        self.compression_extension = get_compression_extension(output_compression)
+        self.csv_writer = CsvWriter(compression_level=compression_level)
+        self.pickle_writer = PickleWriter(compression_level=compression_level)
+        self.parquet_writer = ParquetWriter(compression=compression)
         self.saving_path = None
+        self.append = False
+        self.append_to_existing = False
+        self.saved_paths = set()
 
     def resolve_output_format_type_and_save(self, data: pd.DataFrame, name: str) -> None:
         """
         Resolved output format type and saves a single data frame.
-        Currently supports saving only Pickle and CSV file types using python.
+        Currently supports saving only Pickle, CSV and Parquet file types using python.
 
         :param data: Data frame to save.
         :type data: pd.DataFrame
@@ -40,13 +64,50 @@ class FileWriter:
         :type name: str
         """
         if self.output_type == 'pickle':
-            self.saving_path = os.path.join(self.path, name + '.pkl')
+            self.saving_path = os.path.join(self.path, name + '.pkl' + self.compression_extension)
+            if self.should_append(self.saving_path):
+                data = pd.concat([self.read_pickle(self.saving_path), data], ignore_index=True)
             self.pickle_writer.write(path=self.saving_path, file=data)
         elif self.output_type == 'csv':
-            self.saving_path = os.path.join(self.path, name + '.csv')
-            self.csv_writer.write(path=self.saving_path, file=data)
+            self.saving_path = os.path.join(self.path, name + '.csv' + self.compression_extension)
+            if self.should_append(self.saving_path):
+                self.csv_writer.append(path=self.saving_path, file=data)
+            else:
+                self.csv_writer.write(path=self.saving_path, file=data)
+        elif self.output_type == 'parquet':
+            self.saving_path = os.path.join(self.path, name + '.parquet')
+            if self.should_append(self.saving_path):
+                data = pd.concat([pd.read_parquet(self.saving_path, engine='pyarrow'), data], ignore_index=True)
+            self.parquet_writer.write(path=self.saving_path, file=data)
         else:
             raise UnsupportedFileTypeException(self.output_type)
+        self.saved_paths.add(self.saving_path)
+
+    @staticmethod
+    def read_pickle(path: str) -> pd.DataFrame:
+        """
+        Reads data frame from Pickle file, compressed or not.
+
+        :param path: Path of Pickle file
+        :type path: str
+        :return: Read data frame
+        :rtype: pd.DataFrame
+        """
+        with open_file(path, 'rb') as opened_file:
+            return pickle.load(opened_file)
+
+    def should_append(self, path: str) -> bool:
+        """
+        Checks whether data should be appended to the file.
+
+        :param path: Path of file to save
+        :type path: str
+        :return: Flag whether to append data to existing file
+        :rtype: bool
+        """
+        if not self.append:
+            return False
+        return path in self.saved_paths or (self.append_to_existing and os.path.exists(path))
 
     def save_dataframe(self, name: str) -> None:
         """
@@ -68,10 +129,12 @@ class FileWriter:
             name_with_key = name + '_' + key
             self.resolve_output_format_type_and_save(self.data[key], name_with_key)
 
-    def save_file(self, data: Any, name: str, merge_data: Any = None, output_type: str = None) -> str:
+    def save_file(self, data: Any, name: str, merge_data: Any = None, output_type: str = None,
+                  append: bool = False) -> str:
         """
         Resolves how to process saving all data frames into files regarding the passed arguments.
         If ``merge_data`` is set to ``True``, all data frames are merged into single one.
+        If ``append`` is set to ``True``, data frames are appended to files saved before by this writer.
 
         :param data: Dictionary with file names as key and data frames as values, or single data frame.
         :type data: dict, pd.DataFrame
@@ -81,10 +144,13 @@ class FileWriter:
         :type merge_data: bool, optional
         :param output_type: Format to save data frame(s), if not specified using one from ``__init__`` method.
         :type output_type: str, optional
+        :param append: Flag to append data frames to files saved before
+        :type append: bool
         :return: File saving location
         :rtype: str
         """
         self.data = data
+        self.append = append
         if output_type:
             self.output_type = output_type
 
@@ -6,6 +6,7 @@ from typing import Any
 from nlper.exceptions import UnsupportedFileTypeException
 from nlper.file_io.reader import CsvReader
 from nlper.file_io.reader import HtmlReader
+from nlper.file_io.reader import ParquetReader
 from nlper.file_io.reader import TextReader
 from nlper.file_io.reader import JsonReader
 
@@ -18,6 +19,7 @@ class FileTypesResolver(Enum):
     html = HtmlReader()
     csv = CsvReader()
     json = JsonReader()
+    parquet = ParquetReader()
 
     @staticmethod
     def resolve(file_extension: str) -> Any:
@@ -7,22 +7,32 @@ from abc import abstractmethod
 from bs4 import BeautifulSoup
 
 from typing import Any
+from typing import Iterator
+from typing import Optional
+from typing import Sequence
+
+from nlper.file_io.compression import get_compression
+from nlper.file_io.compression import open_file
 
 
 class Reader(ABC):
     def __init__(self):
         self.file = None
+        self.columns = None
         self.logger = logging.getLogger(Reader.__name__)
 
-    def open_file(self, filepath: str) -> Any:
+    def open_file(self, filepath: str, columns: Optional[Sequence[str]] = None) -> Any:
         """
         Safely opens and returns file specified in file path.
 
         :param filepath: File path to open
         :type filepath: str
+        :param columns: Columns to read from tabular files, if None then reads all columns
+        :type columns: sequence, optional
         :return: Opened file or FileNotFoundError
         :rtype: any
         """
+        self.columns = list(columns) if columns is not None else None
         try:
             self._read_file(filepath=filepath)
         except FileNotFoundError as e:
@@ -47,12 +57,71 @@ class CsvReader(Reader):
 
     def _read_file(self, filepath: str) -> None:
         """
-        Reads CSV file from file path using pandas.
+        Reads CSV file from file path using pandas, only selected columns are parsed.
+        Compressed files are decompressed while parsing.
+
+        :param filepath: CSV file path
+        :type filepath: str
+        """
+        if get_compression(filepath) is None:
+            self.file = pd.read_csv(filepath, sep=',', usecols=self.columns)
+        else:
+            with open_file(filepath, 'r') as file:
+                self.file = pd.read_csv(file, sep=',', usecols=self.columns)
+
+    def read_chunks(self, filepath: str, chunk_size: int,
+                    columns: Optional[Sequence[str]] = None) -> Iterator[pd.DataFrame]:
+        """
+        Reads CSV file from file path in chunks of rows, so only a single chunk is kept in memory.
 
         :param filepath: CSV file path
         :type filepath: str
+        :param chunk_size: Maximum number of rows in chunk
+        :type chunk_size: int
+        :param columns: Columns to read, if None then reads all columns
+        :type columns: sequence, optional
+        :return: Generator of data frames with chunks of rows
+        :rtype: iterator
         """
-        self.file = pd.read_csv(filepath, sep=',')
+        columns = list(columns) if columns is not None else None
+        with open_file(filepath, 'r') as file:
+            yield from pd.read_csv(file, sep=',', usecols=columns, chunksize=chunk_size)
+
+
+class ParquetReader(Reader):
+    def __init__(self):
+        super(ParquetReader).__init__()
+        self.logger = logging.getLogger(ParquetReader.__name__)
+
+    def _read_file(self, filepath: str) -> None:
+        """
+        Reads Parquet file from file path using pandas with pyarrow engine.
+        Only selected columns are read from the file.
+
+        :param filepath: Parquet file path
+        :type filepath: str
+        """
+        self.file = pd.read_parquet(filepath, engine='pyarrow', columns=self.columns)
+
+    def read_chunks(self, filepath: str, chunk_size: int,
+                    columns: Optional[Sequence[str]] = None) -> Iterator[pd.DataFrame]:
+        """
+        Reads Parquet file from file path in batches of rows, so only a single batch is kept in memory.
+
+        :param filepath: Parquet file path
+        :type filepath: str
+        :param chunk_size: Maximum number of rows in batch
+        :type chunk_size: int
+        :param columns: Columns to read, if None then reads all columns
+        :type columns: sequence, optional
+        :return: Generator of data frames with batches of rows
+        :rtype: iterator
+        """
+        from pyarrow.parquet import ParquetFile
+
+        columns = list(columns) if columns is not None else None
+        for batch in ParquetFile(filepath).iter_batches(batch_size=chunk_size, columns=columns):
+            yield batch.to_pandas()
 
 
 class HtmlReader(Reader):
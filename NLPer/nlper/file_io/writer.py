@@ -1,11 +1,16 @@
 import json
 import logging
 import os
+import pickle
 
 from abc import ABC
 from abc import abstractmethod
 
 from typing import Any
+from typing import Optional
+
+from nlper.file_io.compression import get_compression
+from nlper.file_io.compression import open_file
 
 
 class Writer(ABC):
@@ -55,9 +60,16 @@ class Writer(ABC):
 
 
 class CsvWriter(Writer):
-    def __init__(self):
+    """
+    Files with extension of compression, e.g. ``data.csv.gz``, are compressed while writing.
+
+    :param compression_level: Level of compression, if None then uses default of compression
+    :type compression_level: int, optional
+    """
+    def __init__(self, compression_level: Optional[int] = None):
         super(CsvWriter).__init__()
         self.logger = logging.getLogger(CsvWriter.__name__)
+        self.compression_level = compression_level
 
     def _write_file(self, path: str, file: Any) -> None:
         """
@@ -68,7 +80,26 @@ class CsvWriter(Writer):
         :param file: CSV file to save
         :type file: any
         """
-        file.to_csv(path, index=False)
+        if get_compression(path) is None:
+            file.to_csv(path, index=False)
+        else:
+            with open_file(path, 'w', self.compression_level) as opened_file:
+                file.to_csv(opened_file, index=False)
+
+    def append(self, path: str, file: Any) -> None:
+        """
+        Appends rows of data frame to existing CSV file, without repeating the header.
+
+        :param path: Path of existing CSV file
+        :type path: str
+        :param file: Data frame with rows to append
+        :type file: any
+        """
+        if get_compression(path) is None:
+            file.to_csv(path, mode='a', header=False, index=False)
+        else:
+            with open_file(path, 'a', self.compression_level) as opened_file:
+                file.to_csv(opened_file, header=False, index=False)
 
 
 class JsonWriter(Writer):
@@ -89,10 +120,40 @@ class JsonWriter(Writer):
             json.dump(file, save_file)
 
 
+class ParquetWriter(Writer):
+    """
+    :param compression: Compression codec of Parquet file, e.g. ``snappy``, ``zstd``, ``gzip`` or ``none``
+    :type compression: str
+    """
+    def __init__(self, compression: str = 'snappy'):
+        super(ParquetWriter).__init__()
+        self.logger = logging.getLogger(ParquetWriter.__name__)
+        self.compression = compression
+
+    def _write_file(self, path: str, file: Any) -> None:
+        """
+        Writes Parquet file to path using pandas with pyarrow engine.
+
+        :param path: Path to save Parquet file
+        :type path: str
+        :param file: Parquet file to save
+        :type file: any
+        """
+        compression = None if self.compression in (None, 'none') else self.compression
+        file.to_parquet(path, engine='pyarrow', compression=compression, index=False)
+
+
 class PickleWriter(Writer):
-    def __init__(self):
+    """
+    Files with extension of compression, e.g. ``data.pkl.gz``, are compressed while writing.
+
+    :param compression_level: Level of compression, if None then uses default of compression
+    :type compression_level: int, optional
+    """
+    def __init__(self, compression_level: Optional[int] = None):
         super(PickleWriter).__init__()
         self.logger = logging.getLogger(PickleWriter.__name__)
+        self.compression_level = compression_level
 
     def _write_file(self, path: str, file: Any) -> None:
         """
@@ -103,4 +164,8 @@ class PickleWriter(Writer):
         :param file: Pickle file to save
         :type file: any
         """
-        file.to_pickle(path)
+        if get_compression(path) is None:
+            file.to_pickle(path)
+        else:
+            with open_file(path, 'wb', self.compression_level) as opened_file:
+                pickle.dump(file, opened_file, protocol=pickle.HIGHEST_PROTOCOL)
@@ -1,4 +1,8 @@
 import click
+
+from typing import Optional
+from typing import Tuple
+
 from nlper.exceptions import MissingFilePathOrConfigException
 
 
@@ -7,20 +11,67 @@ def cli():
     pass
 
 
+def parse_shard(ctx: click.Context, param: click.Parameter, value: Optional[str]) -> Optional[Tuple[int, int]]:
+    """
+    Parses shard given as I/N into index of shard and number of shards.
+
+    :param ctx: Click context
+    :type ctx: click.Context
+    :param param: Parsed parameter
+    :type param: click.Parameter
+    :param value: Shard given as I/N
+    :type value: str, optional
+    :return: Index of shard and number of shards
+    :rtype: tuple, optional
+    """
+    if value is None:
+        return None
+    try:
+        index, shards = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise click.BadParameter('shard should be given as I/N, e.g. 0/4')
+    if not 0 <= index < shards:
+        raise click.BadParameter('shard index should be from 0 to N - 1')
+    return index, shards
+
+
 @cli.command()
 @click.argument('config',
                 required=True,
                 type=click.Path(exists=True, file_okay=True, dir_okay=False))
-def clean_data(config: str):
+@click.option('--shard', default=None, callback=parse_shard,
+              help='Process only shard I of N shards of rows, given as I/N, shards are numbered from 0')
+def clean_data(config: str, shard: Optional[Tuple[int, int]]):
     """
     Clean data frames.
 
     :param config: Path to config file
     :type config: str
+    :param shard: Index of shard and number of shards
+    :type shard: tuple, optional
     """
     from nlper.dataframe_cleaner import main as dataframe_cleaner_app
 
-    dataframe_cleaner_app(config=config)
+    dataframe_cleaner_app(config=config, shard=shard)
+
+
+@cli.command()
+@click.argument('config',
+                required=True,
+                type=click.Path(exists=True, file_okay=True, dir_okay=False))
+@click.option('--shards', required=True, type=click.IntRange(min=1), help='Number of shards to merge')
+def merge_shards(config: str, shards: int):
+    """
+    Merge outputs of data frames cleaned in shards.
+
+    :param config: Path to config file used by shards
+    :type config: str
+    :param shards: Number of shards
+    :type shards: int
+    """
+    from nlper.dataframe_cleaner import merge_shards as merge_shards_app
+
+    merge_shards_app(config=config, shards=shards)
 
 
 @cli.command()
@@ -80,16 +131,46 @@ def split_train_test(config, filepath, valid):
 @click.argument('config',
                 required=True,
                 type=click.Path(exists=True, file_okay=True, dir_okay=False))
-def train(config: str):
+@click.option('--nproc', default=1, show_default=True, type=click.IntRange(min=1),
+              help='Number of training processes on this machine, data parallel over gloo backend')
+@click.option('--nnodes', default=1, show_default=True, type=click.IntRange(min=1),
+              help='Number of machines, all meeting at MASTER_ADDR and MASTER_PORT environment variables')
+@click.option('--node-rank', default=0, show_default=True, type=click.IntRange(min=0),
+              help='Rank of this machine, from 0, the machine of rank 0 is at MASTER_ADDR')
+def train(config: str, nproc: int, nnodes: int, node_rank: int):
     """
     Train model.
 
     :param config: Path to config file
     :type config: str
+    :param nproc: Number of training processes on this machine
+    :type nproc: int
+    :param nnodes: Number of machines
+    :type nnodes: int
+    :param node_rank: Rank of this machine
+    :type node_rank: int
     """
     from nlper.trainer import main as trainer_app
 
-    trainer_app(config=config)
+    if node_rank >= nnodes:
+        raise click.BadParameter('node rank should be from 0 to number of machines - 1', param_hint='--node-rank')
+    trainer_app(config=config, nproc=nproc, nnodes=nnodes, node_rank=node_rank)
+
+
+@cli.command()
+@click.argument('config',
+                required=True,
+                type=click.Path(exists=True, file_okay=True, dir_okay=False))
+def pipeline(config: str):
+    """
+    Clean data frames, split them into train, test and valid and train model in a single process.
+
+    :param config: Path to config file
+    :type config: str
+    """
+    from nlper.pipeline import main as pipeline_app
+
+    pipeline_app(config=config)
 
 
 if __name__ == '__main__':
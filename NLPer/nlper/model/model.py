@@ -1,9 +1,11 @@
 import logging
 import numpy as np
+import time
 import torch
 import torch.nn as nn
 
 from torch import optim
+from torch.nn.parallel import DistributedDataParallel
 from torch.nn.utils import clip_grad_norm_
 from tqdm import tqdm
 from typing import Any
@@ -14,12 +16,16 @@ from typing import Tuple
 from nlper.utils.lang_utils import Token
 from nlper.utils.torch_utils import get_device
 from nlper.utils.torch_utils import AVAILABLE_GPU
+from nlper.utils.torch_utils import autocast
+from nlper.utils.torch_utils import get_world_size
+from nlper.utils.torch_utils import is_main_process
 from nlper.model.architecture import EncoderRNN
 from nlper.model.architecture import DecoderRNN
 from nlper.model.architecture import Seq2Seq
 
 from nlper.utils.train_utils import calculate_rouge
 from nlper.utils.train_utils import draw_attention_matrix
+from nlper.utils.train_utils import get_number_of_batches
 
 
 class Model:
@@ -32,6 +38,9 @@ class Model:
     * model evaluation
     * saving and loading of a model
 
+    With ``mixed_precision`` in config, forward passes of training, evaluation and prediction run under bfloat16
+    autocast, while weights, optimizer state and loss stay in float32.
+
     :param config: Config dictionary
     :type config: dict
     :param vocab_config: Vocabulary config for model
@@ -44,6 +53,8 @@ class Model:
         self.encoder = None
         self.decoder = None
         self.seq2seq = None
+        self.distributed_seq2seq = None
+        self.mixed_precision = bool(config.get('mixed_precision'))
         self.criterion = None
         self.scheduler = None
         self.optimizer = None
@@ -69,6 +80,21 @@ class Model:
         )
         self.seq2seq = Seq2Seq(encoder=self.encoder, decoder=self.decoder).to(get_device())
 
+    def get_training_model(self) -> nn.Module:
+        """
+        Takes model for training steps. In distributed training, Seq2Seq model is wrapped in
+        ``DistributedDataParallel``, which averages gradients of all processes in backward pass. The wrapper is
+        created at the first training step, after loading trained parameters for fine tuning.
+
+        :return: Seq2Seq model or its distributed wrapper
+        :rtype: nn.Module
+        """
+        if get_world_size() == 1:
+            return self.seq2seq
+        if self.distributed_seq2seq is None:
+            self.distributed_seq2seq = DistributedDataParallel(self.seq2seq)
+        return self.distributed_seq2seq
+
     def create_optimizers_and_loss(self) -> None:
         """
         Initializes Adam optimizer for Seq2Seq model and learning rate scheduler as specified in config file.
@@ -87,15 +113,17 @@ class Model:
         Evaluates the trained Seq2Seq model performance.
 
         :param valid_iterator: Valid or test iterator
-        :type valid_iterator: torchtext.data.BucketIterator
+        :type valid_iterator: nlper.trainer.batch_iterator.BatchIterator
         :return:
         """
         with torch.no_grad():
             total_loss = []
             text_size = self.config['text_size']
-            for batch_id, batch in tqdm(enumerate(valid_iterator), total=len(valid_iterator), desc='Validation'):
+            for batch_id, batch in tqdm(
+                    enumerate(valid_iterator), total=get_number_of_batches(valid_iterator), desc='Validation'):
                 text, summary = self.get_text_summary_from_batch(batch)
-                output = self.seq2seq(text, summary, teacher_forcing_ratio=0.0)
+                with autocast(self.mixed_precision):
+                    output = self.seq2seq(text, summary, teacher_forcing_ratio=0.0)
                 loss = self.criterion(
                     output[1:].view(-1, text_size),
                     summary[1:].contiguous().view(-1),
@@ -107,12 +135,12 @@ class Model:
         """
         Obtains original text and target summary indices from batch and transforms to GPU
         :param batch:
-        :type batch: torchtext.data.batch.Batch
+        :type batch: nlper.trainer.batch_iterator.Batch
         :return: Text and summary indices for model
         :rtype: tuple
         """
-        text = batch.text[0].to(get_device())
-        summary = batch.summary[0].to(get_device())
+        text = batch.text[0].to(get_device(), non_blocking=True)
+        summary = batch.summary[0].to(get_device(), non_blocking=True)
         return text, summary
 
     def load_model(self, model_path: str, attention_param_path: str = None) -> None:
@@ -145,7 +173,7 @@ class Model:
         :return: summary text and attention weights
         :rtype: tuple
         """
-        with torch.no_grad():
+        with torch.no_grad(), autocast(self.mixed_precision):
             sequence = self.vocab_config.indices_from_text(text).unsqueeze(0)
             sequence_length = sequence.size(1)
             encoder_outputs, encoder_hidden = self.encoder(sequence.transpose(0, 1))
@@ -192,19 +220,23 @@ class Model:
         self.logger.info(f'Saved model {model_path}_{model_epoch}.pt')
         self.seq2seq.to(get_device())
 
-    def show_loss(self, batch_id: int, loss: torch.Tensor, train_iterator: Any) -> None:
+    def show_loss(self, batch_id: int, loss: torch.Tensor, train_iterator: Any, data_wait: float = 0.0) -> None:
         """
-        Logs loss value for specified batch.
+        Logs loss value and time of waiting for data for specified batch.
 
         :param batch_id: Number of batch
         :type batch_id: int
         :param loss: Loss value for batch
         :param loss: torch.Tensor
         :param train_iterator: Train iterator
-        :type train_iterator: torchtext.data.BucketIterator
+        :type train_iterator: nlper.trainer.batch_iterator.BatchIterator
+        :param data_wait: Time of waiting for batch in seconds
+        :type data_wait: float
         """
+        number_of_batches = get_number_of_batches(train_iterator) or '?'
         self.logger.info(
-            f'[{batch_id} / {len(train_iterator)}] Loss | {loss} | LR | {self.optimizer.param_groups[0]["lr"]}')
+            f'[{batch_id} / {number_of_batches}] Loss | {loss} | LR | {self.optimizer.param_groups[0]["lr"]} '
+            f'| Data wait | {data_wait * 1000:.1f} ms')
         if AVAILABLE_GPU:
             torch.cuda.empty_cache()
 
@@ -246,9 +278,12 @@ class Model:
     def train(self, train_iterator: Any, epoch: int = 0) -> List[torch.Tensor]:
         """
         Executes model training.
+        Time of waiting for every batch is measured, logged with loss and summed up after the epoch.
+        In distributed training, every process trains on its share of batches and only the main one shows
+        rouge and attention matrix.
 
         :param train_iterator: Iterator over training dataset
-        :type train_iterator: torchtext.data.BucketIterator
+        :type train_iterator: nlper.trainer.batch_iterator.BatchIterator
         :param epoch: Current training epoch.
         :type epoch: int
         :return: Training loss values for batches
@@ -256,12 +291,18 @@ class Model:
         """
         grad_clip = self.config['grad_clip']
         text_size = self.config['text_size']
-        self.seq2seq.train()
+        seq2seq = self.get_training_model()
+        seq2seq.train()
         total_loss = []
-        for batch_id, batch in tqdm(enumerate(train_iterator), total=len(train_iterator), desc='Training'):
+        data_wait = []
+        start = waiting = time.perf_counter()
+        for batch_id, batch in tqdm(
+                enumerate(train_iterator), total=get_number_of_batches(train_iterator), desc='Training'):
+            data_wait.append(time.perf_counter() - waiting)
             text, summary = self.get_text_summary_from_batch(batch)
             self.optimizer.zero_grad()
-            output = self.seq2seq(text, summary)
+            with autocast(self.mixed_precision):
+                output = seq2seq(text, summary)
             loss = self.criterion(
                 output[1:].view(-1, text_size),
                 summary[1:].contiguous().view(-1),
@@ -277,8 +318,24 @@ class Model:
             total_loss.append(loss.data)
 
             if batch_id % 10 == 0:
-                self.show_loss(batch_id, loss.data, train_iterator)
+                self.show_loss(batch_id, loss.data, train_iterator, data_wait[-1])
 
-            if batch_id % 400 == 0:
+            if batch_id % 400 == 0 and is_main_process():
                 self.show_rouge_and_attention_matrix(epoch, batch_id, text, summary)
+            waiting = time.perf_counter()
+        self.show_data_wait(data_wait, time.perf_counter() - start)
         return total_loss
+
+    def show_data_wait(self, data_wait: List[float], total_time: float) -> None:
+        """
+        Logs time of waiting for batches in epoch, mean per step and share of epoch time.
+
+        :param data_wait: Times of waiting for every batch in seconds
+        :type data_wait: list
+        :param total_time: Time of epoch in seconds
+        :type total_time: float
+        """
+        if data_wait:
+            self.logger.info(
+                f'Data wait | {sum(data_wait):.2f} s | {np.mean(data_wait) * 1000:.1f} ms per step '
+                f'| {sum(data_wait) / max(total_time, 1e-9):.1%} of epoch')
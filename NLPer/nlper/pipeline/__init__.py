@@ -0,0 +1,18 @@
+import sys
+
+from nlper.pipeline.application import Application
+
+
+def main(config: str):
+    """
+    Executes data frame cleaning, train, test, valid split and model training in a single process.
+
+    :param config: Path to config
+    :type config: str
+    """
+    application = Application(config_path=config)
+    application.run()
+
+
+if __name__ == '__main__':
+    main(sys.argv[1])
@@ -0,0 +1,86 @@
+import logging
+import pandas as pd
+
+from typing import Dict
+
+from nlper.dataframe_cleaner.application import Application as CleanerApplication
+from nlper.dataframe_cleaner.stage_cache import STAGES
+from nlper.utils.config_utils import read_config
+from nlper.utils.train_test_splitter import TrainTestSplitter
+
+
+logging.basicConfig(
+    format=f"%(asctime)s [%(levelname)s] | %(name)s | %(funcName)s: %(message)s",
+    level=logging.INFO,
+    datefmt='%I:%M:%S',
+)
+
+
+class Application:
+    """
+    End-to-end pipeline application, runs data frame cleaning, train, test, valid split and model training
+    in a single process, with configs of ``clean-data``, ``split-train-test`` and ``train`` given in a config file.
+
+    Data frames are passed between stages in memory, the trimmed data frame is not saved and read again by the
+    splitter and parts are not saved and parsed again by the trainer. With ``save_intermediate`` set in a config file,
+    outputs of cleaning and parts are also saved as configured for ``clean-data`` and ``split-train-test``.
+    All rows are kept in memory, so streaming and incremental modes of cleaning are not used.
+
+    :param config_path: Path to yaml config file
+    :type config_path: str
+    """
+    def __init__(self, config_path: str):
+        self.logger = logging.getLogger(Application.__name__)
+        self.config = read_config(config_path, self.logger)
+        self.save_intermediate = bool(self.config.get('save_intermediate'))
+
+    def run(self) -> None:
+        """
+        Executes cleaning, split and training.
+        """
+        data = self.clean_data()
+        parts = self.split_data(data)
+        self.train(parts)
+
+    def clean_data(self) -> pd.DataFrame:
+        """
+        Reduces, cleans and trims data frames of all sites and merges them.
+
+        :return: Merged data frame
+        :rtype: pd.DataFrame
+        """
+        cleaner = CleanerApplication(config_path=self.config['clean_config'])
+        if cleaner.config.get('streaming') or cleaner.config.get('incremental'):
+            self.logger.warning('Streaming and incremental modes are not used by pipeline')
+            cleaner.config['streaming'] = False
+        if not self.save_intermediate:
+            for stage in STAGES:
+                cleaner.config[f'save_{stage}'] = False
+        cleaner.run_stages()
+        cleaner.log_statistics()
+        data = pd.concat(list(cleaner.data.values()), ignore_index=True)
+        self.logger.info(f'Cleaned data : {len(data)}')
+        return data
+
+    def split_data(self, data: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """
+        Splits merged data frame into train, test and valid parts.
+
+        :param data: Merged data frame
+        :type data: pd.DataFrame
+        :return: Dictionary with names of parts and their rows
+        :rtype: dict
+        """
+        splitter = TrainTestSplitter(config=self.config['split_config'])
+        return splitter.split_dataframe(data, save=self.save_intermediate)
+
+    def train(self, parts: Dict[str, pd.DataFrame]) -> None:
+        """
+        Trains model on parts kept in memory.
+
+        :param parts: Dictionary with names of parts and their rows
+        :type parts: dict
+        """
+        from nlper.trainer.application import Application as TrainerApplication
+
+        TrainerApplication(config_path=self.config['train_config'], dataframes=parts).run()
@@ -1,11 +1,14 @@
 import sys
+import torch.distributed as dist
 
 from nlper.trainer.application import Application
+from nlper.trainer.distributed import init_from_environment
+from nlper.trainer.distributed import launch
 
 
-def main(config: str):
+def run_application(config: str) -> None:
     """
-    Executes the model training pipeline.
+    Runs the model train application.
 
     :param config: Path to config
     :type config: str
@@ -14,5 +17,31 @@ def main(config: str):
     application.run()
 
 
+def main(config: str, nproc: int = 1, nnodes: int = 1, node_rank: int = 0):
+    """
+    Executes the model training pipeline.
+    With more than one process or machine, the model is trained by ``nproc`` processes on every machine
+    with ``DistributedDataParallel``. A process started by ``torchrun`` joins its process group.
+
+    :param config: Path to config
+    :type config: str
+    :param nproc: Number of processes on this machine
+    :type nproc: int
+    :param nnodes: Number of machines
+    :type nnodes: int
+    :param node_rank: Rank of this machine, from 0
+    :type node_rank: int
+    """
+    if nproc > 1 or nnodes > 1:
+        launch(run_application, args=(config,), nproc=nproc, nnodes=nnodes, node_rank=node_rank)
+        return
+    initialized = init_from_environment()
+    try:
+        run_application(config)
+    finally:
+        if initialized:
+            dist.destroy_process_group()
+
+
 if __name__ == '__main__':
     main(sys.argv[1])
@@ -3,7 +3,9 @@ import os
 import pandas as pd
 
 from tqdm import tqdm
+from typing import Dict
 from typing import List
+from typing import Optional
 
 from nlper.file_io.writer import CsvWriter
 from nlper.file_io.writer import JsonWriter
@@ -11,6 +13,7 @@ from nlper.model.model import Model
 from nlper.trainer.data_loader import DataLoader
 from nlper.utils.config_utils import read_config
 from nlper.utils.lang_utils import VocabConfig
+from nlper.utils.torch_utils import is_main_process
 
 
 logging.basicConfig(
@@ -25,19 +28,22 @@ class Application:
     Model train application.
     Starts by initializing vocabulary config and writers for saving updated vocabulary and loss function results.
     By default model training starts with epoch number equal to 1, can be altered while fine tuning the model.
+    In distributed training, only the main process saves vocabulary, models and losses and evaluates the model.
 
     :param config_path: Path to yaml config file, by default loads example config
     :type config_path: str
+    :param dataframes: Data frames of ``train``, ``val`` and ``test`` parts, if None then parts are read from files
+    :type dataframes: dict, optional
     """
-    def __init__(self, config_path: str):
+    def __init__(self, config_path: str, dataframes: Optional[Dict[str, pd.DataFrame]] = None):
         self.logger = logging.getLogger(Application.__name__)
         self.config = read_config(config_path, self.logger)
+        self.dataframes = dataframes
         self.vocab_config = VocabConfig()
         self.csv_writer = CsvWriter()
         self.json_writer = JsonWriter()
         self.data_iterators = None
-        self.TEXT = None
-        self.SUMMARY = None
+        self.vocab = None
         self.model = None
         self.start_epoch = 1
 
@@ -45,7 +51,7 @@ class Application:
         """
         Executes model training process.
         """
-        self.data_iterators, self.TEXT, self.SUMMARY = DataLoader(config=self.config).load()
+        self.data_iterators, self.vocab = DataLoader(config=self.config, dataframes=self.dataframes).load()
         self.prepare_and_save_vocab()
         self.prepare_model()
         self.load_trained_model()
@@ -53,9 +59,11 @@ class Application:
 
     def prepare_and_save_vocab(self) -> None:
         """
-        Sets vocabulary from torchtext.Field and saves it to file.
+        Sets vocabulary built by data loader and saves it to file.
         """
-        self.vocab_config.set_vocab_from_field(self.TEXT)
+        self.vocab_config.set_vocab(self.vocab)
+        if not is_main_process():
+            return
         self.json_writer.write(
             path=os.path.join(self.config['vocab_output_path'], self.config['model_name'] + '.json'),
             file={
@@ -124,6 +132,8 @@ class Application:
 
         for epoch in tqdm(range(self.start_epoch, self.config['epochs'] + 1)):
             train_loss = self.model.train(train_iterator=train_iterator, epoch=epoch)
+            if not is_main_process():
+                continue
             valid_loss = self.model.evaluate(valid_iterator=valid_iterator)
 
             self.save_model(model_epoch=epoch)
@@ -131,6 +141,8 @@ class Application:
             self.save_loss(loss=train_loss, name='train', epoch=epoch)
             self.save_loss(loss=valid_loss, name='valid', epoch=epoch)
 
+        if not is_main_process():
+            return
         test_loss = self.model.evaluate(valid_iterator=test_iterator)
         self.logger.info(f'Test loss : {test_loss}')
         self.save_loss(loss=test_loss, name='test')
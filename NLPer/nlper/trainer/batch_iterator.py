@@ -0,0 +1,268 @@
+import logging
+import numpy as np
+import torch
+
+from collections import namedtuple
+from typing import Callable
+from typing import Iterator
+from typing import List
+from typing import Tuple
+
+from nlper.trainer.dataset import NumericalizedDataset
+from nlper.trainer.vocab import Vocab
+
+
+POOL_SIZE = 100
+BUCKET_GROWTH = 1.1
+
+Batch = namedtuple('Batch', ['text', 'summary'])
+
+
+def pad_sequences(get_sequence: Callable[[int], np.ndarray], examples: np.ndarray, vocab: Vocab) \
+        -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Builds tensor of sequences of examples, each with ``<sos>`` and ``<eos>`` tokens, padded with ``<pad>`` tokens
+    to the longest sequence, in the same layout as torchtext ``Field`` with ``include_lengths``.
+
+    :param get_sequence: Function taking indices of words of example
+    :type get_sequence: callable
+    :param examples: Indices of examples of batch
+    :type examples: np.ndarray
+    :param vocab: Vocabulary
+    :type vocab: Vocab
+    :return: Tensor of indices of size max length x batch size and tensor of lengths of sequences
+    :rtype: tuple
+    """
+    sequences = [get_sequence(example) for example in examples]
+    lengths = np.array([len(sequence) + 2 for sequence in sequences], dtype=np.int64)
+    padded = np.full((lengths.max(), len(sequences)), vocab.padding_index, dtype=np.int64)
+    padded[0] = vocab.start_index
+    for column, sequence in enumerate(sequences):
+        padded[1:len(sequence) + 1, column] = sequence
+        padded[len(sequence) + 1, column] = vocab.end_index
+    return torch.from_numpy(padded), torch.from_numpy(lengths)
+
+
+class BatchIterator:
+    """
+    Iterator over batches of numericalized dataset, replacing torchtext ``BucketIterator``.
+
+    With ``shuffle``, examples are shuffled and grouped in pools of ``POOL_SIZE`` batches, examples of every pool
+    are sorted by length of text and batches of every pool are shuffled, so batches contain texts of similar length.
+    Without ``shuffle``, all examples are sorted by length of text.
+    Batches have ``text`` and ``summary`` fields with tensors of indices and lengths, as torchtext batches.
+
+    Batches of an epoch are planned before the first batch, so the number of batches is known while iterating.
+    After every epoch the share of padding tokens and the spread of number of tokens of batches are logged.
+
+    In distributed training, every process plans the same batches and takes every ``world_size`` batch starting
+    from its ``rank``, the last batches are dropped so all processes have the same number of batches.
+
+    :param dataset: Numericalized dataset
+    :type dataset: NumericalizedDataset
+    :param vocab: Vocabulary
+    :type vocab: Vocab
+    :param batch_size: Number of examples in batch
+    :type batch_size: int
+    :param shuffle: Flag whether to shuffle examples every epoch
+    :type shuffle: bool
+    :param rank: Rank of the process in distributed training
+    :type rank: int
+    :param world_size: Number of processes in distributed training
+    :type world_size: int
+    """
+    def __init__(self, dataset: NumericalizedDataset, vocab: Vocab, batch_size: int, shuffle: bool = False,
+                 rank: int = 0, world_size: int = 1):
+        self.logger = logging.getLogger(BatchIterator.__name__)
+        self.dataset = dataset
+        self.vocab = vocab
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.rank = rank
+        self.world_size = world_size
+        self.batches = None
+
+    def __len__(self) -> int:
+        """
+        :return: Number of batches of current or next epoch
+        :rtype: int
+        """
+        batches = self.batches
+        if batches is None:
+            batches = self.batches = self.plan_batches()
+        return len(batches)
+
+    def __iter__(self) -> Iterator[Batch]:
+        if self.batches is None:
+            self.batches = self.plan_batches()
+        for examples in self.batches:
+            yield self.create_batch(examples)
+        self.log_padding(self.batches)
+        self.batches = None
+
+    def get_sequence_lengths(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Takes lengths of padded sequences of texts and summaries, including ``<sos>`` and ``<eos>`` tokens.
+
+        :return: Lengths of texts and lengths of summaries
+        :rtype: tuple
+        """
+        return self.dataset.text_lengths + 2, self.dataset.summary_lengths + 2
+
+    def plan_batches(self) -> List[np.ndarray]:
+        """
+        Groups examples into batches and takes batches of the process in distributed training.
+
+        :return: Indices of examples of every batch of the process
+        :rtype: list
+        """
+        batches = self.create_batches()
+        if self.world_size == 1:
+            return batches
+        return batches[self.rank:len(batches) - len(batches) % self.world_size:self.world_size]
+
+    def create_batches(self) -> List[np.ndarray]:
+        """
+        Groups examples into batches.
+
+        :return: Indices of examples of every batch
+        :rtype: list
+        """
+        text_lengths = self.dataset.text_lengths
+        if not self.shuffle:
+            examples = np.argsort(text_lengths, kind='stable')
+            return [examples[start:start + self.batch_size] for start in range(0, len(examples), self.batch_size)]
+        examples = np.random.permutation(len(self.dataset))
+        batches = []
+        pool_size = POOL_SIZE * self.batch_size
+        for pool_start in range(0, len(examples), pool_size):
+            pool = examples[pool_start:pool_start + pool_size]
+            pool = pool[np.argsort(text_lengths[pool], kind='stable')]
+            pool_batches = [pool[start:start + self.batch_size] for start in range(0, len(pool), self.batch_size)]
+            batches.extend(pool_batches[position] for position in np.random.permutation(len(pool_batches)))
+        return batches
+
+    def create_batch(self, examples: np.ndarray) -> Batch:
+        """
+        Builds padded tensors of texts and summaries of examples.
+
+        :param examples: Indices of examples
+        :type examples: np.ndarray
+        :return: Batch of texts and summaries
+        :rtype: Batch
+        """
+        return Batch(
+            text=pad_sequences(self.dataset.get_text, examples, self.vocab),
+            summary=pad_sequences(self.dataset.get_summary, examples, self.vocab),
+        )
+
+    def measure_padding(self, batches: List[np.ndarray]) -> Tuple[float, np.ndarray]:
+        """
+        Counts tokens of padded texts and summaries of batches.
+
+        :param batches: Indices of examples of every batch
+        :type batches: list
+        :return: Share of padding tokens in all tokens and number of tokens of every padded batch
+        :rtype: tuple
+        """
+        text_lengths, summary_lengths = self.get_sequence_lengths()
+        padded_tokens = np.array([
+            len(examples) * (text_lengths[examples].max() + summary_lengths[examples].max()) for examples in batches
+        ], dtype=np.int64)
+        tokens = sum(int(text_lengths[examples].sum() + summary_lengths[examples].sum()) for examples in batches)
+        return 1 - tokens / max(padded_tokens.sum(), 1), padded_tokens
+
+    def log_padding(self, batches: List[np.ndarray]) -> None:
+        """
+        Logs share of padding tokens and mean and standard deviation of number of tokens of padded batches.
+
+        :param batches: Indices of examples of every batch
+        :type batches: list
+        """
+        if not batches:
+            return
+        padding, padded_tokens = self.measure_padding(batches)
+        self.logger.info(f'Batches : {len(batches)} | padding : {padding:.1%} of tokens | '
+                         f'tokens per batch : {padded_tokens.mean():.0f} +- {padded_tokens.std():.0f}')
+
+
+class TokenBudgetBatchIterator(BatchIterator):
+    """
+    Iterator over batches of numericalized dataset with up to ``max_tokens`` tokens of padded texts and summaries
+    in every batch, instead of a fixed number of examples, so batches of long and short texts take similar memory
+    and time.
+
+    Examples are grouped into buckets of texts of similar length, each bucket ``BUCKET_GROWTH`` times wider than the
+    previous one, and sorted by bucket and length of summary, so both texts and summaries of a batch have similar
+    lengths. Consecutive examples are packed into a batch while the number of examples multiplied by the sum of
+    the longest text and summary fits in ``max_tokens``, an example above the limit makes a batch on its own.
+    With ``shuffle``, examples are shuffled and sorted within pools of ``POOL_SIZE`` times ``max_tokens`` tokens,
+    and batches of every pool are shuffled.
+
+    :param dataset: Numericalized dataset
+    :type dataset: NumericalizedDataset
+    :param vocab: Vocabulary
+    :type vocab: Vocab
+    :param max_tokens: Maximum number of tokens of padded texts and summaries in batch
+    :type max_tokens: int
+    :param shuffle: Flag whether to shuffle examples every epoch
+    :type shuffle: bool
+    :param rank: Rank of the process in distributed training
+    :type rank: int
+    :param world_size: Number of processes in distributed training
+    :type world_size: int
+    """
+    def __init__(self, dataset: NumericalizedDataset, vocab: Vocab, max_tokens: int, shuffle: bool = False,
+                 rank: int = 0, world_size: int = 1):
+        super(TokenBudgetBatchIterator, self).__init__(
+            dataset, vocab=vocab, batch_size=1, shuffle=shuffle, rank=rank, world_size=world_size)
+        self.logger = logging.getLogger(TokenBudgetBatchIterator.__name__)
+        self.max_tokens = max_tokens
+
+    def create_batches(self) -> List[np.ndarray]:
+        """
+        Groups examples into batches within the limit of tokens.
+
+        :return: Indices of examples of every batch
+        :rtype: list
+        """
+        text_lengths, summary_lengths = self.get_sequence_lengths()
+        buckets = np.floor(np.log(text_lengths) / np.log(BUCKET_GROWTH))
+        if not self.shuffle:
+            return self.pack(np.lexsort((summary_lengths, buckets)), text_lengths, summary_lengths)
+        examples = np.random.permutation(len(self.dataset))
+        pools = np.cumsum(text_lengths[examples] + summary_lengths[examples]) // (POOL_SIZE * self.max_tokens)
+        batches = []
+        for pool in np.split(examples, np.flatnonzero(np.diff(pools)) + 1):
+            pool = pool[np.lexsort((summary_lengths[pool], buckets[pool]))]
+            pool_batches = self.pack(pool, text_lengths, summary_lengths)
+            batches.extend(pool_batches[position] for position in np.random.permutation(len(pool_batches)))
+        return batches
+
+    def pack(self, examples: np.ndarray, text_lengths: np.ndarray, summary_lengths: np.ndarray) -> List[np.ndarray]:
+        """
+        Packs sorted examples into batches within the limit of tokens.
+
+        :param examples: Indices of examples sorted by length
+        :type examples: np.ndarray
+        :param text_lengths: Lengths of padded texts of all examples
+        :type text_lengths: np.ndarray
+        :param summary_lengths: Lengths of padded summaries of all examples
+        :type summary_lengths: np.ndarray
+        :return: Indices of examples of every batch
+        :rtype: list
+        """
+        batches = []
+        start = 0
+        max_text_length = max_summary_length = 0
+        for position, (text_length, summary_length) in enumerate(
+                zip(text_lengths[examples].tolist(), summary_lengths[examples].tolist())):
+            max_text_length = max(max_text_length, text_length)
+            max_summary_length = max(max_summary_length, summary_length)
+            if position > start and (position - start + 1) * (max_text_length + max_summary_length) > self.max_tokens:
+                batches.append(examples[start:position])
+                start = position
+                max_text_length, max_summary_length = text_length, summary_length
+        if start < len(examples):
+            batches.append(examples[start:])
+        return batches
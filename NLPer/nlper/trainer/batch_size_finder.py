@@ -0,0 +1,126 @@
+import logging
+import numpy as np
+import torch
+
+from typing import Any
+from typing import Dict
+
+from nlper.model.model import Model
+from nlper.trainer.batch_iterator import Batch
+from nlper.trainer.batch_iterator import BatchIterator
+from nlper.trainer.dataset import NumericalizedDataset
+from nlper.trainer.vocab import Vocab
+from nlper.utils.lang_utils import VocabConfig
+from nlper.utils.torch_utils import autocast
+
+
+# parameters, their gradients and two moments of Adam
+PARAMETER_COPIES = 4
+
+
+class BatchSizeFinder:
+    """
+    Finds the largest number of examples of micro-batches, whose training step fits in memory budget.
+
+    Training steps of the model built from config are probed on micro-batches of the longest examples of dataset,
+    the batches with the most padded tokens, so batches of every bucket fit. Memory of a step is measured as memory
+    of parameters, their gradients and moments of Adam, and of tensors saved in forward pass for backward pass,
+    including ``[T, B, V]`` logits, which grow with vocabulary. Numbers of examples are doubled until a step does not
+    fit, then the largest fitting number is found by bisection.
+
+    :param config: Trainer config with sizes of model
+    :type config: dict
+    :param vocab: Vocabulary
+    :type vocab: Vocab
+    :param memory_budget_mb: Memory budget of a training step in megabytes
+    :type memory_budget_mb: float
+    """
+    def __init__(self, config: Dict[str, Any], vocab: Vocab, memory_budget_mb: float):
+        self.logger = logging.getLogger(BatchSizeFinder.__name__)
+        self.config = config
+        self.vocab = vocab
+        self.memory_budget = memory_budget_mb * 2 ** 20
+
+    def find(self, dataset: NumericalizedDataset, max_batch_size: int) -> int:
+        """
+        Finds the largest number of examples, up to ``max_batch_size``, whose training step fits in memory budget.
+
+        :param dataset: Numericalized dataset of probed examples
+        :type dataset: NumericalizedDataset
+        :param max_batch_size: Maximum number of examples
+        :type max_batch_size: int
+        :return: Number of examples of micro-batches
+        :rtype: int
+        """
+        model = Model(config=self.config, vocab_config=VocabConfig(self.vocab.stoi, self.vocab.itos))
+        model.create_optimizers_and_loss()
+        model.seq2seq.train()
+        iterator = BatchIterator(dataset, vocab=self.vocab, batch_size=max_batch_size)
+        text_lengths, summary_lengths = iterator.get_sequence_lengths()
+        longest = np.argsort(-(text_lengths + summary_lengths), kind='stable')
+
+        def fits(batch_size: int) -> bool:
+            memory = self.measure_step(model, iterator.create_batch(longest[:batch_size]))
+            self.logger.info(f'Micro-batch of {batch_size} examples | {memory / 2 ** 20:.0f} MB')
+            return memory <= self.memory_budget
+
+        max_batch_size = min(max_batch_size, len(dataset))
+        if not fits(1):
+            raise ValueError(f'Training step of a single example does not fit in memory budget of '
+                             f'{self.memory_budget / 2 ** 20:.0f} MB')
+        low, high = 1, max_batch_size + 1
+        while low * 2 < high:
+            if not fits(low * 2):
+                high = low * 2
+                break
+            low *= 2
+        # low fits and high does not fit or exceeds the maximum
+        while high - low > 1:
+            middle = (low + high) // 2
+            if fits(middle):
+                low = middle
+            else:
+                high = middle
+        return low
+
+    def measure_step(self, model: Model, batch: Batch) -> int:
+        """
+        Measures memory of a training step of the model on batch, without updating the model.
+        Tensors saved for backward pass are counted once per storage, parameters are counted with their gradients
+        and moments of Adam. Out of memory error of a device counts as a step not fitting.
+
+        :param model: Model
+        :type model: Model
+        :param batch: Batch
+        :type batch: Batch
+        :return: Memory of training step in bytes
+        :rtype: int
+        """
+        parameters = list(model.seq2seq.parameters())
+        parameter_storages = {parameter.untyped_storage().data_ptr() for parameter in parameters}
+        saved_storages = {}
+
+        def save(tensor: torch.Tensor) -> torch.Tensor:
+            storage = tensor.untyped_storage()
+            if storage.data_ptr() not in parameter_storages:
+                saved_storages[storage.data_ptr()] = storage.nbytes()
+            return tensor
+
+        text, summary = model.get_text_summary_from_batch(batch)
+        try:
+            with torch.autograd.graph.saved_tensors_hooks(save, lambda tensor: tensor):
+                with autocast(model.mixed_precision):
+                    output = model.seq2seq(text, summary)
+                loss = model.criterion(
+                    output[1:].view(-1, self.config['text_size']),
+                    summary[1:].contiguous().view(-1),
+                )
+            loss.backward()
+        except RuntimeError as error:
+            if 'out of memory' not in str(error):
+                raise
+            return int(self.memory_budget) + 1
+        finally:
+            model.seq2seq.zero_grad(set_to_none=True)
+        parameter_memory = sum(parameter.numel() * parameter.element_size() for parameter in parameters)
+        return PARAMETER_COPIES * parameter_memory + sum(saved_storages.values())
@@ -1,116 +1,315 @@
 import logging
+import os
+import pandas as pd
+import re
 
+from collections import Counter
 from typing import Any
 from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
 from typing import Tuple
-from torchtext.data import BucketIterator
-from torchtext.data import Dataset
-from torchtext.data import Field
-from torchtext.data import TabularDataset
 
-from nlper.utils.lang_utils import LangUtils
-from nlper.utils.lang_utils import Token
+from nlper.trainer.batch_iterator import BatchIterator
+from nlper.trainer.batch_iterator import POOL_SIZE
+from nlper.trainer.batch_iterator import TokenBudgetBatchIterator
+from nlper.trainer.dataset import NumericalizedDataset
+from nlper.trainer.dataset_cache import DatasetCache
+from nlper.trainer.prefetcher import PrefetchIterator
+from nlper.trainer.streaming_dataset import read_text_chunks
+from nlper.trainer.streaming_dataset import StreamingBatchIterator
+from nlper.trainer.streaming_dataset import StreamingDataset
+from nlper.trainer.vocab import count_words
+from nlper.trainer.vocab import Vocab
+from nlper.utils.hash_utils import hash_config
+from nlper.utils.hash_utils import hash_file
+from nlper.utils.torch_utils import get_rank
+from nlper.utils.torch_utils import get_world_size
+from nlper.utils.torch_utils import main_process_first
+
+
+SPLITS = ('train', 'val', 'test')
+SPLIT_FILE_PATTERN = r'{split}(?:_(\d+))?\.(?:csv|parquet)$'
 
 
 class DataLoader:
     """
     Data loader for model.
-    Starts by initializing language utils. By default specifies disabled SpaCy language model options are
-    ``ner`` and ``parser`` which significantly accelerates model training.
+
+    Reads train, valid and test parts from csv or parquet files in ``train_test_val_dir``, a part saved in shards
+    by the splitter, like ``train_0.csv``, ``train_1.csv``, is read from all its files. Builds vocabulary on texts
+    of train part and converts texts and summaries of all parts into indices of words. Texts are already tokenized
+    by the data frame cleaner, so words are split by whitespaces. Words are counted and converted in chunks of texts
+    by ``data_workers`` threads specified in a config file, by default one per core.
+
+    With ``dataset_cache_path`` specified in a config file, numericalized datasets and vocabulary are cached, and runs
+    with the same files and vocabulary config, including fine tuning, load them instead of reading the files.
+
+    With ``max_tokens_per_batch`` specified in a config file, batches are packed up to that number of tokens of
+    padded texts and summaries instead of ``batch_size`` examples.
+
+    With ``streaming`` in a config file, train part is not kept in memory. Vocabulary is built in a pass over chunks
+    of train files, and in training the files are streamed in chunks, shuffled through a buffer of
+    ``shuffle_buffer_size`` examples and converted into indices of words on the fly, so memory does not depend
+    on the size of train part.
+
+    With ``prefetch_batches`` specified in a config file, that many next batches are prepared in background while
+    the current one is used.
+
+    In distributed training, every process takes its share of train batches, and with ``dataset_cache_path``
+    the main process caches datasets first, so other processes load them.
+
+    With ``dataframes`` given, parts are taken from data frames kept in memory instead of csv files and
+    are not cached.
 
     :param config: Data loader config
     :type config: dict
+    :param dataframes: Data frames of ``train``, ``val`` and ``test`` parts, if None then parts are read from files
+    :type dataframes: dict, optional
     """
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], dataframes: Optional[Dict[str, pd.DataFrame]] = None):
         self.logger = logging.getLogger(DataLoader.__name__)
         self.config = config
-        self.langUtils = LangUtils()
-        self.disabled_language_options = ['ner', 'parser']
+        self.dataframes = dataframes
         self.iterators = None
-        self.TEXT = None
-        self.SUMMARY = None
 
-    def load(self) -> Tuple[Tuple[BucketIterator, BucketIterator, BucketIterator], Field, Field]:
+    def load(self) -> Tuple[Tuple[BatchIterator, BatchIterator, BatchIterator], Vocab]:
         """
-        Calls language generation and data iterators creation for data loader.
+        Calls datasets loading and data iterators creation for data loader.
 
-        :return: Dataset iterators and fields with vocabulary
+        :return: Train, valid and test iterators and vocabulary
         :rtype: tuple
         """
-        self.set_language()
-        self.prepare_fields()
-        self.load_splits_and_iterators()
+        datasets, vocab = self.load_datasets()
+        self.config['text_size'] = len(vocab)
         self.logger.info(f'Length of vocabulary {self.config["text_size"]}')
-        return self.iterators, self.TEXT, self.SUMMARY
+        self.load_iterators(datasets=datasets, vocab=vocab)
+        return self.iterators, vocab
 
-    def build_vocab(self, dataset: TabularDataset) -> None:
+    def load_datasets(self) -> Tuple[Dict[str, NumericalizedDataset], Vocab]:
         """
-        Builds vocabulary on dataset with definined special tokens and word frequency.
-        The frequency is a minimum number of times a word must appear in dataset, to be placed into vocabulary.
+        Loads numericalized datasets from cache, or builds them from parts and saves them in cache if specified.
+        In distributed training, the main process loads or builds cached datasets first, and other processes load
+        them from cache after it.
 
-        :param dataset: Dataset to build vocabulary on
-        :type dataset: torchtext.TabularDataset
+        :return: Dictionary with names of parts and datasets, and vocabulary
+        :rtype: tuple
         """
-        self.TEXT.build_vocab(
-            dataset, specials=[Token.Number.value], min_freq=self.config['min_frequency_of_words_in_vocab'])
-        self.SUMMARY.vocab = self.TEXT.vocab
-        self.config['text_size'] = len(self.TEXT.vocab.itos)
+        if self.dataframes is not None:
+            return self.build_datasets(self.dataframes)
+        dataset_cache = self.create_dataset_cache()
+        if dataset_cache is None:
+            return self.build_datasets_from_files()
+        with main_process_first():
+            if dataset_cache.exists():
+                return dataset_cache.load()
+            datasets, vocab = self.build_datasets_from_files()
+            dataset_cache.save(datasets, vocab)
+            return datasets, vocab
 
-    def load_iterators(self, splits: Tuple[Dataset, Dataset, Dataset]) -> None:
+    def build_datasets_from_files(self) -> Tuple[Dict[str, NumericalizedDataset], Vocab]:
         """
-        Obtains iterators for train, test, valid splits using torchtext BucketIterator
+        Builds datasets from files of parts.
+        With ``streaming``, train part is only used to build vocabulary and is not in datasets.
 
-        :param splits: Tuple of tabular datasets for particular type of split
-        :type splits: tuple
+        :return: Dictionary with names of parts and datasets, and vocabulary
+        :rtype: tuple
         """
-        self.iterators = BucketIterator.splits(
-            datasets=splits,
-            batch_size=self.config['batch_size'],
-            repeat=False,
-            sort_key=lambda x: len(x.text),
-            sort_within_batch=False
-        )
+        if self.config.get('streaming'):
+            return self.build_datasets(self.read_splits(SPLITS[1:]), vocab=self.build_streaming_vocab())
+        return self.build_datasets(self.read_splits())
 
-    def load_splits(self) -> Tuple[Dataset, Dataset, Dataset]:
+    def get_split_paths(self) -> Dict[str, List[str]]:
         """
-        Loads train, test, valid splits using torchtext TabularDataset feature with
+        Finds csv or parquet files of parts, a part saved in shards has a file for every shard.
 
-        :return:
+        :return: Dictionary with names of parts and paths of their files, ordered by shards
+        :rtype: dict
         """
-        return TabularDataset.splits(
-            skip_header=True,
-            path=self.config['train_test_val_dir'], format='csv',
-            fields=[
-                (self.config['dataframes_field_names'][0], self.TEXT),
-                (self.config['dataframes_field_names'][1], self.SUMMARY),
-            ],
-            train='train.csv', validation='val.csv', test='test.csv'
-        )
+        directory = self.config['train_test_val_dir']
+        names = os.listdir(directory)
+        paths = {}
+        for split in SPLITS:
+            matches = [re.match(SPLIT_FILE_PATTERN.format(split=split), name) for name in names]
+            matches = sorted((match for match in matches if match), key=lambda match: int(match.group(1) or -1))
+            if not matches:
+                raise FileNotFoundError(os.path.join(directory, f'{split}.csv'))
+            paths[split] = [os.path.join(directory, match.group(0)) for match in matches]
+        return paths
+
+    def create_dataset_cache(self) -> Optional[DatasetCache]:
+        """
+        Creates cache of datasets in ``dataset_cache_path`` specified in a config file.
+
+        :return: Cache of datasets
+        :rtype: DatasetCache, optional
+        """
+        if not self.config.get('dataset_cache_path'):
+            return None
+        input_hash = hash_config({
+            split: [hash_file(path) for path in paths] for split, paths in self.get_split_paths().items()
+        })
+        return DatasetCache(path=self.config['dataset_cache_path'], config=self.config, input_hash=input_hash)
+
+    def read_splits(self, splits: Sequence[str] = SPLITS) -> Dict[str, pd.DataFrame]:
+        """
+        Reads parts from csv or parquet files, empty cells are read as empty texts.
+
+        :param splits: Names of parts to read
+        :type splits: sequence
+        :return: Dictionary with names of parts and data frames
+        :rtype: dict
+        """
+        split_paths = self.get_split_paths()
+        return {
+            split: pd.concat([self.read_split_file(path) for path in split_paths[split]], ignore_index=True)
+            for split in splits
+        }
 
-    def load_splits_and_iterators(self) -> None:
+    def read_split_file(self, path: str) -> pd.DataFrame:
         """
-        Calls train, test and valid split loading; vocabulary initialization and loading data iterators.
+        Reads text and summary columns of file of part.
 
+        :param path: Path to csv or parquet file
+        :type path: str
+        :return: Data frame with texts and summaries
+        :rtype: pd.DataFrame
         """
-        train, valid, test = self.load_splits()
-        self.build_vocab(dataset=train)
-        self.load_iterators(splits=(train, valid, test))
+        columns = self.config['dataframes_field_names']
+        if path.endswith('.parquet'):
+            return pd.read_parquet(path, columns=columns).fillna('')
+        return pd.read_csv(path, usecols=columns, dtype=str, keep_default_na=False)
 
-    def prepare_fields(self) -> None:
+    def build_vocab(self, texts: Sequence[str]) -> Vocab:
         """
-        Initializes torchtext Fields with base token and language
+        Builds vocabulary on texts with defined special tokens and word frequency.
+        The frequency is a minimum number of times a word must appear in texts, to be placed into vocabulary.
+
+        :param texts: Texts to build vocabulary on
+        :type texts: sequence
+        :return: Vocabulary
+        :rtype: Vocab
+        """
+        counter = count_words(texts, n_workers=self.config.get('data_workers'))
+        return Vocab.from_counter(counter, min_frequency=self.config['min_frequency_of_words_in_vocab'])
+
+    def build_streaming_vocab(self) -> Vocab:
         """
-        self.TEXT = Field(tokenize=str.split, include_lengths=True, tokenizer_language='pl',
-                          init_token=Token.StartOfSequence.value, eos_token=Token.EndOfSequence.value)
-        self.SUMMARY = Field(tokenize=str.split, include_lengths=True, tokenizer_language='pl',
-                             init_token=Token.StartOfSequence.value, eos_token=Token.EndOfSequence.value)
+        Builds vocabulary on texts of train part read in chunks, so only a single chunk is kept in memory.
 
-    def set_language(self) -> None:
+        :return: Vocabulary
+        :rtype: Vocab
         """
-        Sets SpaCy language model to Polish with disables computation expensive language options.
+        text_column, _ = self.config['dataframes_field_names']
+        counter = Counter()
+        for texts, in read_text_chunks(self.get_split_paths()['train'], columns=[text_column]):
+            counter.update(count_words(texts, n_workers=self.config.get('data_workers')))
+        return Vocab.from_counter(counter, min_frequency=self.config['min_frequency_of_words_in_vocab'])
 
-        Default disabled language options
-        * ``ner``
-        * ``parser``
+    def build_datasets(self, dataframes: Dict[str, pd.DataFrame], vocab: Optional[Vocab] = None) \
+            -> Tuple[Dict[str, NumericalizedDataset], Vocab]:
+        """
+        Builds vocabulary on texts of train part, if not given, and converts texts and summaries of all parts
+        into indices of words. Summaries use the vocabulary of texts.
+
+        :param dataframes: Dictionary with names of parts and data frames
+        :type dataframes: dict
+        :param vocab: Vocabulary, if None then built on texts of train part
+        :type vocab: Vocab, optional
+        :return: Dictionary with names of parts and datasets, and vocabulary
+        :rtype: tuple
         """
-        self.langUtils.set_language_model(disable_options=self.disabled_language_options)
+        text_column, summary_column = self.config['dataframes_field_names']
+        n_workers = self.config.get('data_workers')
+        if vocab is None:
+            vocab = self.build_vocab(dataframes['train'][text_column].fillna(''))
+        datasets = {
+            split: NumericalizedDataset(
+                text=vocab.numericalize(dataframe[text_column].fillna(''), n_workers=n_workers),
+                summary=vocab.numericalize(dataframe[summary_column].fillna(''), n_workers=n_workers),
+            )
+            for split, dataframe in dataframes.items()
+        }
+        return datasets, vocab
+
+    def load_iterators(self, datasets: Dict[str, NumericalizedDataset], vocab: Vocab) -> None:
+        """
+        Obtains iterators for train, valid and test datasets, examples of train dataset are shuffled.
+        In distributed training, every process takes its share of train batches.
+        Batches have ``batch_size`` examples, or up to ``max_tokens_per_batch`` tokens if specified, and are
+        prefetched if ``prefetch_batches`` is specified. With ``streaming``, train files are streamed.
+
+        :param datasets: Dictionary with names of parts and datasets
+        :type datasets: dict
+        :param vocab: Vocabulary
+        :type vocab: Vocab
+        """
+        if self.config.get('max_tokens_per_batch'):
+            self.logger.info(f'Batches of up to {self.config["max_tokens_per_batch"]} tokens')
+        if self.config.get('streaming') and self.dataframes is None:
+            train_iterator = self.create_streaming_iterator(vocab)
+        else:
+            train_iterator = self.create_iterator(
+                datasets['train'], vocab=vocab, shuffle=True, rank=get_rank(), world_size=get_world_size())
+        iterators = (train_iterator,) + tuple(
+            self.create_iterator(datasets[split], vocab=vocab, shuffle=False) for split in SPLITS[1:]
+        )
+        prefetch_batches = self.config.get('prefetch_batches')
+        if prefetch_batches:
+            self.logger.info(f'Prefetching {prefetch_batches} batches')
+            iterators = tuple(PrefetchIterator(iterator, n_batches=prefetch_batches) for iterator in iterators)
+        self.iterators = iterators
+
+    def create_iterator(self, dataset: NumericalizedDataset, vocab: Vocab, shuffle: bool, rank: int = 0,
+                        world_size: int = 1) -> BatchIterator:
+        """
+        Creates iterator over batches of ``batch_size`` examples, or up to ``max_tokens_per_batch`` tokens.
+
+        :param dataset: Numericalized dataset
+        :type dataset: NumericalizedDataset
+        :param vocab: Vocabulary
+        :type vocab: Vocab
+        :param shuffle: Flag whether to shuffle examples every epoch
+        :type shuffle: bool
+        :param rank: Rank of the process in distributed training, which takes its share of batches
+        :type rank: int
+        :param world_size: Number of processes in distributed training
+        :type world_size: int
+        :return: Iterator over batches
+        :rtype: BatchIterator
+        """
+        max_tokens = self.config.get('max_tokens_per_batch')
+        if max_tokens:
+            return TokenBudgetBatchIterator(
+                dataset, vocab=vocab, max_tokens=max_tokens, shuffle=shuffle, rank=rank, world_size=world_size)
+        return BatchIterator(
+            dataset, vocab=vocab, batch_size=self.config['batch_size'], shuffle=shuffle, rank=rank,
+            world_size=world_size)
+
+    def create_streaming_iterator(self, vocab: Vocab) -> StreamingBatchIterator:
+        """
+        Creates iterator over batches of train files streamed in chunks, batches are formed within pools of
+        ``POOL_SIZE`` times ``batch_size`` examples.
+
+        :param vocab: Vocabulary
+        :type vocab: Vocab
+        :return: Iterator over batches
+        :rtype: StreamingBatchIterator
+        """
+        paths = self.get_split_paths()['train']
+        self.logger.info(f'Streaming train files : {paths}')
+        dataset = StreamingDataset(
+            paths=paths,
+            columns=self.config['dataframes_field_names'],
+            vocab=vocab,
+            shuffle=True,
+            shuffle_buffer_size=self.config.get('shuffle_buffer_size') or 10000,
+            n_workers=self.config.get('data_workers'),
+        )
+        return StreamingBatchIterator(
+            dataset,
+            create_iterator=lambda pool: self.create_iterator(
+                pool, vocab=vocab, shuffle=True, rank=get_rank(), world_size=get_world_size()),
+            pool_size=POOL_SIZE * self.config['batch_size'],
+        )
@@ -0,0 +1,66 @@
+import numpy as np
+
+from typing import Tuple
+
+
+class NumericalizedDataset:
+    """
+    Dataset of texts and summaries converted into indices of words.
+
+    Indices of words of all texts are kept in a single flat array, with an array of offsets where indices of every
+    text start, the same for summaries. Arrays can be memory-mapped from files, then examples are read from disk
+    only when used in a batch.
+
+    :param text: Array of indices of words of texts and array of offsets, one longer than number of texts
+    :type text: tuple
+    :param summary: Array of indices of words of summaries and array of offsets, one longer than number of summaries
+    :type summary: tuple
+    """
+    def __init__(self, text: Tuple[np.ndarray, np.ndarray], summary: Tuple[np.ndarray, np.ndarray]):
+        self.text_indices, self.text_offsets = text
+        self.summary_indices, self.summary_offsets = summary
+
+    def __len__(self) -> int:
+        """
+        :return: Number of examples
+        :rtype: int
+        """
+        return len(self.text_offsets) - 1
+
+    @property
+    def text_lengths(self) -> np.ndarray:
+        """
+        :return: Number of words of every text
+        :rtype: np.ndarray
+        """
+        return np.diff(self.text_offsets)
+
+    @property
+    def summary_lengths(self) -> np.ndarray:
+        """
+        :return: Number of words of every summary
+        :rtype: np.ndarray
+        """
+        return np.diff(self.summary_offsets)
+
+    def get_text(self, index: int) -> np.ndarray:
+        """
+        Takes indices of words of text of example.
+
+        :param index: Index of example
+        :type index: int
+        :return: Indices of words
+        :rtype: np.ndarray
+        """
+        return self.text_indices[self.text_offsets[index]:self.text_offsets[index + 1]]
+
+    def get_summary(self, index: int) -> np.ndarray:
+        """
+        Takes indices of words of summary of example.
+
+        :param index: Index of example
+        :type index: int
+        :return: Indices of words
+        :rtype: np.ndarray
+        """
+        return self.summary_indices[self.summary_offsets[index]:self.summary_offsets[index + 1]]
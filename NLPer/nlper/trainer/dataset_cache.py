@@ -0,0 +1,124 @@
+import logging
+import numpy as np
+import os
+import shutil
+
+from glob import glob
+from typing import Any
+from typing import Dict
+from typing import Tuple
+
+from nlper.file_io.reader import JsonReader
+from nlper.file_io.writer import JsonWriter
+from nlper.trainer.dataset import NumericalizedDataset
+from nlper.trainer.vocab import Vocab
+from nlper.utils.hash_utils import hash_config
+
+
+CACHE_CONFIG_KEYS = ('min_frequency_of_words_in_vocab', 'dataframes_field_names', 'streaming')
+COLUMNS = ('text', 'summary')
+VOCAB_NAME = 'vocab.json'
+
+
+class DatasetCache:
+    """
+    Cache of numericalized train, valid and test datasets with vocabulary.
+
+    The key of the entry is built from the hash of files of parts and config keys used to build vocabulary,
+    so changing the data or ``min_frequency_of_words_in_vocab`` builds the datasets again. Indices of words and offsets
+    of texts and summaries of every part are saved as numpy arrays and memory-mapped while loading, so loading does
+    not depend on the size of datasets. With ``streaming``, only valid and test parts are cached with vocabulary.
+    Only the latest entry is kept.
+
+    :param path: Path to folder with cached datasets
+    :type path: str
+    :param config: Configuration dictionary
+    :type config: dict
+    :param input_hash: Hash of csv files of parts
+    :type input_hash: str
+    """
+    def __init__(self, path: str, config: Dict[str, Any], input_hash: str):
+        self.logger = logging.getLogger(DatasetCache.__name__)
+        self.path = path
+        self.key = hash_config(dict({key: config.get(key) for key in CACHE_CONFIG_KEYS}, input=input_hash))
+        self.json_writer = JsonWriter()
+        self.json_reader = JsonReader()
+
+    def get_path(self) -> str:
+        """
+        Builds the path of folder of the entry.
+
+        :return: Path to folder with cached datasets
+        :rtype: str
+        """
+        return os.path.join(self.path, f'datasets_{self.key}')
+
+    def exists(self) -> bool:
+        """
+        Checks whether datasets are cached for current data and config.
+
+        :return: Flag whether the entry exists
+        :rtype: bool
+        """
+        return os.path.exists(os.path.join(self.get_path(), VOCAB_NAME))
+
+    def load(self) -> Tuple[Dict[str, NumericalizedDataset], Vocab]:
+        """
+        Loads cached datasets, arrays are memory-mapped.
+
+        :return: Dictionary with names of parts and datasets, and vocabulary
+        :rtype: tuple
+        """
+        path = self.get_path()
+        self.logger.info(f'Loading cached datasets : {path}')
+        vocab = Vocab(self.json_reader.open_file(filepath=os.path.join(path, VOCAB_NAME))['itos'])
+        datasets = {}
+        for split in self.get_splits(path):
+            datasets[split] = NumericalizedDataset(*(
+                (
+                    np.load(os.path.join(path, f'{split}_{column}_indices.npy'), mmap_mode='r'),
+                    np.load(os.path.join(path, f'{split}_{column}_offsets.npy'), mmap_mode='r'),
+                )
+                for column in COLUMNS
+            ))
+        return datasets, vocab
+
+    @staticmethod
+    def get_splits(path: str) -> Tuple[str, ...]:
+        """
+        Lists names of parts saved in the folder of the entry.
+
+        :param path: Path to folder with cached datasets
+        :type path: str
+        :return: Names of parts
+        :rtype: tuple
+        """
+        suffix = f'_{COLUMNS[0]}_indices.npy'
+        return tuple(sorted(name[:-len(suffix)] for name in os.listdir(path) if name.endswith(suffix)))
+
+    def save(self, datasets: Dict[str, NumericalizedDataset], vocab: Vocab) -> None:
+        """
+        Saves datasets and vocabulary, replacing the previous entry only after the new one is written.
+
+        :param datasets: Dictionary with names of parts and datasets
+        :type datasets: dict
+        :param vocab: Vocabulary
+        :type vocab: Vocab
+        """
+        path = self.get_path()
+        temporary_path = path + '.tmp'
+        if os.path.exists(temporary_path):
+            shutil.rmtree(temporary_path)
+        os.makedirs(temporary_path)
+        for split, dataset in datasets.items():
+            for column in COLUMNS:
+                np.save(os.path.join(temporary_path, f'{split}_{column}_indices.npy'),
+                        getattr(dataset, f'{column}_indices'))
+                np.save(os.path.join(temporary_path, f'{split}_{column}_offsets.npy'),
+                        getattr(dataset, f'{column}_offsets'))
+        self.json_writer.write(path=os.path.join(temporary_path, VOCAB_NAME), file={'itos': vocab.itos})
+        for previous_path in glob(os.path.join(self.path, 'datasets_*')):
+            if previous_path != temporary_path:
+                shutil.rmtree(previous_path)
+        os.replace(temporary_path, path)
+        self.logger.info(f'Cached datasets : {path}')
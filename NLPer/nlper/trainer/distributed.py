@@ -0,0 +1,119 @@
+import logging
+import numpy as np
+import os
+import socket
+import torch
+import torch.distributed as dist
+import torch.multiprocessing as mp
+
+from multiprocessing import cpu_count
+from typing import Any
+from typing import Callable
+from typing import Sequence
+
+
+BACKEND = 'gloo'
+DEFAULT_MASTER_ADDR = '127.0.0.1'
+DEFAULT_MASTER_PORT = '29500'
+SEED = 0
+
+
+def find_free_port() -> str:
+    """
+    Finds a free port on the local machine for the rendezvous of processes.
+
+    :return: Port number
+    :rtype: str
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('', 0))
+        return str(sock.getsockname()[1])
+
+
+def init_process(rank: int, world_size: int, threads: int = None) -> None:
+    """
+    Joins the process group of distributed training over ``gloo`` backend, with rendezvous at ``MASTER_ADDR`` and
+    ``MASTER_PORT`` environment variables.
+
+    All processes are seeded the same, so they plan the same batches and every process takes its own share of them.
+    Processes other than the main one only log warnings.
+
+    :param rank: Rank of the process
+    :type rank: int
+    :param world_size: Number of processes on all machines
+    :type world_size: int
+    :param threads: Number of threads of torch operations, by default cores divided by processes on the machine
+    :type threads: int, optional
+    """
+    dist.init_process_group(BACKEND, init_method='env://', rank=rank, world_size=world_size)
+    np.random.seed(SEED)
+    torch.manual_seed(SEED)
+    if threads:
+        torch.set_num_threads(threads)
+    if rank != 0:
+        logging.getLogger().setLevel(logging.WARNING)
+
+
+def init_from_environment() -> bool:
+    """
+    Joins the process group if the process was started by ``torchrun`` or another launcher setting ``RANK`` and
+    ``WORLD_SIZE`` environment variables.
+
+    :return: Flag whether the process joined the group
+    :rtype: bool
+    """
+    world_size = int(os.environ.get('WORLD_SIZE', 1))
+    if world_size == 1 or dist.is_initialized():
+        return False
+    local_world_size = int(os.environ.get('LOCAL_WORLD_SIZE', world_size))
+    init_process(int(os.environ['RANK']), world_size, threads=max(1, cpu_count() // local_world_size))
+    return True
+
+
+def run_process(local_rank: int, function: Callable, args: Sequence[Any], nproc: int, nnodes: int, node_rank: int) \
+        -> None:
+    """
+    Runs function in a process of distributed training and leaves the process group after it.
+
+    :param local_rank: Rank of the process on the machine
+    :type local_rank: int
+    :param function: Function to run
+    :type function: callable
+    :param args: Arguments of function
+    :type args: sequence
+    :param nproc: Number of processes on the machine
+    :type nproc: int
+    :param nnodes: Number of machines
+    :type nnodes: int
+    :param node_rank: Rank of the machine
+    :type node_rank: int
+    """
+    init_process(node_rank * nproc + local_rank, nproc * nnodes, threads=max(1, cpu_count() // nproc))
+    try:
+        function(*args)
+    finally:
+        dist.destroy_process_group()
+
+
+def launch(function: Callable, args: Sequence[Any], nproc: int, nnodes: int = 1, node_rank: int = 0) -> None:
+    """
+    Starts ``nproc`` processes of distributed training running function, on this machine.
+
+    With many machines every machine starts its processes with its ``node_rank``, and all of them meet at
+    ``MASTER_ADDR`` and ``MASTER_PORT`` environment variables, the address of machine of rank 0 in the local network.
+    On a single machine, the address is local and a free port is taken if not set.
+
+    :param function: Function to run, defined at module level
+    :type function: callable
+    :param args: Arguments of function
+    :type args: sequence
+    :param nproc: Number of processes on the machine
+    :type nproc: int
+    :param nnodes: Number of machines
+    :type nnodes: int
+    :param node_rank: Rank of the machine, from 0
+    :type node_rank: int
+    """
+    os.environ.setdefault('MASTER_ADDR', DEFAULT_MASTER_ADDR)
+    os.environ.setdefault('MASTER_PORT', find_free_port() if nnodes == 1 else DEFAULT_MASTER_PORT)
+    mp.spawn(run_process, args=(function, args, nproc, nnodes, node_rank), nprocs=nproc)
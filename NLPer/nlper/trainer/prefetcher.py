@@ -0,0 +1,113 @@
+import logging
+import queue
+import threading
+
+from typing import Any
+from typing import Iterable
+from typing import Iterator
+
+from nlper.trainer.batch_iterator import Batch
+from nlper.utils.torch_utils import AVAILABLE_GPU
+
+
+QUEUE_TIMEOUT = 0.1
+
+
+def pin_batch(batch: Batch) -> Batch:
+    """
+    Copies tensors of batch into page-locked memory, so they are transferred to the GPU asynchronously.
+
+    :param batch: Batch of texts and summaries
+    :type batch: Batch
+    :return: Batch with pinned tensors
+    :rtype: Batch
+    """
+    return Batch(*(tuple(tensor.pin_memory() for tensor in field) for field in batch))
+
+
+class PrefetchIterator:
+    """
+    Iterator preparing the next ``n_batches`` batches of the wrapped iterator in a background thread while
+    the current training step runs. Forward and backward passes release the GIL, so preparing batches overlaps
+    with them. With a GPU available, batches are pinned.
+
+    Batches come in the same order as from the wrapped iterator, and errors of the background thread are raised
+    in the consuming thread. The thread stops when iteration is abandoned.
+
+    :param iterator: Iterator over batches, such as ``BatchIterator``
+    :type iterator: iterable
+    :param n_batches: Number of batches prepared ahead
+    :type n_batches: int
+    :param pin_memory: Flag whether to pin batches, by default when a GPU is available
+    :type pin_memory: bool
+    """
+    def __init__(self, iterator: Iterable[Batch], n_batches: int, pin_memory: bool = AVAILABLE_GPU):
+        self.logger = logging.getLogger(PrefetchIterator.__name__)
+        self.iterator = iterator
+        self.n_batches = n_batches
+        self.pin_memory = pin_memory
+
+    def __len__(self) -> int:
+        """
+        :return: Number of batches of the wrapped iterator
+        :rtype: int
+        """
+        return len(self.iterator)
+
+    def __iter__(self) -> Iterator[Batch]:
+        batches = queue.Queue(maxsize=self.n_batches)
+        stop = threading.Event()
+        thread = threading.Thread(target=self.produce, args=(batches, stop), daemon=True)
+        thread.start()
+        try:
+            while True:
+                batch, error = batches.get()
+                if error is not None:
+                    raise error
+                if batch is None:
+                    return
+                yield batch
+        finally:
+            stop.set()
+            thread.join()
+
+    def produce(self, batches: queue.Queue, stop: threading.Event) -> None:
+        """
+        Puts batches of the wrapped iterator into the queue, followed by None or the raised error.
+
+        :param batches: Queue of pairs of batch and error
+        :type batches: queue.Queue
+        :param stop: Event set when iteration is finished or abandoned
+        :type stop: threading.Event
+        """
+        try:
+            for batch in self.iterator:
+                if self.pin_memory:
+                    batch = pin_batch(batch)
+                if not self.put(batches, (batch, None), stop):
+                    return
+            self.put(batches, (None, None), stop)
+        except Exception as error:
+            self.put(batches, (None, error), stop)
+
+    @staticmethod
+    def put(batches: queue.Queue, item: Any, stop: threading.Event) -> bool:
+        """
+        Puts item into the queue, waiting for a free place until iteration is finished or abandoned.
+
+        :param batches: Queue of pairs of batch and error
+        :type batches: queue.Queue
+        :param item: Pair of batch and error
+        :type item: tuple
+        :param stop: Event set when iteration is finished or abandoned
+        :type stop: threading.Event
+        :return: Flag whether the item was put
+        :rtype: bool
+        """
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=QUEUE_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+        return False
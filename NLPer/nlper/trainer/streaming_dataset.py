@@ -0,0 +1,182 @@
+import logging
+import numpy as np
+import pandas as pd
+
+from typing import Callable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from nlper.file_io.file_type_resolver import FileTypesResolver
+from nlper.trainer.batch_iterator import Batch
+from nlper.trainer.batch_iterator import BatchIterator
+from nlper.trainer.dataset import NumericalizedDataset
+from nlper.trainer.vocab import Vocab
+
+
+CHUNK_ROWS = 10000
+
+Example = Tuple[np.ndarray, np.ndarray]
+
+
+def read_text_chunks(paths: Sequence[str], columns: Sequence[str], chunk_rows: int = CHUNK_ROWS) \
+        -> Iterator[List[pd.Series]]:
+    """
+    Reads csv or parquet files in chunks of rows, so only a single chunk is kept in memory.
+    Empty cells are read as empty texts.
+
+    :param paths: Paths to files
+    :type paths: sequence
+    :param columns: Columns to read
+    :type columns: sequence
+    :param chunk_rows: Maximum number of rows in chunk
+    :type chunk_rows: int
+    :return: Generator of texts of every column of chunk
+    :rtype: iterator
+    """
+    for path in paths:
+        reader = FileTypesResolver.resolve_from_filepath(path)
+        for chunk in reader.read_chunks(path, chunk_size=chunk_rows, columns=columns):
+            yield [chunk[column].fillna('').astype(str) for column in columns]
+
+
+class StreamingDataset:
+    """
+    Iterable dataset of texts and summaries streamed from sharded files and converted into indices of words on the
+    fly against a vocabulary built beforehand, so memory does not depend on the size of files.
+
+    With ``shuffle``, order of files is shuffled every epoch and examples pass through a buffer of
+    ``shuffle_buffer_size`` examples, from which a random one is taken for every read example.
+
+    :param paths: Paths to csv or parquet files
+    :type paths: sequence
+    :param columns: Columns of texts and summaries
+    :type columns: sequence
+    :param vocab: Vocabulary
+    :type vocab: Vocab
+    :param shuffle: Flag whether to shuffle examples every epoch
+    :type shuffle: bool
+    :param shuffle_buffer_size: Number of examples in shuffle buffer
+    :type shuffle_buffer_size: int
+    :param n_workers: Number of threads numericalizing chunks, by default number of cores
+    :type n_workers: int, optional
+    """
+    def __init__(self, paths: Sequence[str], columns: Sequence[str], vocab: Vocab, shuffle: bool = False,
+                 shuffle_buffer_size: int = 10000, n_workers: Optional[int] = None):
+        self.paths = list(paths)
+        self.columns = columns
+        self.vocab = vocab
+        self.shuffle = shuffle
+        self.shuffle_buffer_size = shuffle_buffer_size
+        self.n_workers = n_workers
+
+    def __iter__(self) -> Iterator[Example]:
+        if not self.shuffle:
+            yield from self.read_examples(self.paths)
+            return
+        paths = [self.paths[position] for position in np.random.permutation(len(self.paths))]
+        buffer = []
+        for example in self.read_examples(paths):
+            if len(buffer) < self.shuffle_buffer_size:
+                buffer.append(example)
+                continue
+            position = np.random.randint(len(buffer))
+            yield buffer[position]
+            buffer[position] = example
+        for position in np.random.permutation(len(buffer)):
+            yield buffer[position]
+
+    def read_examples(self, paths: Sequence[str]) -> Iterator[Example]:
+        """
+        Reads chunks of files and converts texts and summaries into indices of words.
+
+        :param paths: Paths to files
+        :type paths: sequence
+        :return: Generator of indices of words of text and summary of every example
+        :rtype: iterator
+        """
+        for texts, summaries in read_text_chunks(paths, self.columns):
+            chunk = NumericalizedDataset(
+                text=self.vocab.numericalize(texts, n_workers=self.n_workers),
+                summary=self.vocab.numericalize(summaries, n_workers=self.n_workers),
+            )
+            # examples are copied, so buffered examples do not keep whole chunks in memory
+            for index in range(len(chunk)):
+                yield chunk.get_text(index).copy(), chunk.get_summary(index).copy()
+
+
+def create_pool_dataset(examples: List[Example]) -> NumericalizedDataset:
+    """
+    Joins examples into a numericalized dataset.
+
+    :param examples: Indices of words of text and summary of every example
+    :type examples: list
+    :return: Numericalized dataset
+    :rtype: NumericalizedDataset
+    """
+    columns = []
+    for sequences in zip(*examples):
+        offsets = np.zeros(len(sequences) + 1, dtype=np.int64)
+        np.cumsum([len(sequence) for sequence in sequences], out=offsets[1:])
+        columns.append((np.concatenate(sequences), offsets))
+    return NumericalizedDataset(*columns)
+
+
+class StreamingBatchIterator:
+    """
+    Iterator over batches of a streaming dataset, for datasets larger than memory.
+
+    Examples are gathered in pools of ``pool_size`` examples, and every pool is split into batches by an iterator
+    over a numericalized dataset of the pool, created by ``create_iterator``, so batches are formed in the same way
+    as for datasets kept in memory, also in distributed training, where every process reads all files and takes its
+    share of batches of every pool. The number of batches is not known before the end of the epoch, so the iterator
+    has no length. After every epoch the share of padding tokens and spread of number of tokens of batches are logged.
+
+    :param dataset: Streaming dataset
+    :type dataset: StreamingDataset
+    :param create_iterator: Function taking numericalized dataset of pool and returning iterator over its batches
+    :type create_iterator: callable
+    :param pool_size: Number of examples in pool
+    :type pool_size: int
+    """
+    def __init__(self, dataset: StreamingDataset, create_iterator: Callable[[NumericalizedDataset], BatchIterator],
+                 pool_size: int):
+        self.logger = logging.getLogger(StreamingBatchIterator.__name__)
+        self.dataset = dataset
+        self.create_iterator = create_iterator
+        self.pool_size = pool_size
+
+    def __iter__(self) -> Iterator[Batch]:
+        tokens = padded_tokens = 0
+        batch_tokens = []
+        for iterator in self.create_pool_iterators():
+            batches = iterator.plan_batches()
+            text_lengths, summary_lengths = iterator.get_sequence_lengths()
+            _, pool_batch_tokens = iterator.measure_padding(batches)
+            tokens += sum(int(text_lengths[examples].sum() + summary_lengths[examples].sum()) for examples in batches)
+            padded_tokens += int(pool_batch_tokens.sum())
+            batch_tokens.append(pool_batch_tokens)
+            for examples in batches:
+                yield iterator.create_batch(examples)
+        if batch_tokens:
+            batch_tokens = np.concatenate(batch_tokens)
+            self.logger.info(f'Batches : {len(batch_tokens)} | padding : {1 - tokens / max(padded_tokens, 1):.1%} '
+                             f'of tokens | tokens per batch : {batch_tokens.mean():.0f} +- {batch_tokens.std():.0f}')
+
+    def create_pool_iterators(self) -> Iterator[BatchIterator]:
+        """
+        Gathers examples of the dataset in pools and creates iterators over batches of every pool.
+
+        :return: Generator of iterators over batches of pools
+        :rtype: iterator
+        """
+        pool = []
+        for example in self.dataset:
+            pool.append(example)
+            if len(pool) == self.pool_size:
+                yield self.create_iterator(create_pool_dataset(pool))
+                pool = []
+        if pool:
+            yield self.create_iterator(create_pool_dataset(pool))
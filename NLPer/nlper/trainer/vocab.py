@@ -0,0 +1,228 @@
+import numpy as np
+
+from collections import Counter
+from collections import defaultdict
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
+from typing import Any
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from nlper.utils.lang_utils import Token
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+
+SPECIALS = (
+    Token.Unknown.value,
+    Token.Padding.value,
+    Token.StartOfSequence.value,
+    Token.EndOfSequence.value,
+    Token.Number.value,
+)
+UNKNOWN_INDEX = 0
+TEXTS_PER_CHUNK = 20000
+
+
+def split_words(texts: Sequence[str]) -> Tuple[Any, np.ndarray]:
+    """
+    Splits texts by whitespaces, in the same way as ``str.split``, using ``pyarrow`` compute functions.
+
+    :param texts: Texts to split
+    :type texts: sequence
+    :return: Arrow array of words of all texts and number of words of every text
+    :rtype: tuple
+    """
+    texts = pa.array(texts, type=pa.large_string())
+    if isinstance(texts, pa.ChunkedArray):
+        # series of concatenated data frames are backed by chunked arrow arrays
+        texts = texts.combine_chunks()
+    texts = pc.utf8_trim_whitespace(texts)
+    words = pc.utf8_split_whitespace(texts)
+    # only empty texts are split into a single empty word after trimming
+    empty = pc.fill_null(pc.equal(texts, ''), True).to_numpy(zero_copy_only=False)
+    lengths = pc.list_value_length(words).to_numpy(zero_copy_only=False).astype(np.int64)
+    lengths[empty] = 0
+    words = words.flatten()
+    return words.filter(pc.not_equal(words, '')), lengths
+
+
+def map_chunks(function: Any, texts: Sequence[str], n_workers: Optional[int] = None) -> List[Any]:
+    """
+    Applies function to chunks of ``TEXTS_PER_CHUNK`` texts using a pool of threads, ``pyarrow`` compute functions
+    release the GIL, so chunks are processed in parallel without copying texts to worker processes.
+
+    :param function: Function taking chunk of texts
+    :type function: callable
+    :param texts: Texts to process
+    :type texts: sequence
+    :param n_workers: Number of threads, by default number of cores
+    :type n_workers: int, optional
+    :return: Results of function for chunks, in order of chunks
+    :rtype: list
+    """
+    chunks = [texts[start:start + TEXTS_PER_CHUNK] for start in range(0, len(texts), TEXTS_PER_CHUNK)]
+    n_workers = min(n_workers or cpu_count(), len(chunks))
+    if n_workers <= 1:
+        return [function(chunk) for chunk in chunks]
+    with ThreadPool(n_workers) as pool:
+        return pool.map(function, chunks)
+
+
+def count_chunk_words(texts: Sequence[str]) -> Any:
+    """
+    Counts words of chunk of texts.
+
+    :param texts: Chunk of texts
+    :type texts: sequence
+    :return: Arrow struct array of words and their counts
+    :rtype: pyarrow.StructArray
+    """
+    words, _ = split_words(texts)
+    return pc.value_counts(words)
+
+
+def count_words(texts: Sequence[str], n_workers: Optional[int] = None) -> Counter:
+    """
+    Counts words of texts split by whitespaces.
+    With ``pyarrow`` installed, chunks of texts are counted in parallel and the counts are merged, otherwise texts
+    are counted one by one.
+
+    :param texts: Texts to count words of
+    :type texts: sequence
+    :param n_workers: Number of threads, by default number of cores
+    :type n_workers: int, optional
+    :return: Counter of words
+    :rtype: Counter
+    """
+    if pa is None:
+        counter = Counter()
+        for text in texts:
+            counter.update(text.split())
+        return counter
+    counts = map_chunks(count_chunk_words, texts, n_workers)
+    if not counts:
+        return Counter()
+    merged = pa.table({
+        'word': pa.concat_arrays([chunk_counts.field('values') for chunk_counts in counts]),
+        'count': pa.concat_arrays([chunk_counts.field('counts') for chunk_counts in counts]),
+    }).group_by('word').aggregate([('count', 'sum')])
+    return Counter(dict(zip(merged['word'].to_pylist(), merged['count_sum'].to_pylist())))
+
+
+class Vocab:
+    """
+    Vocabulary of words with their indices.
+
+    Words are ordered in the same way as by torchtext ``Field.build_vocab``: special tokens first, with ``<unk>``
+    at index 0 and ``<pad>`` at index 1, then words by descending frequency, words with the same frequency
+    in alphabetical order. Words not in vocabulary are mapped to ``<unk>``.
+
+    :param itos: List of words, position of word is its index
+    :type itos: list
+    """
+    def __init__(self, itos: List[str]):
+        self.itos = itos
+        self.stoi = defaultdict(int, {word: index for index, word in enumerate(itos)})
+
+    def __len__(self) -> int:
+        """
+        :return: Number of words in vocabulary
+        :rtype: int
+        """
+        return len(self.itos)
+
+    @classmethod
+    def from_counter(cls, counter: Counter, min_frequency: int) -> 'Vocab':
+        """
+        Builds vocabulary from words appearing at least ``min_frequency`` times.
+
+        :param counter: Counter of words
+        :type counter: Counter
+        :param min_frequency: Minimum number of times a word must appear to be placed into vocabulary
+        :type min_frequency: int
+        :return: Vocabulary
+        :rtype: Vocab
+        """
+        words = sorted(
+            (word for word, frequency in counter.items()
+             if frequency >= max(min_frequency, 1) and word not in SPECIALS),
+            key=lambda word: (-counter[word], word),
+        )
+        return cls(list(SPECIALS) + words)
+
+    @property
+    def padding_index(self) -> int:
+        """
+        :return: Index of padding token ``<pad>``
+        :rtype: int
+        """
+        return self.stoi[Token.Padding.value]
+
+    @property
+    def start_index(self) -> int:
+        """
+        :return: Index of start of sequence token ``<sos>``
+        :rtype: int
+        """
+        return self.stoi[Token.StartOfSequence.value]
+
+    @property
+    def end_index(self) -> int:
+        """
+        :return: Index of end of sequence token ``<eos>``
+        :rtype: int
+        """
+        return self.stoi[Token.EndOfSequence.value]
+
+    def numericalize(self, texts: Sequence[str], n_workers: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Converts texts into flat array of indices of their words, with offsets where indices of every text start.
+        With ``pyarrow`` installed, words of chunks of texts are looked up in vocabulary in bulk and in parallel,
+        otherwise texts are converted one by one.
+
+        :param texts: Texts to convert
+        :type texts: sequence
+        :param n_workers: Number of threads, by default number of cores
+        :type n_workers: int, optional
+        :return: Array of indices and array of offsets, one longer than number of texts
+        :rtype: tuple
+        """
+        if pa is None:
+            indices = []
+            offsets = [0]
+            for text in texts:
+                indices.extend(self.stoi.get(word, UNKNOWN_INDEX) for word in text.split())
+                offsets.append(len(indices))
+            return np.array(indices, dtype=np.int32), np.array(offsets, dtype=np.int64)
+        words = pa.array(self.itos, type=pa.large_string())
+        chunks = map_chunks(lambda chunk: self.numericalize_chunk(chunk, words), texts, n_workers)
+        indices = [chunk_indices for chunk_indices, _ in chunks]
+        lengths = [chunk_lengths for _, chunk_lengths in chunks]
+        offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+        if chunks:
+            np.cumsum(np.concatenate(lengths), out=offsets[1:])
+            return np.concatenate(indices), offsets
+        return np.zeros(0, dtype=np.int32), offsets
+
+    @staticmethod
+    def numericalize_chunk(texts: Sequence[str], words: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Converts chunk of texts into indices of their words, words not in vocabulary are mapped to ``<unk>``.
+
+        :param texts: Chunk of texts
+        :type texts: sequence
+        :param words: Arrow array of words of vocabulary, position of word is its index
+        :type words: pyarrow.Array
+        :return: Array of indices and number of words of every text
+        :rtype: tuple
+        """
+        text_words, lengths = split_words(texts)
+        indices = pc.fill_null(pc.index_in(text_words, value_set=words), UNKNOWN_INDEX)
+        return indices.to_numpy(zero_copy_only=False).astype(np.int32), lengths
@@ -1,13 +1,27 @@
+import html
 import logging
+import pandas as pd
 import re
 
 from bs4 import BeautifulSoup
+from html.entities import html5
 from typing import List
+from typing import Optional
 from typing import Tuple
 
 from nlper.utils.lang_utils import LangUtils
 
 
+BRACKETS_PATTERN = re.compile("({.*\\})|(\\[.*\\])")
+SEPARATORS_PATTERN = re.compile("[-~+:/]+|__+|\\.\\.+")
+NON_TEXT_CHARACTERS_PATTERN = re.compile(r"[<>()|&©ø,;~*\[\]'\"`„”“‟‶‚’‘‛⁏\-—―–⁋‰\\%^$#@!]")
+NUMBERS_PATTERN = re.compile(r"[0-9][.|,;:/\-\\MDCLXVI0-9]*")
+WHITESPACES_PATTERN = re.compile("\\s+")
+HTML_TAG_PATTERN = re.compile(r"""</?([a-zA-Z][^\s/<>]*)(?:[\s/](?:[^<>"']|"[^"<>]*"|'[^'<>]*')*)?>""")
+HTML_ENTITY_PATTERN = re.compile(r"&(?:#[0-9]+|#[xX][0-9a-fA-F]+|([a-zA-Z][a-zA-Z0-9]*));")
+HTML_RAW_TEXT_TAGS = {'script', 'style', 'textarea', 'title'}
+
+
 class CleanUtils:
     """
     Utils for cleaning text
@@ -66,9 +80,22 @@ class CleanUtils:
         :return: Text with replaced numbers
         :rtype: str
         """
-        text = re.sub(
-            r"([0-9]+[.|,|;|:|/|\-|\\|MDCLXVI0-9]+)+|([0-9]+?)", " " + number_replacement + " ", str(text))
-        return re.sub("\\s+", " ", str(text))
+        text = NUMBERS_PATTERN.sub(" " + number_replacement + " ", str(text))
+        return WHITESPACES_PATTERN.sub(" ", text)
+
+    @staticmethod
+    def hide_numbers_for_series(series: pd.Series, number_replacement: str = '<num>') -> pd.Series:
+        """
+        Hides numbers, date and time in every text of data frame column, see ``hide_numbers``.
+
+        :param series: Column with texts to hide numbers in
+        :type series: pd.Series
+        :param number_replacement: Token to replace numbers with
+        :type number_replacement: str
+        :return: Column with replaced numbers
+        :rtype: pd.Series
+        """
+        return series.map(lambda text: CleanUtils.hide_numbers(text, number_replacement=number_replacement))
 
     @staticmethod
     def remove_hmtl_elements(text: str) -> str:
@@ -78,13 +105,52 @@ class CleanUtils:
         Example:
         <p>sample text</p> -> sample text
 
+        Texts without markup are only stripped and texts with simple tags and known entities are handled
+        by regular expressions, other texts are parsed with BeautifulSoup.
+
         :param text: Text to remove html elements from
         :type text: str
         :return: Text with removed html elements
         :rtype: str
         """
+        if isinstance(text, str):
+            if '<' not in text and '&' not in text:
+                return text.strip()
+            stripped_text = CleanUtils._remove_simple_html_elements(text)
+            if stripped_text is not None:
+                return stripped_text
         return BeautifulSoup(text, features="html.parser").get_text(strip=True)
 
+    @staticmethod
+    def _remove_simple_html_elements(text: str) -> Optional[str]:
+        """
+        Removes html tags and decodes html entities the same way as BeautifulSoup ``get_text(strip=True)``.
+        Returns None for text which requires parsing, e.g. with comments, scripts, unknown entities or
+        tags with unusual attributes.
+
+        :param text: Text to remove html elements from
+        :type text: str
+        :return: Text with removed html elements or None
+        :rtype: str, optional
+        """
+        parts = HTML_TAG_PATTERN.split(text)
+        if any(tag.lower() in HTML_RAW_TEXT_TAGS for tag in parts[1::2]):
+            return None
+        strings = []
+        for string in parts[0::2]:
+            if '<' in string:
+                return None
+            if '&' in string:
+                entities = HTML_ENTITY_PATTERN.findall(string)
+                if string.count('&') != len(entities) or any(
+                        entity and entity + ';' not in html5 for entity in entities):
+                    return None
+                string = html.unescape(string)
+            string = string.strip()
+            if string:
+                strings.append(string)
+        return ''.join(strings)
+
     @staticmethod
     def remove_non_text_characters(text: str) -> str:
         """
@@ -100,19 +166,29 @@ class CleanUtils:
         Types of characters to replace:
         * ?! to be replaced with dot .
 
+        Whitespaces are collapsed after replacing separators, so runs of different separators are replaced at once.
+
         :param text: Text to remove non text characters from
         :type text: str
         :return: Text with removed characters
         :rtype: str
         """
-        text = re.sub("([\t\r\n])", ' ', str(text))
-        text = re.sub("({.*\\})|(\\[.*\\])", '', str(text))
-        text = re.sub("(__+|-+|~+|\\++|\\.\\.+|\\:+|\\/)", ' ', str(text))
-        text = re.sub("\\s+", ' ', str(text))
-        text = re.sub(
-            r"[<>()|&©ø,;~*\[\]\'\"\`\\\"\„\”\“\‟\‶\‚\’\‘\‛\⁏\;\-\—\―\–\⁋\‰\\\%\^\&\*\$\#\@\!]", '', str(text))
-        text = re.sub(r"[?!]", '.', str(text))
-        return text
+        text = str(text).replace('\t', ' ').replace('\r', ' ').replace('\n', ' ')
+        text = SEPARATORS_PATTERN.sub(' ', BRACKETS_PATTERN.sub('', text))
+        text = NON_TEXT_CHARACTERS_PATTERN.sub('', WHITESPACES_PATTERN.sub(' ', text))
+        return text.replace('?', '.')
+
+    @staticmethod
+    def remove_non_text_characters_for_series(series: pd.Series) -> pd.Series:
+        """
+        Removes non text characters from every text of data frame column, see ``remove_non_text_characters``.
+
+        :param series: Column with texts to remove non text characters from
+        :type series: pd.Series
+        :return: Column with removed characters
+        :rtype: pd.Series
+        """
+        return series.map(CleanUtils.remove_non_text_characters)
 
     @staticmethod
     def remove_special_characters(text: str, characters: Tuple[str] = ('\\xao',)) -> str:
@@ -149,6 +225,18 @@ class CleanUtils:
         text = CleanUtils.remove_non_text_characters(text)
         return text
 
+    @staticmethod
+    def remove_characters_for_series(series: pd.Series) -> pd.Series:
+        """
+        Executes removal of various types of unwanted characters from every text of data frame column.
+
+        :param series: Column with texts to remove characters from
+        :type series: pd.Series
+        :return: Column with removed characters
+        :rtype: pd.Series
+        """
+        return series.map(CleanUtils.remove_characters_for_text)
+
     @staticmethod
     def convert_list_to_text(text_as_list: List[str]) -> str:
         """
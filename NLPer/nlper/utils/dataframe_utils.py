@@ -56,7 +56,10 @@ class DataFrameUtils:
         :return: Data frame with dropped rows
         :rtype: pd.DataFrame
         """
+        not_empty = [True] * len(dataframe)
         for column in dataframe:
-            dataframe = dataframe[dataframe[column].map(lambda cell: len(cell) > 0)]
-        dataframe.reset_index(drop=True, inplace=True)
-        return dataframe
+            not_empty = [
+                row_not_empty and len(cell) > 0
+                for row_not_empty, cell in zip(not_empty, dataframe[column].tolist())
+            ]
+        return dataframe[pd.Series(not_empty, index=dataframe.index, dtype=bool)].reset_index(drop=True)
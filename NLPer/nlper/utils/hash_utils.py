@@ -0,0 +1,57 @@
+import hashlib
+import json
+
+from typing import Any
+from typing import Dict
+from typing import Sequence
+
+
+ROW_HASH_SIZE = 8
+FILE_HASH_SIZE = 16
+
+
+def hash_text(text: str) -> str:
+    """
+    Hashes text, used to recognize already processed rows of raw data files.
+
+    :param text: Text to hash
+    :type text: str
+    :return: Hexadecimal hash of text
+    :rtype: str
+    """
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=ROW_HASH_SIZE).hexdigest()
+
+
+def hash_config(config: Dict[str, Any], skip_keys: Sequence[str] = ()) -> str:
+    """
+    Hashes config values, keys order does not change the hash.
+
+    :param config: Configuration dictionary
+    :type config: dict
+    :param skip_keys: Keys which do not change the hash
+    :type skip_keys: sequence
+    :return: Hexadecimal hash of config
+    :rtype: str
+    """
+    values = {key: value for key, value in config.items() if key not in skip_keys}
+    return hashlib.blake2b(
+        json.dumps(values, sort_keys=True, default=str).encode('utf-8'), digest_size=FILE_HASH_SIZE,
+    ).hexdigest()
+
+
+def hash_file(path: str, block_size: int = 1 << 20) -> str:
+    """
+    Hashes contents of file, read in blocks.
+
+    :param path: Path to file
+    :type path: str
+    :param block_size: Number of bytes read at once
+    :type block_size: int
+    :return: Hexadecimal hash of file
+    :rtype: str
+    """
+    file_hash = hashlib.blake2b(digest_size=FILE_HASH_SIZE)
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(block_size), b''):
+            file_hash.update(block)
+    return file_hash.hexdigest()
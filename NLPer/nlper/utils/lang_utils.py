@@ -93,15 +93,15 @@ class VocabConfig:
         self.stoi = stoi
         self.itos = itos
 
-    def set_vocab_from_field(self, text: object) -> None:
+    def set_vocab(self, vocab: object) -> None:
         """
-        Assigns dictionary of text tokens and indices, together with list of tokens from torchtext vocabulary.
+        Assigns dictionary of text tokens and indices, together with list of tokens from vocabulary built by trainer.
 
-        :param text: Torchtext vocabulary
-        :param text: torchtext.Vocab
+        :param vocab: Vocabulary
+        :type vocab: nlper.trainer.vocab.Vocab
         """
-        self.stoi = text.vocab.stoi
-        self.itos = text.vocab.itos
+        self.stoi = vocab.stoi
+        self.itos = vocab.itos
 
     def set_vocab_from_file(self, filepath: str = None) -> None:
         """
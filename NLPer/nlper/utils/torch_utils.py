@@ -1,4 +1,8 @@
 import torch
+import torch.distributed as dist
+
+from contextlib import contextmanager
+from typing import Iterator
 
 
 AVAILABLE_GPU = torch.cuda.is_available()
@@ -26,3 +30,63 @@ def to_gpu(tensor: torch.Tensor) -> torch.Tensor:
     :rtype: torch.Tensor
     """
     return tensor.cuda() if AVAILABLE_GPU else tensor
+
+
+def autocast(enabled: bool) -> torch.autocast:
+    """
+    Returns context of bfloat16 autocast on the available device. Inside it, supported operations, e.g. linear layers
+    and matrix products, run in bfloat16 on float32 weights, and return bfloat16 outputs.
+
+    :param enabled: Flag whether to cast, without it operations run in float32
+    :type enabled: bool
+    :return: Autocast context
+    :rtype: torch.autocast
+    """
+    return torch.autocast(device_type=get_device().type, dtype=torch.bfloat16, enabled=enabled)
+
+
+def get_rank() -> int:
+    """
+    Returns rank of the process in distributed training, 0 without distributed training.
+
+    :return: Rank of the process
+    :rtype: int
+    """
+    if dist.is_available() and dist.is_initialized():
+        return dist.get_rank()
+    return 0
+
+
+def get_world_size() -> int:
+    """
+    Returns number of processes of distributed training, 1 without distributed training.
+
+    :return: Number of processes
+    :rtype: int
+    """
+    if dist.is_available() and dist.is_initialized():
+        return dist.get_world_size()
+    return 1
+
+
+def is_main_process() -> bool:
+    """
+    Checks whether the process saves outputs, the process of rank 0 or the only process.
+
+    :return: Flag whether the process is the main one
+    :rtype: bool
+    """
+    return get_rank() == 0
+
+
+@contextmanager
+def main_process_first() -> Iterator[None]:
+    """
+    Runs the block in the main process first and in other processes of distributed training after it finishes,
+    so other processes can use files written by the main one, e.g. cached datasets.
+    """
+    if not is_main_process():
+        dist.barrier()
+    yield
+    if is_main_process() and get_world_size() > 1:
+        dist.barrier()
@@ -5,17 +5,26 @@ import pandas as pd
 
 from typing import Any
 from typing import Dict
+from typing import Iterator
+from typing import List
 from typing import Optional
 from typing import Tuple
 
+from nlper.exceptions import InvalidConfigValueException
+from nlper.exceptions import UnsupportedFileTypeException
 from nlper.file_io.file_type_resolver import FileTypesResolver
 from nlper.file_io.writer import CsvWriter
 from nlper.utils.config_utils import read_config
+from nlper.utils.hash_utils import hash_text
 
 
 TRAIN_PERCENTAGE = 0.8
 VAL_PERCENTAGE = 0.1
 TRAIN_TEXT_COLUMNS = ('text', 'summary')
+SPLITS = ('train', 'test', 'val')
+DEFAULT_SPLIT_KEY = 'text'
+DEFAULT_CHUNK_SIZE = 100000
+HASH_BUCKETS = 10000
 
 
 logging.basicConfig(
@@ -29,6 +38,12 @@ class TrainTestSplitter:
     """
     Splits data frame into train, test and valid parts.
 
+    The data frame is read in chunks of ``chunk_size`` rows and every row is assigned to a part by the hash of its
+    ``split_key`` column, salted with ``split_seed``, so the split is reproducible, does not depend on the order
+    of rows and data larger than memory is split in a single pass. Rows of every part are appended to CSV files,
+    with ``shards`` greater than one every part is saved in that many files, also assigned by the hash.
+    Without valid part, its rows are added to the test part.
+
     :param config: Path to yaml config file
     :type config: str, optional
     :param filepath: Path to pandas data frame
@@ -42,7 +57,7 @@ class TrainTestSplitter:
         self.valid = valid
         self.config = self._read_from_config(config=config)
         self.csv_writer = CsvWriter()
-        self.data = None
+        self.saved_paths = set()
 
     def run(self) -> None:
         """
@@ -50,10 +65,44 @@ class TrainTestSplitter:
         """
         if not self.config:
             self.set_config_from_filepath()
-        self.read_file()
         self.create_dirs()
-        train, test, val = self.split_data()
-        self.save_data(train=train, test=test, val=val)
+        rows = dict.fromkeys(self.get_splits(), 0)
+        for chunk in self.read_chunks():
+            for (split, shard), part in self.split_data(chunk):
+                self.save_data(part, split, shard)
+                rows[split] += len(part)
+        self.save_empty_parts()
+        for split, split_rows in rows.items():
+            self.logger.info(f'Split {split} : {split_rows} rows')
+
+    def split_dataframe(self, data: pd.DataFrame, save: bool = False) -> Dict[str, pd.DataFrame]:
+        """
+        Splits data frame kept in memory into train, test and valid parts, in the same way as data frame read from
+        file. Parts are saved into csv files only if ``save`` is set.
+
+        :param data: Data frame to split
+        :type data: pd.DataFrame
+        :param save: Flag whether to save parts into files
+        :type save: bool
+        :return: Dictionary with names of parts and their rows
+        :rtype: dict
+        """
+        if save:
+            self.create_dirs()
+        parts = {split: [] for split in self.get_splits()}
+        for (split, shard), part in self.split_data(data):
+            parts[split].append(part[list(TRAIN_TEXT_COLUMNS)])
+            if save:
+                self.save_data(part, split, shard)
+        if save:
+            self.save_empty_parts()
+        for split, split_parts in parts.items():
+            if split_parts:
+                parts[split] = pd.concat(split_parts, ignore_index=True)
+            else:
+                parts[split] = pd.DataFrame(columns=list(TRAIN_TEXT_COLUMNS))
+            self.logger.info(f'Split {split} : {len(parts[split])} rows')
+        return parts
 
     def _read_from_config(self, config: Optional[str]) -> Optional[Dict[str, Any]]:
         """
@@ -70,6 +119,27 @@ class TrainTestSplitter:
             return config_dict
         return None
 
+    def get_splits(self) -> Tuple[str, ...]:
+        """
+        Lists parts of split, without valid part if not included.
+
+        :return: Names of parts
+        :rtype: tuple
+        """
+        return SPLITS if self.valid else SPLITS[:-1]
+
+    def get_shards(self) -> int:
+        """
+        Takes number of files of every part from config.
+
+        :return: Number of shards
+        :rtype: int
+        """
+        shards = self.config.get('shards') or 1
+        if isinstance(shards, bool) or not isinstance(shards, int) or shards < 1:
+            raise InvalidConfigValueException('shards', shards)
+        return shards
+
     def build_paths(self) -> None:
         """
         Builds paths required for saving the split data frames
@@ -81,88 +151,126 @@ class TrainTestSplitter:
             self.config['sub_dir'],
         ))
         self.config['path'] = path
-        for file_type in ['train', 'test', 'val']:
+        for file_type in SPLITS:
             self.config[f'{file_type}_file'] = os.path.join(path, f'{file_type}.csv')
 
+    def get_split_path(self, split: str, shard: int) -> str:
+        """
+        Builds path of file of part, with index of shard if part is saved in many files.
+
+        :param split: Name of part
+        :type split: str
+        :param shard: Index of shard
+        :type shard: int
+        :return: Path to file
+        :rtype: str
+        """
+        if self.get_shards() == 1:
+            return self.config[f'{split}_file']
+        return os.path.join(self.config['path'], f'{split}_{shard}.csv')
+
     def create_dirs(self) -> None:
         """
         Creates directories for split data frames to save
-        :return:
         """
         self.build_paths()
         self.csv_writer.create_dir(directory=self.config['path'])
 
-    def read_file(self) -> None:
+    def get_columns_to_read(self) -> List[str]:
         """
-        Reads pandas data frame from path
+        Lists columns saved in split parts and the column used to assign rows to parts.
+
+        :return: Names of columns to read
+        :rtype: list
+        """
+        return list(dict.fromkeys(TRAIN_TEXT_COLUMNS + (self.config.get('split_key') or DEFAULT_SPLIT_KEY,)))
+
+    def read_chunks(self) -> Iterator[pd.DataFrame]:
+        """
+        Reads pandas data frame from path in chunks of rows, only columns required for split are read.
+
+        :return: Generator of data frames with chunks of rows
+        :rtype: iterator
         """
         file_type_resolver = FileTypesResolver.resolve_from_filepath(self.filepath)
-        self.data = file_type_resolver.open_file(filepath=self.filepath)
-
-    def save_data(
-            self,
-            train: pd.DataFrame,
-            test: pd.DataFrame,
-            val: Optional[pd.DataFrame] = None,
-            columns: Tuple[str] = TRAIN_TEXT_COLUMNS,
-    ) -> None:
-        """
-        Saves specified columns of train, test and valid data frames into csv files.
-
-        :param train: Train part data frame
-        :param train: pd.DataFrame
-        :param test: Test part data frame
-        :param test: pd.DataFrame
-        :param val: Valid part data frame
-        :param val: pd.DataFrame
+        if not hasattr(file_type_resolver, 'read_chunks'):
+            raise UnsupportedFileTypeException(self.filepath)
+        return file_type_resolver.read_chunks(
+            self.filepath,
+            chunk_size=self.config.get('chunk_size') or DEFAULT_CHUNK_SIZE,
+            columns=self.get_columns_to_read(),
+        )
+
+    def save_data(self, data: pd.DataFrame, split: str, shard: int, columns: Tuple[str] = TRAIN_TEXT_COLUMNS) -> None:
+        """
+        Saves specified columns of rows of part into csv file, appending to rows saved before.
+
+        :param data: Rows of part
+        :type data: pd.DataFrame
+        :param split: Name of part
+        :type split: str
+        :param shard: Index of shard
+        :type shard: int
+        :param columns: Columns to save
+        :type columns: tuple
+        """
+        path = self.get_split_path(split, shard)
+        if path in self.saved_paths:
+            self.csv_writer.append(path=path, file=data[list(columns)])
+        else:
+            self.csv_writer.write(path=path, file=data[list(columns)])
+            self.saved_paths.add(path)
+
+    def save_empty_parts(self, columns: Tuple[str] = TRAIN_TEXT_COLUMNS) -> None:
+        """
+        Saves files with only header for parts and shards without rows.
+
         :param columns: Columns to save
-        :param columns: tuple
+        :type columns: tuple
         """
-        columns = list(columns)
-        self.csv_writer.write(path=self.config['train_file'], file=train[columns])
-        self.csv_writer.write(path=self.config['test_file'], file=test[columns])
-        self.csv_writer.write(path=self.config['val_file'], file=val[columns])
+        for split in self.get_splits():
+            for shard in range(self.get_shards()):
+                if self.get_split_path(split, shard) not in self.saved_paths:
+                    self.save_data(pd.DataFrame(columns=list(columns)), split, shard, columns)
 
     def set_config_from_filepath(self) -> None:
         """
         Specifies directory name to write split data frame parts
         """
-        self.config['output_dir'] = os.path.dirname(self.filepath)
+        self.config = {'input_file': self.filepath, 'output_dir': os.path.dirname(self.filepath)}
 
-    def split_data(self) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    def split_data(self, data: pd.DataFrame) -> Iterator[Tuple[Tuple[str, int], pd.DataFrame]]:
         """
-        Splits data frame into train, test and valid parts.
+        Splits chunk of data frame into train, test and valid parts by the hash of ``split_key`` column.
 
-        :return: Train, test and valid data frames
-        :rtype: tuple
+        :param data: Chunk of data frame
+        :type data: pd.DataFrame
+        :return: Generator of names of parts with indices of shards and their rows
+        :rtype: iterator
+        """
+        split_key = self.config.get('split_key') or DEFAULT_SPLIT_KEY
+        if split_key not in data:
+            raise InvalidConfigValueException('split_key', split_key)
+        hashes = self.hash_keys(data[split_key].fillna('').astype(str).tolist())
+        positions = (hashes % np.uint64(HASH_BUCKETS)).astype(np.float64) / HASH_BUCKETS
+        splits = np.where(positions < TRAIN_PERCENTAGE, 0, 1)
+        if self.valid:
+            splits[positions >= TRAIN_PERCENTAGE + VAL_PERCENTAGE] = 2
+        shards = (hashes // np.uint64(HASH_BUCKETS)) % np.uint64(self.get_shards())
+        for split_index, split in enumerate(self.get_splits()):
+            for shard in range(self.get_shards()):
+                mask = (splits == split_index) & (shards == shard)
+                if mask.any():
+                    yield (split, shard), data[mask].reset_index(drop=True)
+
+    def hash_keys(self, keys: List[str]) -> np.ndarray:
+        """
+        Hashes keys of rows salted with ``split_seed``.
+
+        :param keys: Keys of rows
+        :type keys: list
+        :return: Array of 64-bit hashes
+        :rtype: np.ndarray
         """
-        def calculate_last_indices(total_length: int) -> Tuple[int, int]:
-            """
-            Calculates last indices of data frame rows for train, test required for split.
-
-            :param total_length: Number of rows in data frame
-            :type total_length: int
-            :return: Number of last indices for train and test parts
-            :rtype: tuple
-            """
-            return int(TRAIN_PERCENTAGE * total_length), int((TRAIN_PERCENTAGE + VAL_PERCENTAGE) * total_length)
-
-        def permute_rows() -> Tuple[np.array, np.array, np.array]:
-            """
-            Permutes rows of data frame for split.
-
-            :return: Permuted rows
-            :rtype: tuple
-            """
-            train_indices = permuted_indices[:last_train_index]
-            test_indices = permuted_indices[last_train_index:last_test_index]
-            val_indices = permuted_indices[last_test_index:]
-            return train_indices, test_indices, val_indices
-
-        np.random.seed(None)
-        permuted_indices = np.random.permutation(self.data.index)
-        last_train_index, last_test_index = calculate_last_indices(len(self.data))
-        train_indices, test_indices, val_indices = permute_rows()
-        return self.data.iloc[train_indices].reset_index(drop=True), \
-            self.data.iloc[test_indices].reset_index(drop=True), \
-            self.data.iloc[val_indices].reset_index(drop=True)
+        salt = str(self.config.get('split_seed') or '')
+        return np.array([int(hash_text(salt + key), 16) for key in keys], dtype=np.uint64)
@@ -3,10 +3,26 @@ import os
 import torch
 
 from rouge import Rouge
+from typing import Any
 from typing import List
 from typing import Optional
 
 
+def get_number_of_batches(iterator: Any) -> Optional[int]:
+    """
+    Takes number of batches of iterator, streaming iterators have no length.
+
+    :param iterator: Iterator over batches
+    :type iterator: iterable
+    :return: Number of batches, None if unknown
+    :rtype: int, optional
+    """
+    try:
+        return len(iterator)
+    except TypeError:
+        return None
+
+
 def calculate_rouge(hypothesis: str, reference: str) -> Optional[List[dict]]:
     """
     Calculates Rouge scores which is a set of metrics for evaluation of machine translation or text summarization tasks.
@@ -1,5 +1,6 @@
 import logging
 import numpy as np
+import re
 
 from typing import Any
 from typing import Callable
@@ -8,6 +9,9 @@ from typing import List
 from nlper.utils.lang_utils import LangUtils
 
 
+TOKENS_UPPER_BOUND_PATTERN = re.compile(r'\w+|[^\w\s]')
+
+
 class TrimUtils:
     """
     Utils for trimming text to specified length
@@ -108,6 +112,19 @@ class TrimUtils:
         """
         return lambda x: threshold < len(x.strip().split())
 
+    @staticmethod
+    def count_tokens_upper_bound(text: str) -> int:
+        """
+        Counts words and punctuation characters in text, the upper bound of number of tokens of the language model,
+        which splits words only between letters and punctuation, and so of number of words of lemmatized text.
+
+        :param text: Text to count tokens in
+        :type text: str
+        :return: Upper bound of number of tokens
+        :rtype: int
+        """
+        return len(TOKENS_UPPER_BOUND_PATTERN.findall(text))
+
     @staticmethod
     def trim_sentences(sentences: List[str], index: int) -> List[str]:
         """
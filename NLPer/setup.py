@@ -33,6 +33,8 @@ setup(
         'console_scripts': [
             'clean-data = nlper.main:clean_data',
             'clean-text = nlper.main:clean_text',
+            'merge-shards = nlper.main:merge_shards',
+            'pipeline = nlper.main:pipeline',
             'predict = nlper.main:predict',
             'split-train-test = nlper.main:split_train_test',
             'train = nlper.main:train',
@@ -0,0 +1,205 @@
+import json
+import os
+import pandas as pd
+import pytest
+import shutil
+import yaml
+
+from nlper.dataframe_cleaner.application import Application
+from nlper.dataframe_cleaner.cleaner import Cleaner
+from nlper.dataframe_cleaner.reducer import Reducer
+from nlper.dataframe_cleaner.trimmer import Trimmer
+from nlper.exceptions import InvalidConfigValueException
+
+
+def write_config(tmpdir, **values):
+    config = {
+        'input': 'tests/assets/data_files/',
+        'output': os.path.join(tmpdir, 'output'),
+        'columns_to_skip': ['url'],
+        'columns_to_merge_as_text': ['text', 'text_list', 'text_main_points'],
+        'columns_to_merge_as_summary': ['title', 'lead'],
+        'save_reduced': False,
+        'reduced_output_name': 'reduced_data',
+        'reduced_merge_data': False,
+        'reduced_output_type': 'csv',
+        'hide_numbers': True,
+        'number_replacement': '<num>',
+        'lemmatize': False,
+        'save_cleaned': True,
+        'cleaned_output_name': 'cleaned_data',
+        'cleaned_merge_data': True,
+        'cleaned_output_type': 'csv',
+        'trim_data': False,
+        'save_trimmed': False,
+        'trimmed_output_name': 'trimmed_data',
+        'trimmed_merge_data': True,
+        'trimmed_output_type': 'csv',
+    }
+    config.update(values)
+    config_path = os.path.join(tmpdir, 'config.yaml')
+    with open(config_path, 'w') as config_file:
+        yaml.safe_dump(config, config_file)
+    return config_path
+
+
+@pytest.mark.parametrize("merge_data", [True, False])
+def test__application__streaming_saves_the_same_data(tmpdir, merge_data):
+    Application(write_config(tmpdir, cleaned_merge_data=merge_data)).run()
+    expected = {name: pd.read_csv(os.path.join(tmpdir, 'output', name)) for name in os.listdir(tmpdir / 'output')}
+
+    Application(write_config(tmpdir, cleaned_merge_data=merge_data, streaming=True, chunk_size=50)).run()
+    saved = {name: pd.read_csv(os.path.join(tmpdir, 'output', name)) for name in os.listdir(tmpdir / 'output')}
+
+    assert saved.keys() == expected.keys()
+    for name, dataframe in expected.items():
+        assert saved[name].equals(dataframe)
+
+
+@pytest.mark.parametrize("values", [
+    {'chunk_size': 0},
+    {'chunk_size': 'ten'},
+    {'save_reduced': True, 'reduced_output_type': 'pickle'},
+])
+def test__application__streaming_rejects_invalid_config(tmpdir, values):
+    application = Application(write_config(tmpdir, streaming=True, **values))
+
+    with pytest.raises(InvalidConfigValueException):
+        application.run()
+
+
+@pytest.fixture
+def input_path(tmpdir):
+    path = os.path.join(tmpdir, 'input')
+    shutil.copytree('tests/assets/data_files', path)
+    os.remove(os.path.join(path, 'reduced_sample.pkl'))
+    return path + '/'
+
+
+@pytest.fixture
+def reduced_rows(monkeypatch):
+    rows = []
+    reduce_dataframe = Reducer.reduce_dataframe
+
+    def counting_reduce_dataframe(self):
+        rows.append(len(self.data))
+        return reduce_dataframe(self)
+
+    monkeypatch.setattr(Reducer, 'reduce_dataframe', counting_reduce_dataframe)
+    return rows
+
+
+def read_outputs(tmpdir, output='output'):
+    return {
+        name: pd.read_csv(os.path.join(tmpdir, output, name)).sort_values(['site', 'text']).reset_index(drop=True)
+        for name in os.listdir(os.path.join(tmpdir, output)) if name.endswith('.csv')
+    }
+
+
+def append_article(input_path, name='mamstartup', text='Nowy artykuł'):
+    article = {'url': 'new', 'title': ['Nowy'], 'lead': ['Nowy wstęp'], 'text': [text], 'text_list': ['Punkt']}
+    with open(os.path.join(input_path, name + '.jsonl'), 'a', encoding='utf-8') as data_file:
+        data_file.write(json.dumps(article) + '\n')
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test__application__incremental_processes_only_new_rows(tmpdir, input_path, reduced_rows, streaming):
+    values = {'input': input_path, 'incremental': True, 'streaming': streaming, 'save_reduced': True,
+              'reduced_output_type': 'csv', 'reduced_merge_data': True, 'save_trimmed': True, 'trim_data': False}
+    Application(write_config(tmpdir, **values)).run()
+    processed_rows = sum(reduced_rows)
+
+    Application(write_config(tmpdir, **values)).run()
+    assert sum(reduced_rows) == processed_rows
+
+    append_article(input_path)
+    append_article(input_path, text='Drugi nowy artykuł')
+    Application(write_config(tmpdir, **values)).run()
+    assert sum(reduced_rows) == processed_rows + 2
+
+    incremental = read_outputs(tmpdir)
+    Application(write_config(tmpdir, **dict(values, incremental=False, output=os.path.join(tmpdir, 'full')))).run()
+    full = read_outputs(tmpdir, output='full')
+    assert incremental.keys() == full.keys() == {'reduced_data.csv', 'cleaned_data.csv', 'trimmed_data.csv'}
+    for name, dataframe in full.items():
+        assert incremental[name].equals(dataframe)
+
+
+@pytest.mark.parametrize("change", ['config', 'rows', 'output'])
+def test__application__incremental_processes_all_rows_after_changes(tmpdir, input_path, reduced_rows, change):
+    values = {'input': input_path, 'incremental': True}
+    Application(write_config(tmpdir, **values)).run()
+    processed_rows = sum(reduced_rows)
+
+    if change == 'config':
+        values['hide_numbers'] = False
+    elif change == 'rows':
+        with open(os.path.join(input_path, 'sample.jsonl'), 'r', encoding='utf-8') as data_file:
+            lines = data_file.readlines()
+        with open(os.path.join(input_path, 'sample.jsonl'), 'w', encoding='utf-8') as data_file:
+            data_file.writelines(lines[1:])
+    else:
+        with open(os.path.join(tmpdir, 'output', 'cleaned_data.csv'), 'a') as output_file:
+            output_file.write('partial')
+    Application(write_config(tmpdir, **values)).run()
+
+    assert sum(reduced_rows) == 2 * processed_rows - (1 if change == 'rows' else 0)
+    Application(write_config(tmpdir, **dict(values, incremental=False, output=os.path.join(tmpdir, 'full')))).run()
+    assert read_outputs(tmpdir)['cleaned_data.csv'].equals(read_outputs(tmpdir, output='full')['cleaned_data.csv'])
+
+
+class StageCalls(list):
+    """
+    Names of stages run by the application, stages in ``failing`` raise an error.
+    """
+    def __init__(self):
+        super().__init__()
+        self.failing = set()
+
+
+@pytest.fixture
+def stage_calls(monkeypatch):
+    calls = StageCalls()
+
+    def counting(stage, method):
+        def run_stage(self):
+            calls.append(stage)
+            if stage in calls.failing:
+                raise RuntimeError(f'Crash while running {stage} stage')
+            return self.data if stage == 'trimmed' else method(self)
+        return run_stage
+
+    monkeypatch.setattr(Reducer, 'reduce_dataframe', counting('reduced', Reducer.reduce_dataframe))
+    monkeypatch.setattr(Cleaner, 'clean_dataframe', counting('cleaned', Cleaner.clean_dataframe))
+    monkeypatch.setattr(Trimmer, 'trim_dataframe', counting('trimmed', Trimmer.trim_dataframe))
+    return calls
+
+
+def test__application__cached_stages_rerun_only_changed_stages(tmpdir, stage_calls):
+    values = {'cache_stages': True, 'cache_path': os.path.join(tmpdir, 'cache'), 'trim_data': True,
+              'save_trimmed': True, 'text_upper_length_limit': 400}
+    Application(write_config(tmpdir, **values)).run()
+    cleaned = read_outputs(tmpdir)['cleaned_data.csv']
+    assert set(stage_calls) == {'reduced', 'cleaned', 'trimmed'}
+
+    stage_calls.clear()
+    Application(write_config(tmpdir, **dict(values, text_upper_length_limit=300))).run()
+    assert set(stage_calls) == {'trimmed'}
+    assert read_outputs(tmpdir)['cleaned_data.csv'].equals(cleaned)
+
+    stage_calls.clear()
+    Application(write_config(tmpdir, **dict(values, text_upper_length_limit=300, hide_numbers=False))).run()
+    assert set(stage_calls) == {'cleaned', 'trimmed'}
+    assert len(os.listdir(os.path.join(tmpdir, 'cache'))) == 3
+
+
+def test__application__resumes_from_last_cached_stage(tmpdir, stage_calls):
+    values = {'cache_stages': True, 'cache_path': os.path.join(tmpdir, 'cache'), 'trim_data': True}
+    stage_calls.failing.add('trimmed')
+    with pytest.raises(RuntimeError):
+        Application(write_config(tmpdir, **values)).run()
+
+    stage_calls.clear()
+    stage_calls.failing.clear()
+    Application(write_config(tmpdir, **values)).run()
+    assert set(stage_calls) == {'trimmed'}
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from nlper.dataframe_cleaner.deduplicator import Deduplicator
+
+
+random = np.random.RandomState(0)
+vocabulary = [f'słowo{i}' for i in range(2000)]
+articles = [' '.join(random.choice(vocabulary, 200)) for _ in range(100)]
+
+
+def edit_words(text, rate):
+    words = text.split()
+    for i in np.flatnonzero(random.random_sample(len(words)) < rate):
+        words[i] = random.choice(vocabulary)
+    return ' '.join(words)
+
+
+def test__deduplicator__finds_near_duplicates_and_keeps_first_occurrence():
+    near_duplicates = [edit_words(text, rate=0.02) for text in articles[:50]]
+    different = [edit_words(text, rate=0.6) for text in articles[50:]]
+
+    duplicates = Deduplicator().find_duplicates(articles + near_duplicates + different + [articles[0].upper()])
+
+    assert not duplicates[:100].any()
+    assert duplicates[100:150].mean() > 0.9
+    assert not duplicates[150:200].any()
+    assert duplicates[200]
+
+
+def test__deduplicator__remembers_texts_from_previous_calls():
+    deduplicator = Deduplicator()
+    assert not deduplicator.find_duplicates(articles[:50]).any()
+
+    duplicates = deduplicator.find_duplicates(articles[40:60])
+    assert duplicates.tolist() == [True] * 10 + [False] * 10
+
+
+@pytest.mark.parametrize("texts, expected", [
+    (['', 'a', ''], [False, False, False]),
+    (['jeden dwa', 'Jeden  dwa', 'trzy'], [False, True, False]),
+])
+def test__deduplicator__handles_short_and_empty_texts(texts, expected):
+    assert Deduplicator().find_duplicates(texts).tolist() == expected
+
+
+def test__deduplicator__removes_duplicates_across_sites_and_counts_them():
+    deduplicator = Deduplicator()
+    first_site = pd.DataFrame({'text': [[text] for text in articles[:10]], 'summary': [['a']] * 10})
+    second_site = pd.DataFrame({'text': [[text] for text in articles[5:20]], 'summary': [['b']] * 15})
+
+    first_site = deduplicator.remove_duplicates(first_site, name='first')
+    second_site = deduplicator.remove_duplicates(second_site, name='second')
+
+    assert len(first_site) == 10
+    assert second_site['text'].tolist() == [[text] for text in articles[10:20]]
+    assert second_site.index.tolist() == list(range(10))
+    assert deduplicator.duplicates == {'first': (0, 10), 'second': (5, 15)}
@@ -0,0 +1,62 @@
+import pandas as pd
+import pytest
+
+from nlper.dataframe_cleaner.cleaner import Cleaner
+from nlper.dataframe_cleaner.length_filter import LengthFilter
+from nlper.dataframe_cleaner.trimmer import Trimmer
+from nlper.utils.trim_utils import TrimUtils
+
+
+config = {
+    'hide_numbers': True,
+    'number_replacement': '<num>',
+    'lemmatize': False,
+    'text_lower_length_limit': 3,
+    'summary_lower_length_limit': 1,
+}
+
+reduced_data = pd.DataFrame({
+    'text': [
+        ['Ala ma kota', 'i psa.'], ['Za krótki', 'tekst'], ['<b>1 2 3</b>', '12.05.2020 o 11:45'],
+        ['Długi tekst', 'ma wiele słów.'], ['Jeszcze jeden', 'długi tekst'],
+    ],
+    'summary': [['Tytuł', 'i wstęp'], ['Tytuł', 'wstęp'], ['Tytuł', 'wstęp'], ['Tytuł', ''], ['', '']],
+})
+
+
+def test__length_filter__removes_the_same_rows_as_trimmer_without_lemmatization():
+    filtered = LengthFilter(config=config).filter_dataframe(reduced_data.copy(), name='site')
+
+    cleaned = Cleaner(config=config, data=reduced_data.copy()).clean_characters()
+    trimmer = Trimmer(config=config, data=cleaned)
+    trimmer.remove_below_lower_length_limit()
+    expected = Cleaner(config=config, data=filtered.copy()).clean_characters()
+
+    assert expected.to_dict('list') == trimmer.data.to_dict('list')
+    assert filtered.index.tolist() == list(range(len(filtered)))
+
+
+def test__length_filter__counts_removed_rows_for_sites():
+    length_filter = LengthFilter(config=config)
+    length_filter.filter_dataframe(reduced_data.copy(), name='first')
+    length_filter.filter_dataframe(reduced_data.copy(), name='first')
+    length_filter.filter_dataframe(reduced_data.iloc[:1].copy(), name='second')
+
+    assert length_filter.removed == {'first': (6, 10), 'second': (0, 1)}
+    assert length_filter.removed_words > 0 and length_filter.kept_words > 0
+
+
+def test__length_filter__keeps_rows_with_enough_tokens_for_lemmatization():
+    lemmatize_config = dict(config, lemmatize=True, text_lower_length_limit=4)
+    data = pd.DataFrame({'text': [['Ala ma kota.'], ['Ala ma kota i psa.']], 'summary': [['a b'], ['a b']]})
+
+    filtered = LengthFilter(config=lemmatize_config).filter_dataframe(data, name='site')
+
+    assert filtered['text'].tolist() == [['Ala ma kota i psa.']]
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('Ala ma kota.', 4), ('dom,kot - pies', 5), ('<num> zł', 4), ('', 0),
+])
+def test__trim_utils__counts_tokens_upper_bound(text, expected):
+    assert TrimUtils.count_tokens_upper_bound(text) == expected
@@ -0,0 +1,55 @@
+import copy
+import pandas as pd
+
+from nlper.dataframe_cleaner.reducer import Reducer
+from nlper.utils.dataframe_utils import DataFrameUtils
+
+
+config = {
+    'columns_to_skip': ['url'],
+    'columns_to_merge_as_text': ['text', 'text_list', 'text_main_points'],
+    'columns_to_merge_as_summary': ['title', 'lead'],
+}
+
+raw_data = pd.DataFrame({
+    'url': ['a', 'b', 'c', 'd'],
+    'title': ['Title a', 'Title b', None, 'Title d'],
+    'lead': ['Lead a', 'Lead b', 'Lead c', None],
+    'text': [['Lead a', 'Text a'], ['Text b'], [], ['Text d', 'Text d2']],
+    'text_list': [['List a'], [], [], []],
+    'text_main_points': [[], ['Point b'], [], []],
+})
+
+
+def test__reducer__reduce_dataframe():
+    reduced = Reducer(config=config, data=copy.deepcopy(raw_data)).reduce_dataframe()
+
+    expected = pd.DataFrame({
+        'text': [['Text a', 'List a'], ['Text b', 'Point b'], ['Text d', 'Text d2']],
+        'summary': [['Title a', 'Lead a'], ['Title b', 'Lead b'], ['Title d']],
+    })
+    assert reduced.columns.tolist() == ['text', 'summary']
+    assert reduced.to_dict('list') == expected.to_dict('list')
+    assert reduced.index.tolist() == [0, 1, 2]
+
+
+def test__reducer__does_not_modify_raw_data():
+    data = copy.deepcopy(raw_data)
+    Reducer(config=config, data=data).reduce_dataframe()
+
+    assert data.to_dict('list') == raw_data.to_dict('list')
+
+
+def test__dataframe_utils__remove_empty_rows_of_empty_dataframe():
+    dataframe = pd.DataFrame({'text': [], 'summary': []})
+
+    assert DataFrameUtils.remove_empty_rows(dataframe).columns.tolist() == ['text', 'summary']
+
+
+def test__reducer__reduces_dataframe_with_only_columns_to_read():
+    columns = Reducer.get_columns_to_read(config)
+    reduced = Reducer(config=config, data=copy.deepcopy(raw_data[columns])).reduce_dataframe()
+    expected = Reducer(config=config, data=copy.deepcopy(raw_data)).reduce_dataframe()
+
+    assert 'url' not in columns
+    assert reduced.to_dict('list') == expected.to_dict('list')
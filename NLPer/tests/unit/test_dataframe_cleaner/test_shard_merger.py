@@ -0,0 +1,70 @@
+import os
+import pandas as pd
+import pytest
+
+from click.testing import CliRunner
+
+from nlper.dataframe_cleaner.application import Application
+from nlper.dataframe_cleaner.shard_merger import get_shard_path
+from nlper.dataframe_cleaner.shard_merger import ShardMerger
+from nlper.exceptions import MissingShardOutputException
+from nlper.file_io.dataframe_reader import FileReader
+from nlper.main import clean_data
+from tests.unit.test_dataframe_cleaner.test_application import write_config
+
+
+def read_outputs(path):
+    return {
+        name: pd.read_csv(os.path.join(path, name))
+        for name in os.listdir(path) if name.endswith('.csv')
+    }
+
+
+def sort_rows(dataframe):
+    return dataframe.sort_values(list(dataframe.columns)).reset_index(drop=True)
+
+
+def test__file_reader__reads_every_row_in_exactly_one_shard():
+    data = FileReader(path='tests/assets/data_files/', n_workers=1).read_json_lines_files()
+    shards = [
+        FileReader(path='tests/assets/data_files/', n_workers=1, shard=(index, 3)).read_json_lines_files()
+        for index in range(3)
+    ]
+
+    for file_name, dataframe in data.items():
+        urls = [url for shard in shards if file_name in shard for url in shard[file_name]['url'].tolist()]
+        assert sorted(urls) == sorted(dataframe['url'].tolist())
+
+
+@pytest.mark.parametrize("merge_data", [True, False])
+def test__shard_merger__merges_the_same_rows_as_single_run(tmpdir, merge_data):
+    config_path = write_config(tmpdir, cleaned_merge_data=merge_data, save_reduced=True)
+    Application(config_path).run()
+    expected = read_outputs(os.path.join(tmpdir, 'output'))
+
+    for index in range(3):
+        Application(config_path, shard=(index, 3)).run()
+    ShardMerger(config_path, shards=3).run()
+    merged = read_outputs(os.path.join(tmpdir, 'output'))
+
+    assert merged.keys() == expected.keys()
+    for name, dataframe in expected.items():
+        assert sort_rows(merged[name]).equals(sort_rows(dataframe))
+        if 'site' in dataframe:
+            assert merged[name]['site'].tolist() == dataframe['site'].tolist()
+
+
+def test__shard_merger__requires_outputs_of_all_shards(tmpdir):
+    config_path = write_config(tmpdir)
+    Application(config_path, shard=(0, 2)).run()
+
+    assert os.path.isdir(get_shard_path(os.path.join(tmpdir, 'output'), (0, 2)))
+    with pytest.raises(MissingShardOutputException):
+        ShardMerger(config_path, shards=2).run()
+
+
+@pytest.mark.parametrize("shard", ['2/2', '-1/2', 'first', '1/2/3'])
+def test__clean_data__rejects_invalid_shard(tmpdir, shard):
+    result = CliRunner().invoke(clean_data, [write_config(tmpdir), '--shard', shard])
+
+    assert result.exit_code == 2
@@ -0,0 +1,184 @@
+import os
+import pandas as pd
+import pytest
+
+from nlper.dataframe_cleaner.cleaner import Cleaner
+from nlper.dataframe_cleaner.trimmer import Trimmer
+from nlper.dataframe_cleaner.worker_pool import split_by_token_count
+from nlper.dataframe_cleaner.worker_pool import WorkerPool
+from nlper.exceptions import InvalidConfigValueException
+from nlper.utils.clean_utils import CleanUtils
+from nlper.utils.lang_utils import LangUtils
+from nlper.utils.trim_utils import TrimUtils
+
+
+texts = [
+    ' '.join(['word'] * length)
+    for length in [300, 5, 5, 5, 5, 5, 5, 100, 100, 5, 5, 250, 5, 5]
+]
+
+sentences_data = pd.DataFrame({
+    'text': [f'Text number {i} . Second Sentence of {i} . Last One' for i in range(60)],
+    'summary': [f'Summary {i} . Of Text' for i in range(60)],
+})
+
+
+class StubSentence:
+    def __init__(self, text):
+        self.text = text
+        self.lemma_ = text.lower()
+
+    def __len__(self):
+        return len(self.text.split())
+
+
+class StubDocument:
+    def __init__(self, text):
+        self.sents = [StubSentence(sentence.strip()) for sentence in text.split(' . ')]
+
+
+class StubLanguageModel:
+    def __call__(self, text):
+        return StubDocument(text)
+
+
+@pytest.fixture
+def stub_language_model(monkeypatch, tmpdir):
+    """
+    Replaces loading SpaCy model with stub, which records the process id of every loading.
+    """
+    loads_path = os.path.join(tmpdir, 'loads.txt')
+
+    def set_language_model(self, *args, **kwargs):
+        with open(loads_path, 'a') as loads:
+            loads.write(f'{os.getpid()}\n')
+        self.lang_model = StubLanguageModel()
+        return self.lang_model
+
+    monkeypatch.setattr(LangUtils, 'set_language_model', set_language_model)
+
+    def read_loads():
+        if not os.path.exists(loads_path):
+            return []
+        with open(loads_path) as loads:
+            return loads.read().split()
+    return read_loads
+
+
+@pytest.fixture
+def failing_language_model(monkeypatch):
+    def set_language_model(self, *args, **kwargs):
+        raise OSError('Missing language model')
+
+    monkeypatch.setattr(LangUtils, 'set_language_model', set_language_model)
+
+
+def expected_lemmatized(column):
+    clean_utils = CleanUtils()
+    clean_utils.lang_model = StubLanguageModel()
+    return [clean_utils.lemmatize(text) for text in column]
+
+
+def expected_trimmed(column, threshold):
+    trim_utils = TrimUtils()
+    trim_utils.lang_model = StubLanguageModel()
+    return [trim_utils.trim_text_to_upper_length_threshold(text, threshold) for text in column]
+
+
+@pytest.mark.parametrize("n_chunks", [1, 2, 3, 4, 8, 32])
+def test__worker_pool__split_by_token_count_preserves_texts_order(n_chunks):
+    chunks = split_by_token_count(texts, n_chunks)
+
+    assert 0 < len(chunks) <= n_chunks
+    assert all(chunks)
+    assert [text for chunk in chunks for text in chunk] == texts
+
+
+def test__worker_pool__split_by_token_count_balances_tokens():
+    chunks = split_by_token_count(texts, 3)
+    tokens = [sum(len(text.split()) for text in chunk) for chunk in chunks]
+
+    assert len(chunks) == 3
+    assert max(tokens) <= 400
+
+
+def test__worker_pool__split_by_token_count_of_empty_texts():
+    assert split_by_token_count([], 4) == []
+
+
+@pytest.mark.parametrize("n_workers", [0, 2])
+def test__worker_pool__lemmatize_and_trim_keep_order(stub_language_model, n_workers):
+    column = sentences_data['text'].tolist()
+
+    with WorkerPool(n_workers=n_workers) as worker_pool:
+        lemmatized = worker_pool.lemmatize(column)
+        trimmed = worker_pool.trim(column, threshold=8)
+
+    assert lemmatized == expected_lemmatized(column)
+    assert trimmed == expected_trimmed(column, threshold=8)
+
+
+def test__worker_pool__loads_language_model_once_per_worker(stub_language_model):
+    with WorkerPool(n_workers=2) as worker_pool:
+        for _ in range(3):
+            worker_pool.lemmatize(sentences_data['text'].tolist())
+            worker_pool.trim(sentences_data['summary'].tolist(), threshold=2)
+
+    loads = stub_language_model()
+    assert len(loads) == 2
+    assert len(set(loads)) == 2
+    assert str(os.getpid()) not in loads
+
+
+def test__worker_pool__in_process_loads_language_model_once(stub_language_model):
+    worker_pool = WorkerPool(n_workers=0)
+    worker_pool.lemmatize(sentences_data['text'].tolist())
+    worker_pool.trim(sentences_data['summary'].tolist(), threshold=2)
+
+    assert stub_language_model() == [str(os.getpid())]
+
+
+def test__worker_pool__cleaner_and_trimmer_output_with_pool(stub_language_model):
+    config = {'text_upper_length_limit': 8, 'summary_upper_length_limit': 2}
+
+    with WorkerPool(n_workers=2) as worker_pool:
+        cleaner = Cleaner(config=config, data=sentences_data.copy(), worker_pool=worker_pool)
+        cleaner.lemmatize_text()
+        trimmer = Trimmer(config=config, data=sentences_data.copy(), worker_pool=worker_pool)
+        trimmer.trim_to_upper_length_limit()
+
+    for column in sentences_data:
+        assert cleaner.data[column].tolist() == expected_lemmatized(sentences_data[column])
+        assert trimmer.data[column].tolist() == expected_trimmed(
+            sentences_data[column], config[f'{column}_upper_length_limit'])
+
+
+def test__worker_pool__cleaner_without_pool_creates_it_on_first_use(stub_language_model):
+    cleaner = Cleaner(config={}, data=sentences_data.copy())
+    assert cleaner.worker_pool is None
+    assert stub_language_model() == []
+
+    cleaner.lemmatize_text()
+    assert cleaner.worker_pool.n_workers == 0
+    assert cleaner.data['text'].tolist() == expected_lemmatized(sentences_data['text'])
+
+
+def test__worker_pool__raises_initialization_error_on_first_task(failing_language_model):
+    with WorkerPool(n_workers=2) as worker_pool:
+        with pytest.raises(OSError):
+            worker_pool.lemmatize(sentences_data['text'].tolist())
+
+
+def test__worker_pool__in_process_retries_failed_initialization(monkeypatch, failing_language_model):
+    worker_pool = WorkerPool(n_workers=0)
+    with pytest.raises(OSError):
+        worker_pool.lemmatize(sentences_data['text'].tolist())
+
+    monkeypatch.setattr(LangUtils, 'set_language_model', lambda self, *args, **kwargs: StubLanguageModel())
+    assert worker_pool.lemmatize(sentences_data['text'].tolist()) == expected_lemmatized(sentences_data['text'])
+
+
+@pytest.mark.parametrize("n_workers", [-1, 'four', 2.5, True])
+def test__worker_pool__rejects_invalid_number_of_workers(n_workers):
+    with pytest.raises(InvalidConfigValueException):
+        WorkerPool(n_workers=n_workers)
@@ -0,0 +1,74 @@
+import gzip
+import importlib.util
+import os
+import pandas as pd
+import pytest
+import shutil
+
+from glob import glob
+
+from nlper.file_io.compression import get_compression
+from nlper.file_io.compression import open_file
+from nlper.file_io.dataframe_reader import FileReader
+from nlper.file_io.dataframe_writer import FileWriter
+from nlper.file_io.file_type_resolver import FileTypesResolver
+
+
+compressions = [
+    'gzip', 'bz2', 'xz',
+    pytest.param('zstd', marks=pytest.mark.skipif(
+        importlib.util.find_spec('zstandard') is None, reason='zstandard is not installed')),
+]
+extensions = {'gzip': '.gz', 'bz2': '.bz2', 'xz': '.xz', 'zstd': '.zst'}
+
+
+@pytest.mark.parametrize("path, compression", [
+    ('data.csv', None), ('data.csv.gz', 'gzip'), ('data.jsonl.bz2', 'bz2'), ('data.pkl.xz', 'xz'),
+    ('data.csv.zst', 'zstd'),
+])
+def test__compression__detects_compression_by_extension(path, compression):
+    assert get_compression(path) == compression
+
+
+@pytest.mark.parametrize("compression", compressions)
+def test__compression__appends_to_compressed_file(tmpdir, compression):
+    path = os.path.join(tmpdir, 'data.txt' + extensions[compression])
+    with open_file(path, 'w', compression_level=1) as opened_file:
+        opened_file.write('pierwsza linia\n')
+    with open_file(path, 'a') as opened_file:
+        opened_file.write('druga linia\n')
+
+    with open_file(path, 'r') as opened_file:
+        assert opened_file.readlines() == ['pierwsza linia\n', 'druga linia\n']
+
+
+def test__compression__reads_compressed_json_lines_files(tmpdir):
+    for file in glob('tests/assets/data_files/*.jsonl'):
+        with open(file, 'rb') as raw_file, gzip.open(os.path.join(tmpdir, os.path.basename(file) + '.gz'), 'wb') \
+                as compressed_file:
+            shutil.copyfileobj(raw_file, compressed_file)
+
+    data = FileReader(path='tests/assets/data_files/', n_workers=1).read_json_lines_files()
+    compressed_data = FileReader(path=str(tmpdir) + '/', n_workers=1).read_json_lines_files()
+
+    assert sorted(compressed_data.keys()) == sorted(data.keys())
+    for file_name, dataframe in data.items():
+        assert compressed_data[file_name].to_dict('records') == dataframe.to_dict('records')
+
+
+@pytest.mark.parametrize("output_type", ['csv', 'pickle'])
+@pytest.mark.parametrize("compression", compressions)
+def test__compression__writes_and_appends_compressed_dataframes(tmpdir, output_type, compression):
+    first = pd.DataFrame({'text': ['a b', 'c d'], 'summary': ['a', 'c']})
+    second = pd.DataFrame({'text': ['e f'], 'summary': ['e']})
+
+    file_writer = FileWriter(tmpdir, output_type=output_type, output_compression=compression)
+    file_writer.save_file(data=first, name='data', append=True)
+    path = file_writer.save_file(data=second, name='data', append=True)
+
+    assert path.endswith(extensions[compression])
+    expected = pd.concat([first, second], ignore_index=True)
+    if output_type == 'csv':
+        assert FileTypesResolver.resolve_from_filepath(path).open_file(filepath=path).equals(expected)
+    else:
+        assert FileWriter.read_pickle(path).equals(expected)
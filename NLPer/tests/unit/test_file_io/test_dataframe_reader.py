@@ -1,4 +1,5 @@
 import os
+import pandas as pd
 
 from glob import glob
 
@@ -37,3 +38,32 @@ def test__dataframe_reader__get_correct_data():
 
     for file_name, dataframe in data.items():
         assert all(elem in dataframe.columns.values for elem in required_columns_in_dataframe)
+
+
+def test__dataframe_reader__reads_the_same_data_in_chunks():
+    file_reader = FileReader(path=path, allowed_extensions=file_extension)
+    data = file_reader.read_json_lines_files()
+
+    chunks = {}
+    for file_name, chunk in file_reader.read_json_lines_chunks(chunk_size=10):
+        assert 0 < len(chunk) <= 10
+        assert chunk.index[0] == 0
+        chunks.setdefault(file_name, []).append(chunk)
+
+    assert list(chunks.keys()) == list(data.keys())
+    for file_name, dataframe in data.items():
+        merged = pd.concat(chunks[file_name], ignore_index=True)
+        assert merged.to_dict('records') == dataframe.to_dict('records')
+
+
+def test__dataframe_reader__reads_selected_columns_in_parallel():
+    data = FileReader(path=path, allowed_extensions=file_extension, n_workers=1).read_json_lines_files()
+    columns = ['title', 'text']
+
+    file_reader = FileReader(path=path, allowed_extensions=file_extension, columns=columns, n_workers=2)
+    projected = file_reader.read_json_lines_files()
+
+    assert list(projected.keys()) == list(data.keys())
+    for file_name, dataframe in data.items():
+        expected = dataframe[[column for column in dataframe.columns if column in columns]]
+        assert projected[file_name].to_dict('records') == expected.to_dict('records')
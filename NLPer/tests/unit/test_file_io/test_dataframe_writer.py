@@ -16,6 +16,7 @@ dataframes_dictionary = {
     "dataframe, output_type", [
         (data_frame, {'name': 'csv', 'extension': 'csv'}),
         (data_frame, {'name': 'pickle', 'extension': 'pkl'}),
+        (data_frame, {'name': 'parquet', 'extension': 'parquet'}),
         pytest.param(data_frame, {'name': 'yaml', 'extension': 'yaml'}, marks=pytest.mark.xfail)
     ]
 )
@@ -36,6 +37,8 @@ def test__dataframe_writer__saves_single_dummy_dataframe(tmpdir, dataframe, outp
         assert pd.read_csv(file_path).equals(data_frame)
     elif output_type['name'] == 'pickle':
         assert pd.read_pickle(file_path).equals(data_frame)
+    elif output_type['name'] == 'parquet':
+        assert pd.read_parquet(file_path).equals(data_frame)
     else:
         assert False, 'Not supported type'
 
@@ -44,6 +47,7 @@ def test__dataframe_writer__saves_single_dummy_dataframe(tmpdir, dataframe, outp
     "dataframes, output_type", [
         (dataframes_dictionary, {'name': 'csv', 'extension': 'csv'}),
         (dataframes_dictionary, {'name': 'pickle', 'extension': 'pkl'}),
+        (dataframes_dictionary, {'name': 'parquet', 'extension': 'parquet'}),
         pytest.param(dataframes_dictionary, {'name': 'yaml', 'extension': 'yaml'}, marks=pytest.mark.xfail)
     ]
 )
@@ -79,6 +83,11 @@ def test__dataframe_writer__saves_multiple_dummy_dataframes(tmpdir, dataframes,
             pd.read_pickle(file_path).equals(dataframes[dataframe_keys[idx]])
             for idx, file_path in enumerate(file_paths)
         )
+    elif output_type['name'] == 'parquet':
+        assert all(
+            pd.read_parquet(file_path).equals(dataframes[dataframe_keys[idx]])
+            for idx, file_path in enumerate(file_paths)
+        )
     else:
         assert False, 'Not supported type'
 
@@ -87,6 +96,7 @@ def test__dataframe_writer__saves_multiple_dummy_dataframes(tmpdir, dataframes,
     "dataframes, output_type", [
         (dataframes_dictionary, {'name': 'csv', 'extension': 'csv'}),
         (dataframes_dictionary, {'name': 'pickle', 'extension': 'pkl'}),
+        (dataframes_dictionary, {'name': 'parquet', 'extension': 'parquet'}),
         pytest.param(dataframes_dictionary, {'name': 'yaml', 'extension': 'yaml'}, marks=pytest.mark.xfail)
     ]
 )
@@ -114,6 +124,8 @@ def test__dataframe_writer__merge_and_save_multiple_dummy_dataframes(tmpdir, dat
         assert pd.read_csv(file_path).equals(merged)
     elif output_type['name'] == 'pickle':
         assert pd.read_pickle(file_path).equals(merged)
+    elif output_type['name'] == 'parquet':
+        assert pd.read_parquet(file_path).equals(merged)
     else:
         assert False, 'Not supported type'
 
@@ -136,3 +148,13 @@ def test__dataframe_writer__merges_dataframes_correctly(tmpdir, dataframes):
     merged = pd.concat(merged, ignore_index=True)
 
     assert merged.equals(output_dataframe)
+
+
+@pytest.mark.parametrize("compression", ['snappy', 'zstd', 'none'])
+def test__dataframe_writer__appends_to_compressed_parquet_file(tmpdir, compression):
+    file_writer = FileWriter(tmpdir, output_type='parquet', compression=compression)
+    file_writer.save_file(data=dataframes_dictionary['first'], name='dummy_data', append=True)
+    file_path = file_writer.save_file(data=dataframes_dictionary['second'], name='dummy_data', append=True)
+
+    expected = pd.concat([dataframes_dictionary['first'], dataframes_dictionary['second']], ignore_index=True)
+    assert pd.read_parquet(file_path).equals(expected)
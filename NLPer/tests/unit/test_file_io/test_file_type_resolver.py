@@ -0,0 +1,24 @@
+import os
+import pandas as pd
+import pytest
+
+from nlper.file_io.file_type_resolver import FileTypesResolver
+
+
+data_frame = pd.DataFrame({'text': ['a b', 'c d'], 'summary': ['a', 'c'], 'site': ['first', 'second']})
+
+
+@pytest.mark.parametrize(
+    "extension, save", [
+        ('csv', lambda dataframe, path: dataframe.to_csv(path, index=False)),
+        ('parquet', lambda dataframe, path: dataframe.to_parquet(path, index=False)),
+    ]
+)
+def test__file_type_resolver__reads_selected_columns(tmpdir, extension, save):
+    file_path = os.path.join(tmpdir, 'dummy_data.' + extension)
+    save(data_frame, file_path)
+
+    reader = FileTypesResolver.resolve_from_filepath(file_path)
+
+    assert reader.open_file(filepath=file_path).equals(data_frame)
+    assert reader.open_file(filepath=file_path, columns=['text', 'summary']).equals(data_frame[['text', 'summary']])
@@ -0,0 +1,66 @@
+import os
+import pandas as pd
+import pytest
+import torch
+
+from nlper.model.model import Model
+from nlper.trainer.data_loader import DataLoader
+from nlper.utils.lang_utils import VocabConfig
+
+
+def create_model(tmpdir, mixed_precision):
+    for split in ('train', 'val', 'test'):
+        pd.DataFrame({
+            'text': [f'ala ma kota numer {i % 5} <num>' for i in range(24)],
+            'summary': [f'kot {i % 3}' for i in range(24)],
+        }).to_csv(os.path.join(tmpdir, f'{split}.csv'), index=False)
+    config = {
+        'train_test_val_dir': str(tmpdir),
+        'min_frequency_of_words_in_vocab': 1,
+        'dataframes_field_names': ['text', 'summary'],
+        'batch_size': 8,
+        'embed_size': 8,
+        'hidden_size': 8,
+        'learning_rate': 0.01,
+        'grad_clip': 1.0,
+        'scheduler_step_size': 10,
+        'scheduler_gamma': 0.5,
+        'mixed_precision': mixed_precision,
+    }
+    iterators, vocab = DataLoader(config=config).load()
+    torch.manual_seed(0)
+    model = Model(config=dict(config, text_size=len(vocab)), vocab_config=VocabConfig(vocab.stoi, vocab.itos))
+    model.create_optimizers_and_loss()
+    model.show_rouge_and_attention_matrix = lambda *args: None
+    return model, iterators
+
+
+def record_classifier_dtypes(model):
+    dtypes = set()
+    model.decoder.classifier.register_forward_hook(lambda module, inputs, output: dtypes.add(output.dtype))
+    return dtypes
+
+
+@pytest.mark.parametrize("mixed_precision, dtype", [(True, torch.bfloat16), (False, torch.float32)])
+def test__model__trains_and_evaluates_under_autocast_with_float32_weights_and_loss(tmpdir, mixed_precision, dtype):
+    model, iterators = create_model(tmpdir, mixed_precision)
+    dtypes = record_classifier_dtypes(model)
+
+    train_loss = model.train(iterators[0])
+    valid_loss = model.evaluate(iterators[1])
+
+    assert dtypes == {dtype}
+    assert all(loss.dtype == torch.float32 and torch.isfinite(loss) for loss in train_loss + valid_loss)
+    assert all(parameter.dtype == torch.float32 for parameter in model.seq2seq.parameters())
+    assert all(state['exp_avg'].dtype == torch.float32 for state in model.optimizer.state.values())
+
+
+def test__model__predicts_under_autocast(tmpdir):
+    model, _ = create_model(tmpdir, mixed_precision=True)
+    dtypes = record_classifier_dtypes(model)
+
+    summary, attention = model.predict('<sos> ala ma kota numer 1 <num> <eos>', length_of_original_text=1.0)
+
+    assert dtypes == {torch.bfloat16}
+    assert summary.startswith('<sos>') and summary.endswith('<eos>')
+    assert attention.dtype == torch.float32
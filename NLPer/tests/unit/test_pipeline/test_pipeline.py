@@ -0,0 +1,57 @@
+import os
+import pandas as pd
+import yaml
+
+from nlper.dataframe_cleaner.application import Application as CleanerApplication
+from nlper.pipeline.application import Application
+from nlper.utils.train_test_splitter import TrainTestSplitter
+from tests.unit.test_dataframe_cleaner.test_application import write_config as write_cleaner_config
+
+
+def write_yaml(path, config):
+    with open(path, 'w') as config_file:
+        yaml.safe_dump(config, config_file)
+    return path
+
+
+def write_configs(tmpdir, save_intermediate):
+    clean_config = write_cleaner_config(tmpdir)
+    split_config = write_yaml(os.path.join(tmpdir, 'split.yaml'), {
+        'input_file': os.path.join(tmpdir, 'output', 'cleaned_data.csv'),
+        'output_dir': os.path.join(tmpdir, 'split'),
+    })
+    return write_yaml(os.path.join(tmpdir, 'pipeline.yaml'), {
+        'clean_config': clean_config,
+        'split_config': split_config,
+        'train_config': os.path.join(tmpdir, 'train.yaml'),
+        'save_intermediate': save_intermediate,
+    })
+
+
+def test__application__passes_the_same_parts_as_saved_files(tmpdir):
+    CleanerApplication(write_cleaner_config(tmpdir)).run()
+    write_configs(tmpdir, save_intermediate=False)
+    TrainTestSplitter(config=os.path.join(tmpdir, 'split.yaml')).run()
+    expected = {
+        split: pd.read_csv(os.path.join(tmpdir, 'split', 'cleaned_data', f'{split}.csv'))
+        for split in ('train', 'test', 'val')
+    }
+    for name in os.listdir(tmpdir / 'output'):
+        os.remove(tmpdir / 'output' / name)
+
+    application = Application(write_configs(tmpdir, save_intermediate=False))
+    parts = application.split_data(application.clean_data())
+
+    assert os.listdir(tmpdir / 'output') == []
+    assert parts.keys() == expected.keys()
+    for split, dataframe in expected.items():
+        assert parts[split].equals(dataframe.fillna(''))
+
+
+def test__application__saves_intermediate_outputs(tmpdir):
+    application = Application(write_configs(tmpdir, save_intermediate=True))
+    parts = application.split_data(application.clean_data())
+
+    assert os.listdir(tmpdir / 'output') == ['cleaned_data.csv']
+    assert sorted(os.listdir(tmpdir / 'split' / 'cleaned_data')) == ['test.csv', 'train.csv', 'val.csv']
+    assert len(pd.read_csv(tmpdir / 'split' / 'cleaned_data' / 'train.csv')) == len(parts['train'])
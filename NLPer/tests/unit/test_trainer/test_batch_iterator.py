@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from nlper.trainer.batch_iterator import BatchIterator
+from nlper.trainer.batch_iterator import TokenBudgetBatchIterator
+from nlper.trainer.dataset import NumericalizedDataset
+from nlper.trainer.vocab import Vocab
+
+
+vocab = Vocab.from_counter({f'w{i}': 1 for i in range(20)}, min_frequency=1)
+texts = [' '.join(f'w{j}' for j in range(i % 7 + 1)) for i in range(50)]
+summaries = [' '.join(f'w{j}' for j in range(i % 3 + 1)) for i in range(50)]
+dataset = NumericalizedDataset(text=vocab.numericalize(texts), summary=vocab.numericalize(summaries))
+
+
+@pytest.mark.parametrize("shuffle", [True, False])
+def test__batch_iterator__batches_all_examples_once(shuffle):
+    iterator = BatchIterator(dataset, vocab=vocab, batch_size=8, shuffle=shuffle)
+
+    batches = iterator.create_batches()
+
+    assert len(batches) == len(iterator) == 7
+    assert sorted(np.concatenate(batches).tolist()) == list(range(50))
+
+
+def test__batch_iterator__pads_sequences_as_torchtext_fields():
+    iterator = BatchIterator(dataset, vocab=vocab, batch_size=3)
+
+    batch = iterator.create_batch(np.array([0, 1, 2]))
+    text, lengths = batch.text
+
+    assert text.shape == (5, 3)
+    assert lengths.tolist() == [3, 4, 5]
+    assert text[:, 0].tolist() == [vocab.start_index, vocab.stoi['w0'], vocab.end_index] + [vocab.padding_index] * 2
+    assert text[:, 2].tolist() == [vocab.start_index, vocab.stoi['w0'], vocab.stoi['w1'], vocab.stoi['w2'],
+                                   vocab.end_index]
+    assert batch.summary[0].shape == (5, 3)
+
+
+def test__batch_iterator__sorts_examples_by_length_without_shuffle():
+    batches = BatchIterator(dataset, vocab=vocab, batch_size=8).create_batches()
+
+    lengths = dataset.text_lengths[np.concatenate(batches)]
+    assert (np.diff(lengths) >= 0).all()
+
+
+def test__batch_iterator__keeps_number_of_batches_during_epoch():
+    iterator = BatchIterator(dataset, vocab=vocab, batch_size=8, shuffle=True)
+
+    batches = [len(iterator) for _ in iterator]
+
+    assert batches == [7] * 7
+
+
+@pytest.mark.parametrize("shuffle", [True, False])
+def test__token_budget_batch_iterator__batches_all_examples_within_budget(shuffle):
+    iterator = TokenBudgetBatchIterator(dataset, vocab=vocab, max_tokens=60, shuffle=shuffle)
+    text_lengths, summary_lengths = iterator.get_sequence_lengths()
+
+    batches = iterator.create_batches()
+
+    assert sorted(np.concatenate(batches).tolist()) == list(range(50))
+    for examples in batches:
+        assert len(examples) * (text_lengths[examples].max() + summary_lengths[examples].max()) <= 60
+
+
+def test__token_budget_batch_iterator__puts_example_above_budget_in_own_batch():
+    iterator = TokenBudgetBatchIterator(dataset, vocab=vocab, max_tokens=5)
+
+    batches = iterator.create_batches()
+
+    assert [len(examples) for examples in batches] == [1] * 50
+    assert len(iterator) == 50
+
+
+def test__token_budget_batch_iterator__reduces_padding():
+    fixed = BatchIterator(dataset, vocab=vocab, batch_size=8, shuffle=True)
+    budget = TokenBudgetBatchIterator(dataset, vocab=vocab, max_tokens=80, shuffle=True)
+
+    fixed_padding, _ = fixed.measure_padding(fixed.create_batches())
+    budget_padding, _ = budget.measure_padding(budget.create_batches())
+
+    assert budget_padding < fixed_padding
@@ -0,0 +1,115 @@
+import os
+import pandas as pd
+import pytest
+
+from nlper.trainer import data_loader
+from nlper.trainer.data_loader import DataLoader
+
+
+def write_splits(tmpdir, rows=40):
+    for split in ('train', 'val', 'test'):
+        pd.DataFrame({
+            'text': [f'ala ma kota numer {i % 5} <num>' for i in range(rows)],
+            'summary': [f'kot {i % 3}' for i in range(rows)],
+        }).to_csv(os.path.join(tmpdir, f'{split}.csv'), index=False)
+
+
+def create_config(tmpdir, **values):
+    config = {
+        'train_test_val_dir': str(tmpdir),
+        'min_frequency_of_words_in_vocab': 2,
+        'dataframes_field_names': ['text', 'summary'],
+        'batch_size': 8,
+        'dataset_cache_path': os.path.join(tmpdir, 'cache'),
+    }
+    config.update(values)
+    return config
+
+
+def read_batches(iterator):
+    return [(batch.text[0].tolist(), batch.summary[0].tolist()) for batch in iterator]
+
+
+def test__data_loader__loads_cached_datasets_without_reading_files(tmpdir, monkeypatch):
+    write_splits(tmpdir)
+    iterators, vocab = DataLoader(config=create_config(tmpdir)).load()
+
+    monkeypatch.setattr(data_loader.pd, 'read_csv', pytest.fail)
+    cached_iterators, cached_vocab = DataLoader(config=create_config(tmpdir)).load()
+
+    assert cached_vocab.itos == vocab.itos
+    assert read_batches(cached_iterators[1]) == read_batches(iterators[1])
+    assert len(os.listdir(tmpdir / 'cache')) == 1
+
+
+@pytest.mark.parametrize("values", [{'min_frequency_of_words_in_vocab': 100}, {}])
+def test__data_loader__builds_datasets_again_for_changed_data_or_config(tmpdir, values):
+    write_splits(tmpdir)
+    DataLoader(config=create_config(tmpdir)).load()
+    if not values:
+        write_splits(tmpdir, rows=41)
+
+    iterators, vocab = DataLoader(config=create_config(tmpdir, **values)).load()
+
+    assert len(os.listdir(tmpdir / 'cache')) == 1
+    assert len(iterators[0].dataset) == (40 if values else 41)
+    assert len(vocab) == (5 if values else 14)
+
+
+def test__data_loader__loads_the_same_datasets_from_dataframes(tmpdir):
+    write_splits(tmpdir)
+    dataframes = {split: pd.read_csv(os.path.join(tmpdir, f'{split}.csv')) for split in ('train', 'val', 'test')}
+
+    iterators, vocab = DataLoader(config=create_config(tmpdir)).load()
+    dataframe_iterators, dataframe_vocab = DataLoader(config=create_config(tmpdir), dataframes=dataframes).load()
+
+    assert dataframe_vocab.itos == vocab.itos
+    assert read_batches(dataframe_iterators[2]) == read_batches(iterators[2])
+
+
+def test__data_loader__packs_and_prefetches_batches_with_config(tmpdir):
+    write_splits(tmpdir)
+
+    iterators, _ = DataLoader(config=create_config(tmpdir)).load()
+    packed_iterators, _ = DataLoader(config=create_config(tmpdir, max_tokens_per_batch=80, prefetch_batches=2)).load()
+
+    batches = read_batches(packed_iterators[1])
+
+    assert len(packed_iterators[1]) == len(batches) == 7
+    assert len(iterators[1]) == 5
+    assert sum(len(text[0]) for text, _ in batches) == 40
+    assert all(len(text[0]) * (len(text) + len(summary)) <= 80 for text, summary in batches)
+
+
+def test__data_loader__reads_parts_saved_in_shards(tmpdir):
+    write_splits(tmpdir, rows=30)
+    for split in ('train', 'val', 'test'):
+        dataframe = pd.read_csv(os.path.join(tmpdir, f'{split}.csv'))
+        for shard in (0, 1, 2):
+            dataframe[shard * 10:(shard + 1) * 10].to_csv(os.path.join(tmpdir, f'{split}_{shard}.csv'), index=False)
+    sharded_dir = os.path.join(tmpdir, 'sharded')
+    os.makedirs(sharded_dir)
+    for name in os.listdir(tmpdir):
+        if '_' in name:
+            os.replace(os.path.join(tmpdir, name), os.path.join(sharded_dir, name))
+
+    iterators, vocab = DataLoader(config=create_config(tmpdir)).load()
+    sharded_iterators, sharded_vocab = DataLoader(config=create_config(sharded_dir, dataset_cache_path=None)).load()
+
+    assert sharded_vocab.itos == vocab.itos
+    assert read_batches(sharded_iterators[2]) == read_batches(iterators[2])
+
+
+def test__data_loader__streams_train_part(tmpdir):
+    write_splits(tmpdir)
+
+    iterators, vocab = DataLoader(config=create_config(tmpdir)).load()
+    streaming_iterators, streaming_vocab = DataLoader(config=create_config(
+        tmpdir, streaming=True, shuffle_buffer_size=5, prefetch_batches=2)).load()
+    cached_iterators, cached_vocab = DataLoader(config=create_config(tmpdir, streaming=True)).load()
+
+    assert streaming_vocab.itos == cached_vocab.itos == vocab.itos
+    assert len(os.listdir(tmpdir / 'cache')) == 1
+    assert sorted(map(str, read_batches(iterators[1]))) == sorted(map(str, read_batches(cached_iterators[1])))
+    texts = sorted(text for batch in streaming_iterators[0] for text in batch.text[0].t().tolist())
+    assert texts == sorted(text for batch in iterators[0] for text in batch.text[0].t().tolist())
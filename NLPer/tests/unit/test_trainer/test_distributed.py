@@ -0,0 +1,55 @@
+import numpy as np
+import os
+import torch
+
+from torch import nn
+from torch.nn.parallel import DistributedDataParallel
+
+from nlper.trainer.batch_iterator import BatchIterator
+from nlper.trainer.dataset import NumericalizedDataset
+from nlper.trainer.distributed import launch
+from nlper.trainer.vocab import Vocab
+from nlper.utils.torch_utils import get_rank
+from nlper.utils.torch_utils import get_world_size
+from nlper.utils.torch_utils import main_process_first
+
+
+vocab = Vocab.from_counter({f'w{i}': 1 for i in range(20)}, min_frequency=1)
+texts = [' '.join(f'w{j}' for j in range(i % 7 + 1)) for i in range(50)]
+dataset = NumericalizedDataset(text=vocab.numericalize(texts), summary=vocab.numericalize(texts))
+
+
+def run_step(directory):
+    rank = get_rank()
+    model = nn.Linear(3, 1)
+    distributed_model = DistributedDataParallel(model)
+    distributed_model(torch.full((4, 3), rank + 1.0)).sum().backward()
+    iterator = BatchIterator(dataset, vocab=vocab, batch_size=8, shuffle=True, rank=rank, world_size=get_world_size())
+    with main_process_first():
+        files = os.listdir(directory)
+        torch.save({'weight': model.weight.data, 'grad': model.weight.grad, 'files': files,
+                    'batches': [examples.tolist() for examples in iterator.plan_batches()]},
+                   os.path.join(directory, f'{rank}.pt'))
+
+
+def test__batch_iterator__takes_batches_of_process():
+    iterators = [BatchIterator(dataset, vocab=vocab, batch_size=8, rank=rank, world_size=3) for rank in range(3)]
+
+    batches = [iterator.plan_batches() for iterator in iterators]
+
+    assert [len(iterator) for iterator in iterators] == [2, 2, 2]
+    assert sorted(np.concatenate([np.concatenate(process) for process in batches]).tolist()) == \
+        sorted(np.concatenate(BatchIterator(dataset, vocab=vocab, batch_size=8).create_batches()[:6]).tolist())
+
+
+def test__launch__trains_data_parallel_processes_with_batches_of_every_process(tmpdir):
+    launch(run_step, args=(str(tmpdir),), nproc=2)
+
+    first, second = (torch.load(os.path.join(tmpdir, f'{rank}.pt')) for rank in range(2))
+
+    assert torch.equal(first['weight'], second['weight'])
+    assert torch.equal(first['grad'], second['grad'])
+    assert torch.allclose(first['grad'], torch.full((1, 3), 6.0))
+    assert first['files'] == [] and second['files'] == ['0.pt']
+    assert len(first['batches']) == len(second['batches']) == 3
+    assert not set(sum(first['batches'], [])) & set(sum(second['batches'], []))
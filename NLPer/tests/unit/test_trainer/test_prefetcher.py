@@ -0,0 +1,47 @@
+import pytest
+import threading
+import torch
+
+from nlper.trainer.batch_iterator import Batch
+from nlper.trainer.prefetcher import PrefetchIterator
+
+
+def create_batches(n_batches):
+    return [Batch(text=(torch.full((3, 2), i), torch.tensor([3, 3])), summary=(torch.full((2, 2), i), None))
+            for i in range(n_batches)]
+
+
+def failing_batches():
+    yield from create_batches(2)
+    raise ValueError('broken batch')
+
+
+@pytest.mark.parametrize("n_batches", [1, 3])
+def test__prefetch_iterator__yields_batches_in_order(n_batches):
+    batches = create_batches(10)
+    iterator = PrefetchIterator(batches, n_batches=n_batches)
+
+    prefetched = [batch.text[0][0, 0].item() for batch in iterator]
+
+    assert prefetched == list(range(10))
+    assert len(iterator) == 10
+
+
+def test__prefetch_iterator__raises_error_of_wrapped_iterator():
+    prefetched = []
+
+    with pytest.raises(ValueError, match='broken batch'):
+        for batch in PrefetchIterator(failing_batches(), n_batches=1):
+            prefetched.append(batch)
+
+    assert len(prefetched) == 2
+
+
+def test__prefetch_iterator__stops_thread_when_iteration_is_abandoned():
+    threads = threading.active_count()
+    batches = iter(PrefetchIterator(create_batches(10), n_batches=1))
+
+    next(batches)
+    batches.close()
+
+    assert threading.active_count() == threads
@@ -0,0 +1,80 @@
+import numpy as np
+import os
+import pandas as pd
+import pytest
+
+from nlper.trainer import streaming_dataset
+from nlper.trainer.batch_iterator import BatchIterator
+from nlper.trainer.streaming_dataset import StreamingBatchIterator
+from nlper.trainer.streaming_dataset import StreamingDataset
+from nlper.trainer.vocab import Vocab
+
+
+vocab = Vocab.from_counter({f'w{i}': 1 for i in range(20)}, min_frequency=1)
+
+
+def write_shards(tmpdir, rows=30, n_shards=3):
+    paths = []
+    for shard in range(n_shards):
+        dataframe = pd.DataFrame({
+            'text': [' '.join(f'w{j}' for j in range(i % 7 + 1)) + f' n{shard * rows + i}' for i in range(rows)],
+            'summary': [f'w{i % 3}' if i % 5 else '' for i in range(rows)],
+        })
+        path = os.path.join(tmpdir, f'train_{shard}.' + ('parquet' if shard % 2 else 'csv'))
+        if shard % 2:
+            dataframe.to_parquet(path)
+        else:
+            dataframe.to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+
+def read_texts(examples):
+    return sorted(' '.join(map(str, text.tolist())) + '|' + ' '.join(map(str, summary.tolist()))
+                  for text, summary in examples)
+
+
+@pytest.mark.parametrize("shuffle_buffer_size", [1, 7, 1000])
+def test__streaming_dataset__yields_all_examples_once(tmpdir, monkeypatch, shuffle_buffer_size):
+    monkeypatch.setattr(streaming_dataset, 'CHUNK_ROWS', 4)
+    paths = write_shards(tmpdir)
+    dataset = StreamingDataset(paths, columns=['text', 'summary'], vocab=vocab)
+    shuffled = StreamingDataset(paths, columns=['text', 'summary'], vocab=vocab, shuffle=True,
+                                shuffle_buffer_size=shuffle_buffer_size)
+
+    examples = list(dataset)
+
+    assert len(examples) == 90
+    assert read_texts(shuffled) == read_texts(examples)
+    assert examples[0][0].tolist() == [vocab.stoi['w0'], 0]
+    assert examples[0][1].tolist() == []
+
+
+def test__streaming_batch_iterator__batches_pools_of_examples(tmpdir):
+    dataset = StreamingDataset(write_shards(tmpdir), columns=['text', 'summary'], vocab=vocab, shuffle=True)
+    iterator = StreamingBatchIterator(
+        dataset, create_iterator=lambda pool: BatchIterator(pool, vocab=vocab, batch_size=4, shuffle=True),
+        pool_size=20)
+
+    batches = list(iterator)
+
+    assert [len(batch.text[1]) for batch in batches].count(4) == 22
+    assert sum(len(batch.text[1]) for batch in batches) == 90
+    with pytest.raises(TypeError):
+        len(iterator)
+
+
+def test__streaming_batch_iterator__has_the_same_examples_as_dataset(tmpdir):
+    dataset = StreamingDataset(write_shards(tmpdir), columns=['text', 'summary'], vocab=vocab, shuffle=True)
+    iterator = StreamingBatchIterator(
+        dataset, create_iterator=lambda pool: BatchIterator(pool, vocab=vocab, batch_size=8), pool_size=16)
+
+    examples = []
+    for batch in iterator:
+        (text, text_lengths), (summary, summary_lengths) = batch
+        for column in range(text.shape[1]):
+            examples.append((text[1:text_lengths[column] - 1, column].numpy(),
+                             summary[1:summary_lengths[column] - 1, column].numpy()))
+
+    assert read_texts(examples) == read_texts(dataset)
+    assert all(isinstance(text, np.ndarray) for text, _ in examples)
@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from collections import Counter
+
+from nlper.trainer import vocab as vocab_module
+from nlper.trainer.vocab import count_words
+from nlper.trainer.vocab import SPECIALS
+from nlper.trainer.vocab import Vocab
+
+
+def build_torchtext_itos(counter, min_frequency):
+    # the algorithm of torchtext 0.5 Vocab, with specials added by Field.build_vocab
+    counter = counter.copy()
+    itos = list(SPECIALS)
+    for token in SPECIALS:
+        del counter[token]
+    words_and_frequencies = sorted(counter.items(), key=lambda item: item[0])
+    words_and_frequencies.sort(key=lambda item: item[1], reverse=True)
+    for word, frequency in words_and_frequencies:
+        if frequency < max(min_frequency, 1):
+            break
+        itos.append(word)
+    return itos
+
+
+texts = [
+    'ala ma kota <num> kot ma ale',
+    'kot ma <num> lat ala ma psa',
+    'źdźbło żaba ala ala Ala zebra',
+]
+
+
+@pytest.mark.parametrize("min_frequency", [0, 1, 2, 3])
+def test__vocab__has_the_same_order_as_torchtext(min_frequency):
+    counter = count_words(texts)
+
+    vocab = Vocab.from_counter(counter, min_frequency=min_frequency)
+
+    assert vocab.itos == build_torchtext_itos(counter, min_frequency)
+    assert vocab.itos[:2] == ['<unk>', '<pad>']
+    assert vocab.stoi == {word: index for index, word in enumerate(vocab.itos)}
+
+
+def test__vocab__numericalizes_texts_with_unknown_words():
+    vocab = Vocab.from_counter(Counter({'ala': 3, 'kot': 2}), min_frequency=1)
+
+    indices, offsets = vocab.numericalize(['ala ma kota', '', 'kot  ala'])
+
+    assert indices.dtype == np.int32
+    assert indices.tolist() == [vocab.stoi['ala'], 0, 0, vocab.stoi['kot'], vocab.stoi['ala']]
+    assert offsets.tolist() == [0, 3, 3, 5]
+    assert 'ma' not in vocab.stoi
+
+
+edge_case_texts = ['  ala  ma\tkota ', '', ' ', 'kot\nma ale', 'żółw\u3000ma <num> lat', 'ala'] * 7
+
+
+@pytest.mark.parametrize("n_workers", [1, 3])
+def test__vocab__bulk_counting_and_numericalization_match_python(monkeypatch, n_workers):
+    monkeypatch.setattr(vocab_module, 'TEXTS_PER_CHUNK', 4)
+    counter = count_words(edge_case_texts, n_workers=n_workers)
+    vocab = Vocab.from_counter(counter, min_frequency=7)
+    indices, offsets = vocab.numericalize(edge_case_texts, n_workers=n_workers)
+
+    monkeypatch.setattr(vocab_module, 'pa', None)
+    assert counter == count_words(edge_case_texts)
+    python_indices, python_offsets = vocab.numericalize(edge_case_texts)
+    assert indices.dtype == python_indices.dtype
+    assert indices.tolist() == python_indices.tolist()
+    assert offsets.tolist() == python_offsets.tolist()
+
+
+def test__vocab__counts_words_of_concatenated_series():
+    series = pd.concat([pd.Series(texts[:2]), pd.Series(texts[2:])], ignore_index=True)
+
+    counter = count_words(series)
+
+    assert counter == count_words(texts)
+    assert Vocab.from_counter(counter, 1).numericalize(series)[1].tolist()[-1] == sum(map(len, map(str.split, texts)))
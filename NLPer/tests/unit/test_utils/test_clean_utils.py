@@ -0,0 +1,87 @@
+import pandas as pd
+import pytest
+
+from bs4 import BeautifulSoup
+
+from nlper.utils.clean_utils import CleanUtils
+
+
+hide_numbers_cases = [
+    ('22', ' <num> '),
+    ('11:45', ' <num> '),
+    ('99.99', ' <num> '),
+    ('596,789', ' <num> '),
+    ('6;15', ' <num> '),
+    ('29/12/2010', ' <num> '),
+    ('10\\02\\2000', ' <num> '),
+    ('15.V.2030', ' <num> '),
+    ('29/XII/1990', ' <num> '),
+    ('22---22-2222', ' <num> '),
+    ('22......22.2000', ' <num> '),
+    ('01.01.2000 12:15', ' <num> <num> '),
+    ('Rok 2020,  ok\n1a2', 'Rok <num> ok <num> a <num> '),
+]
+
+non_text_characters_cases = [
+    ('Ala\tma\nkota', 'Ala ma kota'),
+    ('tekst {usuń} i [to też] koniec', 'tekst i koniec'),
+    ('a--b__c~~d++e...f::g/h', 'a b c d e f g h'),
+    ('„Cytat” — (nawias) & 100% #tag @user!', 'Cytat  nawias  100 tag user'),
+    ('Czy tak? Tak!', 'Czy tak. Tak'),
+    ('jeden _ dwa . trzy\xa0 cztery', 'jeden _ dwa . trzy cztery'),
+    ('{a} x {b}', ''),
+]
+
+html_cases = [
+    ('  zwykły tekst  ', 'zwykły tekst'),
+    ('<p>sample text</p>', 'sample text'),
+    ('<p class="lead">Ala</p> <b>ma</b>\n<i>kota</i>', 'Alamakota'),
+    ('Fish &amp; chips &#65;&#x42;&nbsp;', 'Fish & chips AB'),
+    ('R&D <br/>dział', 'R&Ddział'),
+    ('&foo; nieznana encja', '&foo nieznana encja'),
+    ('<!-- komentarz -->tekst', 'tekst'),
+    ('<script>var a = "<b>";</script>tekst', 'tekst'),
+    ('<a href="x>y">link</a>', 'link'),
+    ('2 < 3 > 1', '2 < 3 > 1'),
+]
+
+
+@pytest.mark.parametrize("text, expected", html_cases)
+def test__clean_utils__remove_html_elements(text, expected):
+    assert CleanUtils.remove_hmtl_elements(text) == expected
+
+
+@pytest.mark.parametrize("text, _", html_cases)
+def test__clean_utils__remove_html_elements_matches_beautiful_soup(text, _):
+    assert CleanUtils.remove_hmtl_elements(text) == BeautifulSoup(text, features="html.parser").get_text(strip=True)
+
+
+@pytest.mark.parametrize("text, expected", hide_numbers_cases)
+def test__clean_utils__hide_numbers(text, expected):
+    assert CleanUtils.hide_numbers(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", non_text_characters_cases)
+def test__clean_utils__remove_non_text_characters(text, expected):
+    assert CleanUtils.remove_non_text_characters(text) == expected
+
+
+def test__clean_utils__series_paths_match_single_text_functions():
+    texts = [text for text, _ in hide_numbers_cases + non_text_characters_cases] + [None, 1.5]
+    series = pd.Series(texts, index=range(10, 10 + len(texts)), dtype=object)
+
+    hidden = CleanUtils.hide_numbers_for_series(series)
+    removed = CleanUtils.remove_non_text_characters_for_series(series)
+
+    assert hidden.index.equals(series.index)
+    assert hidden.tolist() == [CleanUtils.hide_numbers(text) for text in texts]
+    assert removed.tolist() == [CleanUtils.remove_non_text_characters(text) for text in texts]
+
+
+def test__clean_utils__remove_characters_for_series_matches_single_text_function():
+    texts = ['<p>Ala &amp; kot</p> -- {x}', 'zwykły tekst? tak!', '']
+    series = pd.Series(texts)
+
+    assert CleanUtils.remove_characters_for_series(series).tolist() == [
+        CleanUtils.remove_characters_for_text(text) for text in texts
+    ]
@@ -0,0 +1,16 @@
+from nlper.utils.hash_utils import hash_config
+from nlper.utils.hash_utils import hash_text
+
+
+def test__hash_utils__hash_text_is_stable():
+    assert hash_text('{"url": "a"}') == hash_text('{"url": "a"}')
+    assert hash_text('{"url": "a"}') != hash_text('{"url": "b"}')
+
+
+def test__hash_utils__hash_config_ignores_keys_order_and_skipped_keys():
+    config = {'lemmatize': True, 'n_workers': 2, 'columns_to_skip': ['url']}
+    reordered = {'columns_to_skip': ['url'], 'n_workers': 8, 'lemmatize': True}
+
+    assert hash_config(config, skip_keys=('n_workers',)) == hash_config(reordered, skip_keys=('n_workers',))
+    assert hash_config(config) != hash_config(reordered)
+    assert hash_config(config) != hash_config(dict(config, lemmatize=False))
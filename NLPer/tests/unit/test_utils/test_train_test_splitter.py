@@ -0,0 +1,80 @@
+import os
+import pandas as pd
+import pytest
+import yaml
+
+from nlper.utils.train_test_splitter import TrainTestSplitter
+
+
+data = pd.DataFrame({
+    'text': [f'tekst artykułu numer {i}' for i in range(1000)],
+    'summary': [f'tytuł {i}' for i in range(1000)],
+    'site': ['first', 'second'] * 500,
+})
+
+
+def write_config(tmpdir, input_file, **values):
+    config = {'input_file': input_file, 'output_dir': os.path.join(tmpdir, 'split'), 'chunk_size': 128}
+    config.update(values)
+    config_path = os.path.join(tmpdir, 'config.yaml')
+    with open(config_path, 'w') as config_file:
+        yaml.safe_dump(config, config_file)
+    return config_path
+
+
+def read_parts(tmpdir, name='data'):
+    path = os.path.join(tmpdir, 'split', name)
+    return {file_name: pd.read_csv(os.path.join(path, file_name)) for file_name in sorted(os.listdir(path))}
+
+
+@pytest.mark.parametrize("extension", ['csv', 'parquet', 'csv.gz'])
+def test__train_test_splitter__splits_all_rows_in_proportions(tmpdir, extension):
+    input_file = os.path.join(tmpdir, 'data.' + extension)
+    data.to_parquet(input_file) if extension == 'parquet' else data.to_csv(input_file, index=False)
+
+    TrainTestSplitter(config=write_config(tmpdir, input_file)).run()
+    parts = read_parts(tmpdir)
+
+    assert list(parts.keys()) == ['test.csv', 'train.csv', 'val.csv']
+    merged = pd.concat(parts.values(), ignore_index=True)
+    assert sorted(merged['text'].tolist()) == sorted(data['text'].tolist())
+    assert merged.columns.tolist() == ['text', 'summary']
+    assert 750 < len(parts['train.csv']) < 850
+    assert 50 < len(parts['val.csv']) < 150
+
+
+def test__train_test_splitter__split_does_not_depend_on_order_and_chunks(tmpdir):
+    input_file = os.path.join(tmpdir, 'data.csv')
+    data.to_csv(input_file, index=False)
+    TrainTestSplitter(config=write_config(tmpdir, input_file)).run()
+    expected = read_parts(tmpdir)
+
+    data.iloc[::-1].to_csv(input_file, index=False)
+    TrainTestSplitter(config=write_config(tmpdir, input_file, chunk_size=7)).run()
+    parts = read_parts(tmpdir)
+
+    for name, part in expected.items():
+        assert sorted(parts[name]['text'].tolist()) == sorted(part['text'].tolist())
+
+
+def test__train_test_splitter__saves_shards_of_parts(tmpdir):
+    input_file = os.path.join(tmpdir, 'data.csv')
+    data.to_csv(input_file, index=False)
+
+    TrainTestSplitter(config=write_config(tmpdir, input_file, shards=3), valid=False).run()
+    parts = read_parts(tmpdir)
+
+    assert list(parts.keys()) == [f'{split}_{shard}.csv' for split in ('test', 'train') for shard in range(3)]
+    assert sum(len(part) for part in parts.values()) == len(data)
+    assert all(len(part) for part in parts.values())
+
+
+def test__train_test_splitter__splits_differently_with_other_seed(tmpdir):
+    input_file = os.path.join(tmpdir, 'data.csv')
+    data.to_csv(input_file, index=False)
+    TrainTestSplitter(config=write_config(tmpdir, input_file)).run()
+    expected = read_parts(tmpdir)
+
+    TrainTestSplitter(config=write_config(tmpdir, input_file, split_seed=1)).run()
+
+    assert read_parts(tmpdir)['train.csv']['text'].tolist() != expected['train.csv']['text'].tolist()